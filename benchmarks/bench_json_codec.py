@@ -0,0 +1,113 @@
+"""
+Benchmark of the JSON codec on large MCP configurations and registry payloads.
+
+Compares decoding and indented encoding with every available backend of
+create_sparc_py.core.json_codec against the standard library json module:
+
+    python benchmarks/bench_json_codec.py [--servers N] [--templates N] [--repeat N]
+
+The default registry listing is about 20 MB, the size of our internal
+catalogue.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from create_sparc_py.core import json_codec  # noqa: E402
+
+
+def make_mcp_config(servers: int) -> Dict[str, Any]:
+    """Build an mcp.json with the given number of servers."""
+    return {
+        "mcpServers": {
+            f"server-{i}": {
+                "command": "npx",
+                "args": ["-y", f"@example/mcp-server-{i}", "--port", str(3000 + i), "--token", "${env:MCP_TOKEN}"],
+                "env": {"MCP_TOKEN": "${env:MCP_TOKEN}", "LOG_LEVEL": "info"},
+                "alwaysAllow": ["read", "list"],
+                "disabled": i % 7 == 0,
+                "timeout": 30.5,
+            }
+            for i in range(servers)
+        }
+    }
+
+
+def make_registry_listing(templates: int) -> Dict[str, Any]:
+    """Build a registry template listing with the given number of entries."""
+    return {
+        "templates": [
+            {
+                "name": f"template-{i}",
+                "version": f"1.{i % 50}.{i % 7}",
+                "description": "Scaffold for a SPARC project with tests, docs and MCP integration. " * 2,
+                "tags": ["python", "sparc", "mcp", f"tag-{i % 100}"],
+                "downloads": i * 37,
+                "rating": round((i % 50) / 10, 1),
+                "files": [{"path": f"src/module_{j}.py", "size": 1024 + j, "sha256": "ab" * 32} for j in range(5)],
+            }
+            for i in range(templates)
+        ],
+        "total": templates,
+    }
+
+
+def best_time(func: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest of repeat runs of func, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(payloads: Dict[str, Any], repeat: int) -> List[str]:
+    """Time decoding and encoding of each payload with each backend."""
+    lines = [f"{'payload':<18}{'size':>10}  {'backend':<9}{'loads ms':>10}{'dumps ms':>10}"]
+    for name, payload in payloads.items():
+        text = json.dumps(payload, indent=2)
+        data = text.encode("utf-8")
+        lines.append(
+            f"{name:<18}{len(data) / 1e6:>8.1f}MB  {'stdlib':<9}"
+            f"{best_time(lambda: json.loads(data), repeat):>10.1f}"
+            f"{best_time(lambda: json.dumps(payload, indent=2), repeat):>10.1f}"
+        )
+        for backend in json_codec.available_backends():
+            json_codec.use_backend(backend)
+            if json_codec.dumps(payload, indent=2) != text:
+                raise AssertionError(f"{backend} output differs from json.dumps for {name}")
+            lines.append(
+                f"{'':<28}{backend:<9}"
+                f"{best_time(lambda: json_codec.loads(data), repeat):>10.1f}"
+                f"{best_time(lambda: json_codec.dumps(payload, indent=2), repeat):>10.1f}"
+            )
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--servers", type=int, default=5000, help="Servers in the mcp.json payload")
+    parser.add_argument("--templates", type=int, default=20000, help="Entries in the registry payload")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the fastest is reported")
+    args = parser.parse_args()
+    payloads = {
+        "mcp.json": make_mcp_config(args.servers),
+        "registry listing": make_registry_listing(args.templates),
+    }
+    print("\n".join(run(payloads, args.repeat)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Startup benchmark of the create-sparc-py CLI.
+
+Times ``create-sparc-py --help`` and ``create-sparc-py --version`` in fresh
+interpreters and fails if either takes longer than a bare interpreter by
+more than the threshold, so that eager imports creeping back into the CLI's
+startup path are caught:
+
+    python benchmarks/bench_startup.py [--runs N] [--threshold-ms MS]
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+COMMANDS = {
+    "--help": ["-m", "create_sparc_py", "--help"],
+    "--version": ["-m", "create_sparc_py", "--version"],
+}
+
+
+def median_ms(args: List[str], runs: int, env: dict) -> float:
+    """Return the median wall time of running the interpreter with args, in milliseconds."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], env=env, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Runs per command; the median is reported")
+    parser.add_argument(
+        "--threshold-ms",
+        type=float,
+        default=150.0,
+        help="Maximum time over a bare interpreter before the benchmark fails",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        # Keep the benchmark from reading or creating the user's configuration
+        env = dict(os.environ, HOME=home, PYTHONPATH=str(ROOT))
+        baseline = median_ms(["-c", "pass"], args.runs, env)
+        print(f"{'python -c pass':<28}{baseline:>8.1f} ms")
+        failed = False
+        for name, command in COMMANDS.items():
+            elapsed = median_ms(command, args.runs, env)
+            overhead = elapsed - baseline
+            status = "ok" if overhead <= args.threshold_ms else "SLOW"
+            failed = failed or status != "ok"
+            print(f"{'create-sparc-py ' + name:<28}{elapsed:>8.1f} ms  (+{overhead:.1f} ms)  {status}")
+    if failed:
+        print(f"Startup is more than {args.threshold_ms:.0f} ms over a bare interpreter", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,16 @@ __version__ = "0.1.0"
 
 # Re-export main functions for easier imports
 from create_sparc_py.cli import run
-from create_sparc_py.core.project_generator import project_generator, ProjectGenerator
+from create_sparc_py.utils.lazy_exports import lazy_exports
+
+# Imported on first use, so that the CLI starts without loading the generator
+lazy_exports(
+    __name__,
+    {
+        "project_generator": ("create_sparc_py.core.project_generator", "project_generator"),
+        "ProjectGenerator": ("create_sparc_py.core.project_generator", "ProjectGenerator"),
+    },
+)
 
 # These will be uncommented once these modules are implemented
 # from create_sparc_py.core.project_generator import create_project, add_component
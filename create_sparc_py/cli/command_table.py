@@ -0,0 +1,259 @@
+"""
+Declarative table of the create-sparc-py commands.
+
+Each command is described by its name, its one-line help, the name of its
+handler in ``create_sparc_py.cli.commands`` and its arguments, given as the
+positional and keyword arguments of ``ArgumentParser.add_argument``. The
+parser is built from this table without importing any command module; a
+command's module is imported only when that command runs.
+
+Arguments may also name what shell completion offers for their values
+(see create_sparc_py.cli.completion).
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import argparse
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+# Values shell completion can offer for an argument
+COMPLETE_COMMANDS = "commands"
+COMPLETE_DIRECTORIES = "directories"
+COMPLETE_FILES = "files"
+COMPLETE_TEMPLATES = "templates"
+
+
+# argparse actions whose options take no value
+FLAG_ACTIONS = frozenset({"store_true", "store_false", "store_const", "append_const", "count", "help", "version"})
+
+
+class Argument(NamedTuple):
+    """An argument of a command."""
+
+    flags: Tuple[str, ...]
+    options: Dict[str, Any]
+    complete: Optional[str] = None
+
+    @property
+    def takes_value(self) -> bool:
+        """Whether the argument is an option followed by a value."""
+        return self.flags[0].startswith("-") and self.options.get("action") not in FLAG_ACTIONS
+
+
+class Command(NamedTuple):
+    """A CLI command."""
+
+    name: str
+    help: str
+    handler: str
+    arguments: Tuple[Argument, ...] = ()
+
+
+def _arg(*flags: str, complete: Optional[str] = None, **options: Any) -> Argument:
+    return Argument(flags, options, complete)
+
+
+def _subcommands(dest: str, examples: str) -> Argument:
+    """Argument collecting the rest of the command line for a command with its own subcommands."""
+    return _arg(dest, nargs=argparse.REMAINDER, help=f"Arguments for the {examples}")
+
+
+COMMANDS: Tuple[Command, ...] = (
+    Command(
+        "init",
+        "Initialize a new project using a template",
+        "init_command",
+        (
+            _arg("name", help="Name of the project to create"),
+            _arg(
+                "-t",
+                "--template",
+                default="default",
+                complete=COMPLETE_TEMPLATES,
+                help="Template to use (default: 'default')",
+            ),
+            _arg(
+                "-d",
+                "--directory",
+                complete=COMPLETE_DIRECTORIES,
+                help="Directory to create the project in (default: <name>)",
+            ),
+            _arg(
+                "--resume",
+                action="store_true",
+                help="Resume an interrupted generation, rendering only missing or changed files",
+            ),
+        ),
+    ),
+    Command(
+        "add",
+        "Add a component to an existing project",
+        "add_command",
+        (
+            _arg("component", nargs="?", help="Type of component to add (e.g., module, service, api)"),
+            _arg("name", nargs="?", help="Name of the component (default: the component type)"),
+            _arg(
+                "-d",
+                "--directory",
+                complete=COMPLETE_DIRECTORIES,
+                help="Directory to add the component's module to, relative to the project root "
+                "(default: the project's package directory)",
+            ),
+            _arg(
+                "-p",
+                "--project",
+                complete=COMPLETE_DIRECTORIES,
+                help="Directory in the project to add the component to (default: the current directory)",
+            ),
+            _arg("--list", action="store_true", help="List the components, modules and tests in the project"),
+        ),
+    ),
+    Command(
+        "help",
+        "Show help for a command",
+        "help_command",
+        (
+            _arg("command", nargs="?", complete=COMPLETE_COMMANDS, help="Command to show help for"),
+            _arg("-s", "--search", nargs="+", metavar="TERM", help="Search the help pages for the given terms"),
+        ),
+    ),
+    Command(
+        "wizard",
+        "Run the project creation wizard",
+        "wizard_command",
+        (_subcommands("wizard_args", "wizard subcommands (e.g., list, add, audit-security, etc.)"),),
+    ),
+    Command(
+        "configure-mcp",
+        "Configure Multi-Cloud Provider settings",
+        "configure_mcp_command",
+        (_subcommands("mcp_args", "configure-mcp subcommands (e.g., add, remove, update, list, etc.)"),),
+    ),
+    Command(
+        "aigi",
+        "AI-Guided Implementation commands",
+        "aigi_command",
+        (_subcommands("aigi_args", "aigi subcommands (e.g., init, etc.)"),),
+    ),
+    Command(
+        "minimal",
+        "Create a minimal Roo mode framework",
+        "minimal_command",
+        (
+            _arg("name", help="Name of the minimal Roo project to create"),
+            _arg(
+                "-d",
+                "--directory",
+                complete=COMPLETE_DIRECTORIES,
+                help="Directory to create the project in (default: <name>)",
+            ),
+        ),
+    ),
+    Command(
+        "registry",
+        "Registry client commands",
+        "registry_command",
+        (_subcommands("registry_args", "registry subcommands (e.g., list, get, post, auth, etc.)"),),
+    ),
+    Command(
+        "fleet",
+        "Refresh every generated project under a directory",
+        "fleet_command",
+        (_subcommands("fleet_args", "fleet subcommands (e.g., refresh)"),),
+    ),
+    Command(
+        "status",
+        "Show how generated projects differ from their lockfile",
+        "status_command",
+        (
+            _arg(
+                "paths",
+                nargs="*",
+                complete=COMPLETE_DIRECTORIES,
+                help="Generated project directories (default: current directory)",
+            ),
+        ),
+    ),
+    Command(
+        "upgrade",
+        "Upgrade a project to its template's current version",
+        "upgrade_command",
+        (
+            _arg(
+                "path",
+                nargs="?",
+                complete=COMPLETE_DIRECTORIES,
+                help="Generated project directory (default: current directory)",
+            ),
+            _arg("--dry-run", action="store_true", help="Show what would change without writing any files"),
+        ),
+    ),
+    Command(
+        "wheelhouse",
+        "Manage the local wheelhouse for offline installs",
+        "wheelhouse_command",
+        (_subcommands("wheelhouse_args", "wheelhouse subcommands (e.g., sync, list)"),),
+    ),
+    Command(
+        "config",
+        "Read and change configuration settings",
+        "config_command",
+        (_subcommands("config_args", "config subcommands (e.g., set, get, list)"),),
+    ),
+    Command(
+        "run-script",
+        "Run a file of commands in one process",
+        "run_script_command",
+        (
+            _arg(
+                "file",
+                nargs="?",
+                default="-",
+                complete=COMPLETE_FILES,
+                help="File of commands, one per line (default: standard input)",
+            ),
+            _arg("-k", "--keep-going", action="store_true", help="Run the remaining commands after one fails"),
+        ),
+    ),
+    Command(
+        "completion",
+        "Print a shell completion script",
+        "completion_command",
+        (_arg("shell", choices=["bash", "zsh", "fish"], help="Shell to print the completion script for"),),
+    ),
+)
+
+# Options of the CLI itself, given before the command
+OPTIONS: Tuple[Argument, ...] = (
+    _arg("-v", "--verbose", action="store_true", help="Enable verbose output"),
+    _arg("--debug", action="store_true", help="Enable debug output"),
+    _arg(
+        "-c",
+        "--config",
+        action="append",
+        dest="config_overrides",
+        metavar="KEY=VALUE",
+        help="Override a configuration setting for this run (e.g. -c ai_settings.model=gpt-4o)",
+    ),
+    _arg(
+        "--output",
+        choices=["text", "json"],
+        help="Output format: text (default) or json, one JSON record per line on standard output",
+    ),
+    _arg("--version", action="version", version="%(prog)s 0.1.0"),
+)
+
+
+__all__ = [
+    "Argument",
+    "Command",
+    "COMMANDS",
+    "OPTIONS",
+    "COMPLETE_COMMANDS",
+    "COMPLETE_DIRECTORIES",
+    "COMPLETE_FILES",
+    "COMPLETE_TEMPLATES",
+    "FLAG_ACTIONS",
+]
@@ -2,20 +2,16 @@
 Command implementations for the create-sparc-py CLI.
 
 This package contains the implementation of each command available
-in the create-sparc-py CLI.
+in the create-sparc-py CLI. Each command's handler is exported here and
+imported from its module on first use, so running one command does not
+import the others.
 
 This project is a Python port of the original create-sparc Node.js tool created by
 Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
 https://github.com/ruvnet/rUv-dev.
 """
 
-from .add_command import run as add_command
-from .init_command import run as init_command
-from .help_command import run as help_command
-from .wizard_command import run as wizard_command
-from .configure_mcp_command import run as configure_mcp_command
-from .aigi_command import run as aigi_command
-from .minimal_command import run as minimal_command
+from create_sparc_py.utils.lazy_exports import lazy_exports
 
 __all__ = [
     "add_command",
@@ -25,4 +21,15 @@ __all__ = [
     "configure_mcp_command",
     "aigi_command",
     "minimal_command",
+    "registry_command",
+    "fleet_command",
+    "config_command",
+    "status_command",
+    "upgrade_command",
+    "wheelhouse_command",
+    "completion_command",
+    "run_script_command",
 ]
+
+# Each handler is the run function of the module of the same name
+lazy_exports(__name__, {name: (f"{__name__}.{name}", "run") for name in __all__})
@@ -1,76 +1,67 @@
-import typer
-from ...core.project_generator import ProjectGenerator
-from ...core.config_manager import ConfigManager
-from ...utils import Logger
-
-logger = Logger()
-
-
-def add_command(app: typer.Typer):
-    @app.command("add")
-    def add(
-        component: str = typer.Argument(..., help="Component type"),
-        name: str = typer.Option(None, "-n", "--name", help="Component name"),
-        type_: str = typer.Option("component", "-t", "--type", help="Component type"),
-        path: str = typer.Option(None, "-p", "--path", help="Custom path for component"),
+"""
+'add' command implementation for create-sparc-py.
+
+This module provides the implementation of the 'add' command, which adds a
+component to an existing SPARC project or lists what a project contains.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import os
+from typing import Any, Dict
+
+from create_sparc_py.utils import logger, output
+from create_sparc_py.core.config_manager import config_manager
+from create_sparc_py.core.project_generator import project_generator
+
+
+def _print_listing(project_config: Dict[str, Any]) -> None:
+    """Print the components, modules and tests recorded in the project index."""
+    listing = project_generator.list_components(project_config["project_root"])
+    if output.emit(
+        "components",
+        project=project_config["project_name"],
+        project_root=project_config["project_root"],
+        component_types=project_generator.list_component_types(),
+        **listing,
     ):
-        try:
-            # Validate component type
-            if not component:
-                logger.error("Component type is required")
-                typer.echo("See --help for usage information.")
-                raise typer.Exit(1)
-
-            # Find project configuration
-            config_manager = ConfigManager()
-            project_config = config_manager.find_project_config()
-            if not project_config:
-                logger.error("Not in a SPARC project directory")
-                logger.info(
-                    "Run this command from within a SPARC project or use the init command to create a new project."
-                )
-                raise typer.Exit(1)
-
-            logger.info(f"Adding {component} to project")
-
-            # Create component configuration
-            component_config = {
-                "name": name or component,
-                "type": type_,
-                "path": path,
-                "project_config": project_config,
-            }
-
-            # Add component to project
-            project_generator = ProjectGenerator()
-            project_generator.add_component(component_config)
-
-            logger.success(f"Component {component_config['name']} added successfully!")
-        except Exception as error:
-            logger.error(f"Failed to add component: {str(error)}")
-            import os
-
-            if os.getenv("DEBUG"):
-                import traceback
-
-                traceback.print_exc()
-            raise typer.Exit(1)
-
-
-def run(args):
+        return
+    components = listing["components"]
+    print(f"Project: {project_config['project_name']} ({project_config['project_root']})")
+    if components:
+        print("Components:")
+        for name in sorted(components):
+            component = components[name]
+            print(f"  {name} ({component['type']}): {', '.join(component['files'])}")
+    else:
+        print("Components: none")
+    print(f"Modules: {len(listing['modules'])}")
+    for path in listing["modules"]:
+        print(f"  {path}")
+    print(f"Tests: {len(listing['tests'])}")
+    for path in listing["tests"]:
+        print(f"  {path}")
+    print(f"Available component types: {', '.join(project_generator.list_component_types())}")
+
+
+def run(args: Any) -> int:
+    """
+    Run the 'add' command.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        Exit code (0 for success, non-zero for failure)
+    """
     try:
         component = getattr(args, "component", None)
         name = getattr(args, "name", None)
-        type_ = getattr(args, "type", "component")
         path = getattr(args, "directory", None)
 
-        if not component:
-            logger.error("Component type is required")
-            print("See --help for usage information.")
-            return 1
-
-        config_manager = ConfigManager()
-        project_config = config_manager.find_project_config()
+        project_config = config_manager.find_project_config(getattr(args, "project", None))
         if not project_config:
             logger.error("Not in a SPARC project directory")
             logger.info(
@@ -78,24 +69,33 @@ def run(args):
             )
             return 1
 
+        if getattr(args, "list", False):
+            _print_listing(project_config)
+            return 0
+
+        if not component:
+            logger.error("Component type is required")
+            print("See --help for usage information.")
+            return 1
+
         logger.info(f"Adding {component} to project")
 
         component_config = {
             "name": name or component,
-            "type": type_,
+            "type": component,
             "path": path,
             "project_config": project_config,
         }
 
-        project_generator = ProjectGenerator()
-        project_generator.add_component(component_config)
+        result = project_generator.add_component(component_config)
+        output.emit("component", name=result["name"], component_type=result["type"], files=result["files"])
+        for file in result["files"]:
+            logger.info(f"Created {file}")
 
-        logger.success(f"Component {component_config['name']} added successfully!")
+        logger.success(f"Component {result['name']} added successfully!")
         return 0
     except Exception as error:
         logger.error(f"Failed to add component: {str(error)}")
-        import os
-
         if os.getenv("DEBUG"):
             import traceback
 
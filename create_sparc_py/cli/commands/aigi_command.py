@@ -5,6 +5,8 @@ AIGI command: AI-Guided Implementation (stub)
 import argparse
 from typing import Any, Dict, Optional
 
+from create_sparc_py.utils import output
+
 
 # Stub configuration for AI provider
 class AIGIConfig:
@@ -38,8 +40,10 @@ def run(args: Any) -> int:
     config = AIGIConfig(provider="openai", api_key="sk-xxxx", model="gpt-4")
     provider = AIGIProvider(config)
     prompt = getattr(args, "prompt", "")
+    generated_code = provider.generate_code(prompt)
+    if output.emit("aigi", provider=config.provider, model=config.model, prompt=prompt, code=generated_code):
+        return 0
     print(f"[AIGI] Using provider: {config.provider}, model: {config.model}")
     print(f"[AIGI] Prompt: {prompt}")
-    generated_code = provider.generate_code(prompt)
     print("[AIGI] Generated code:\n" + generated_code)
     return 0
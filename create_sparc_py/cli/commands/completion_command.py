@@ -0,0 +1,38 @@
+"""
+'completion' command implementation for create-sparc-py.
+
+This module provides the implementation of the 'completion' command, which
+prints a static shell completion script for bash, zsh or fish.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import argparse
+
+from create_sparc_py.utils import logger, output
+from create_sparc_py.cli.completion import completion_script
+from create_sparc_py.core.template_manager import template_manager, template_names_cache
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Run the 'completion' command.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        Exit code (0 for success, 1 for an unsupported shell)
+    """
+    try:
+        script = completion_script(args.shell, template_names_cache())
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    # Listing the templates writes the names the script completes
+    template_manager.list_templates()
+    if not output.emit("completion", shell=args.shell, script=script):
+        print(script, end="")
+    return 0
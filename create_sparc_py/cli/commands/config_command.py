@@ -0,0 +1,89 @@
+"""
+'config' command implementation for create-sparc-py.
+
+This module provides the implementation of the 'config' command, which
+reads and changes the user's configuration settings.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import argparse
+import json
+from typing import Any, List
+
+from create_sparc_py.utils import logger, output
+from create_sparc_py.core.config_layers import get_path, parse_assignments
+from create_sparc_py.core.config_manager import config_manager
+
+_MISSING = object()
+
+
+def _format(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _set(assignments: List[str]) -> int:
+    """Apply KEY=VALUE assignments to the user's configuration in one write."""
+    try:
+        updates = [(item.partition("=")[0].strip(), parse_assignments([item])) for item in assignments]
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    with config_manager.transaction():
+        for _, update in updates:
+            config_manager.merge(update)
+    for key, update in updates:
+        source = config_manager.get_source(key)
+        output.emit("setting", key=key, value=get_path(update, key), source=source)
+        logger.success(f"Set {key} = {_format(get_path(update, key))}")
+        if source not in ("user", "default"):
+            logger.warning(f"{key} is overridden by the {source} configuration layer")
+    return 0
+
+
+def run(args: Any) -> int:
+    """
+    Run the 'config' command.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        Exit code (0 for success, 1 on an invalid assignment or unknown key).
+    """
+    parser = argparse.ArgumentParser(
+        prog="create-sparc-py config",
+        description="Read and change configuration settings (set, get, list)",
+    )
+    subparsers = parser.add_subparsers(dest="subcommand", required=True)
+
+    parser_set = subparsers.add_parser("set", help="Set one or more settings in the user's config.json")
+    parser_set.add_argument("assignments", nargs="+", metavar="KEY=VALUE", help="Dotted key and JSON or plain value")
+
+    parser_get = subparsers.add_parser("get", help="Print the effective value of a setting")
+    parser_get.add_argument("key", help="Dotted key, e.g. ai_settings.model")
+
+    subparsers.add_parser("list", help="List every effective setting with the layer it comes from")
+
+    parsed = parser.parse_args(getattr(args, "config_args", []))
+
+    if parsed.subcommand == "set":
+        return _set(parsed.assignments)
+
+    if parsed.subcommand == "get":
+        value = get_path(config_manager.get_all(), parsed.key, _MISSING)
+        if value is _MISSING:
+            logger.error(f"Unknown setting: {parsed.key}")
+            return 1
+        if not output.emit("setting", key=parsed.key, value=value, source=config_manager.get_source(parsed.key)):
+            print(_format(value))
+        return 0
+
+    config = config_manager.get_all()
+    for key, source in sorted(config_manager.get_provenance().items()):
+        value = get_path(config, key)
+        if not output.emit("setting", key=key, value=value, source=source):
+            print(f"{key} = {_format(value)}  ({source})")
+    return 0
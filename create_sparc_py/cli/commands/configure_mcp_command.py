@@ -5,6 +5,8 @@ Stub implementation for the configure-mcp command.
 import argparse
 from typing import Any, Dict
 
+from create_sparc_py.utils import output
+
 
 def run(args: Dict[str, Any]) -> int:
     """
@@ -16,5 +18,6 @@ def run(args: Dict[str, Any]) -> int:
     Returns:
         Exit code (0 for success, non-zero for failure).
     """
-    print("Configure-mcp command executed with args:", args)
+    if not output.emit("configure_mcp", args=getattr(args, "mcp_args", [])):
+        print("Configure-mcp command executed with args:", args)
     return 0
@@ -0,0 +1,63 @@
+"""
+'fleet' command implementation for create-sparc-py.
+
+This module provides the implementation of the 'fleet' command, which
+operates on every generated project under a directory.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import argparse
+from typing import Any
+
+from create_sparc_py.utils import logger, output
+from create_sparc_py.core.fleet import refresh_fleet
+
+
+def run(args: Any) -> int:
+    """
+    Run the 'fleet' command.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        Exit code (0 for success, 1 if any project failed or has conflicts).
+    """
+    parser = argparse.ArgumentParser(
+        prog="create-sparc-py fleet",
+        description="Operate on every generated project under a directory (refresh)",
+    )
+    subparsers = parser.add_subparsers(dest="subcommand", required=True)
+
+    parser_refresh = subparsers.add_parser("refresh", help="Upgrade every project whose template has changed")
+    parser_refresh.add_argument("root", nargs="?", default=".", help="Directory to search (default: .)")
+    parser_refresh.add_argument("-j", "--jobs", type=int, help="Number of worker processes (default: CPU count)")
+    parser_refresh.add_argument("--dry-run", action="store_true", help="Report without writing any files")
+
+    parsed = parser.parse_args(getattr(args, "fleet_args", []))
+    report = refresh_fleet(parsed.root, max_workers=parsed.jobs, dry_run=parsed.dry_run)
+    summary = report["summary"]
+    failed = summary.get("failed") or summary.get("conflict")
+    if output.emit("fleet", root=parsed.root, dry_run=parsed.dry_run, **report):
+        return 1 if failed else 0
+
+    for project in report["projects"]:
+        status = project["status"]
+        if status == "current":
+            logger.debug(f"{project['path']}: current")
+        elif status == "failed":
+            logger.error(f"{project['path']}: {project['error']}")
+        else:
+            actions = ", ".join(f"{count} {action}" for action, count in sorted(project["actions"].items()))
+            versions = f"{project['from_version']} -> {project['to_version']}"
+            report_fn = logger.warning if status == "conflict" else logger.info
+            report_fn(f"{project['path']}: {project['template']} {versions}: {actions}")
+
+    total = sum(summary.values())
+    counts = ", ".join(f"{summary[status]} {status}" for status in sorted(summary))
+    prefix = "Would refresh" if parsed.dry_run else "Refreshed"
+    logger.info(f"{prefix} {total} projects under {parsed.root}: {counts or 'none found'}")
+    return 1 if failed else 0
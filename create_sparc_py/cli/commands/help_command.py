@@ -4,10 +4,10 @@ Enhanced implementation for the help command.
 
 import argparse
 from typing import Any
-from .help_markdown import get_help_markdown
-from rich.console import Console
-from rich.markdown import Markdown
+from .help_markdown import help_file, print_help_markdown
+from create_sparc_py.cli.command_table import COMMANDS
 from create_sparc_py.cli.parser_factory import create_parser
+from create_sparc_py.utils import output
 
 
 def run(args: Any) -> int:
@@ -20,14 +20,16 @@ def run(args: Any) -> int:
     Returns:
         Exit code (0 for success, non-zero for failure).
     """
+    search = getattr(args, "search", None)
+    if search:
+        return _search(" ".join(search))
     parser = create_parser()
+    if output.is_json():
+        return _emit_help(parser, getattr(args, "command", None))
     if getattr(args, "command", None):
         command = args.command
         # Try to print the markdown help for the command
-        help_md = get_help_markdown(command)
-        if not help_md.startswith("No help available"):
-            console = Console()
-            console.print(Markdown(help_md))
+        if print_help_markdown(command):
             return 0
         # Fallback to argparse help
         subparsers_action = None
@@ -46,3 +48,55 @@ def run(args: Any) -> int:
         # Print the main help (list of commands)
         parser.print_help()
         return 0
+
+
+def _search(query: str) -> int:
+    """
+    Print the help pages matching a query.
+
+    Args:
+        query: Search terms
+
+    Returns:
+        Exit code (0 if any page matched, 1 otherwise).
+    """
+    from .help_search import search_help
+
+    results = search_help(query)
+    if output.is_json():
+        for result in results:
+            output.emit("help_match", **result)
+        return 0 if results else 1
+    if not results:
+        print(f"No help pages match: {query}")
+        return 1
+    width = max(len(result["command"]) for result in results)
+    for result in results:
+        print(f"{result['command']:<{width}}  {result['summary']}")
+    return 0
+
+
+def _emit_help(parser: argparse.ArgumentParser, command: Any) -> int:
+    """
+    Emit help as a structured record: the commands, or one command's markdown page or usage.
+
+    Args:
+        parser: The CLI's argument parser
+        command: Command to show help for, or None for the list of commands
+
+    Returns:
+        Exit code (0 for success, 1 for an unknown command).
+    """
+    if not command:
+        output.emit("commands", commands=[{"name": entry.name, "help": entry.help} for entry in COMMANDS])
+        return 0
+    path = help_file(command)
+    if path is not None:
+        output.emit("help", command=command, markdown=path.read_text())
+        return 0
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction) and command in action.choices:
+            output.emit("help", command=command, usage=action.choices[command].format_help())
+            return 0
+    output.emit("help", command=command, error=f"Unknown command: {command}")
+    return 1
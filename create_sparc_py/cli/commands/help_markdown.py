@@ -1,18 +1,233 @@
+"""
+Markdown help pages of the create-sparc-py commands.
+
+Pages are rendered with rich, whose Markdown support is slow to import and
+to run. Rendered pages are cached on disk per command, terminal width and
+color system, and a cached page is printed without importing rich. An entry
+is invalidated when its page's modification time or size changes.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
 import os
+import sys
 from pathlib import Path
+from typing import Optional, TextIO, Tuple, Union
 
 HELP_DIR = Path(__file__).parent / "help"
 
+# Bumped when the layout of cache entries changes
+CACHE_FORMAT = 1
+
+# Color systems rich picks from the suffix of TERM, as rich.console does
+_TERM_COLORS = {"kitty": "256", "256color": "256", "16color": "standard"}
+
+# Color system of the cache key -> (rich color_system, rich no_color)
+_RICH_COLORS = {
+    "truecolor": ("truecolor", False),
+    "256": ("256", False),
+    "standard": ("standard", False),
+    "nocolor": ("standard", True),
+    "none": (None, False),
+}
+
+
+def help_file(command: str) -> Optional[Path]:
+    """
+    Get the markdown help file of a command.
+
+    Args:
+        command: The CLI command name (e.g., 'init', 'wizard')
+
+    Returns:
+        Path to the help file, or None if the command has none
+    """
+    if not command or Path(command).name != command:
+        return None
+    path = HELP_DIR / f"{command}.md"
+    return path if path.is_file() else None
+
 
 def get_help_markdown(command: str) -> str:
     """
     Load the markdown help file for a given command.
+
     Args:
         command: The CLI command name (e.g., 'init', 'wizard')
+
     Returns:
         The markdown help content as a string, or a default message if not found.
     """
-    help_file = HELP_DIR / f"{command}.md"
-    if help_file.exists():
-        return help_file.read_text()
+    path = help_file(command)
+    if path is not None:
+        return path.read_text()
     return f"No help available for command: {command}"
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the directory rendered help pages are cached in.
+
+    Returns:
+        Path to the help cache directory
+    """
+    return Path.home() / ".create-sparc-py" / "help-cache"
+
+
+def terminal_profile(file: TextIO) -> Optional[Tuple[int, str]]:
+    """
+    Get the width and color system rich would render to a stream with.
+
+    Mirrors rich.console's detection from the environment and the stream.
+    Consoles whose detection needs rich itself (Windows, Jupyter) and
+    streams that cannot encode UTF-8 have no profile.
+
+    Args:
+        file: Stream the help page is printed to
+
+    Returns:
+        (width, color system), or None if rich must detect them itself
+    """
+    if os.name == "nt" or "ipykernel" in sys.modules:
+        return None
+    if not (getattr(file, "encoding", None) or "").lower().startswith("utf"):
+        return None
+    environ = os.environ
+
+    tty_compatible = environ.get("TTY_COMPATIBLE", "")
+    if tty_compatible in ("0", "1"):
+        is_terminal = tty_compatible == "1"
+    elif "FORCE_COLOR" in environ:
+        is_terminal = environ["FORCE_COLOR"] != ""
+    else:
+        try:
+            is_terminal = file.isatty()
+        except (AttributeError, ValueError):
+            is_terminal = False
+    term = environ.get("TERM", "").strip().lower()
+    is_dumb = is_terminal and term in ("dumb", "unknown")
+
+    if not is_terminal or is_dumb:
+        colors = "none"
+    elif environ.get("NO_COLOR", "") != "":
+        colors = "nocolor"
+    elif environ.get("COLORTERM", "").strip().lower() in ("truecolor", "24bit"):
+        colors = "truecolor"
+    else:
+        colors = _TERM_COLORS.get(term.rpartition("-")[2], "standard")
+
+    width = 0
+    if is_dumb:
+        width = 80
+    else:
+        for fd in (0, 1, 2):
+            try:
+                width = os.get_terminal_size(fd).columns
+                break
+            except (AttributeError, ValueError, OSError):
+                continue
+        columns = environ.get("COLUMNS", "")
+        if columns.isdigit():
+            width = int(columns)
+    return width or 80, colors
+
+
+def render_markdown(markdown: str, width: Optional[int] = None, colors: Optional[str] = None) -> str:
+    """
+    Render markdown to text with rich.
+
+    Args:
+        markdown: Markdown to render
+        width: Width to render at; detected by rich if not given
+        colors: Color system of a terminal profile; detected by rich if not given
+
+    Returns:
+        The rendered text, including its ANSI escape sequences
+    """
+    import io
+
+    from rich.console import Console
+    from rich.markdown import Markdown
+
+    options = {}
+    if colors is not None:
+        color_system, no_color = _RICH_COLORS[colors]
+        options = {"color_system": color_system, "no_color": no_color, "force_terminal": color_system is not None}
+    buffer = io.StringIO()
+    Console(file=buffer, width=width, **options).print(Markdown(markdown))
+    return buffer.getvalue()
+
+
+def print_help_markdown(
+    command: str,
+    file: Optional[TextIO] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> bool:
+    """
+    Print the rendered markdown help page of a command.
+
+    Pages are printed from the help cache when an entry for the terminal's
+    width and color system is up to date, and rendered and cached otherwise.
+    The cache is best effort: if it cannot be read or written, the page is
+    rendered as if there were no cache.
+
+    Args:
+        command: The CLI command name (e.g., 'init', 'wizard')
+        file: Stream to print to (default: standard output)
+        cache_dir: Directory of the help cache (default: default_cache_dir())
+
+    Returns:
+        True if the page was printed, False if the command has no help page
+    """
+    path = help_file(command)
+    if path is None:
+        return False
+    file = file or sys.stdout
+    profile = terminal_profile(file)
+    if profile is None:
+        from rich.console import Console
+        from rich.markdown import Markdown
+
+        Console(file=file).print(Markdown(path.read_text()))
+        return True
+
+    width, colors = profile
+    stat = path.stat()
+    header = f"{CACHE_FORMAT} {stat.st_mtime_ns} {stat.st_size}\n"
+    entry = Path(cache_dir or default_cache_dir()) / f"{command}.{width}.{colors}.ansi"
+    try:
+        with open(entry, encoding="utf-8", newline="") as f:
+            if f.readline() == header:
+                file.write(f.read())
+                file.flush()
+                return True
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    rendered = render_markdown(path.read_text(), width, colors)
+    file.write(rendered)
+    file.flush()
+    tmp_path = entry.with_name(f".{entry.name}.{os.getpid()}.tmp")
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(header + rendered)
+        os.replace(tmp_path, entry)
+    except OSError:
+        # A read-only or full home directory only costs the next run a render
+        if tmp_path.exists():
+            os.remove(tmp_path)
+    return True
+
+
+__all__ = [
+    "HELP_DIR",
+    "help_file",
+    "get_help_markdown",
+    "default_cache_dir",
+    "terminal_profile",
+    "render_markdown",
+    "print_help_markdown",
+]
@@ -0,0 +1,210 @@
+"""
+Full-text search over the markdown help pages.
+
+The help pages are indexed into a small inverted index, stored as a single
+marshal file in the help cache. The index is built on first use and rebuilt
+when a page is added, removed or changed, which is detected from the pages'
+directory entries without reading them. A query reads only the index.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import bisect
+import marshal
+import math
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from create_sparc_py.cli.commands import help_markdown
+
+# Bumped when the layout of the index changes
+INDEX_FORMAT = 1
+INDEX_NAME = "search.index"
+
+# Occurrences of a term in a page's headings count this many times over
+HEADING_WEIGHT = 3
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9_.-]*[a-z0-9]|[a-z0-9]")
+
+Stamp = Tuple[Tuple[str, int, int], ...]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index terms.
+
+    Hyphenated and dotted words are indexed whole and by their parts, so
+    that both ``dry-run`` and ``run`` find ``--dry-run``.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        The terms, in order of occurrence
+    """
+    terms = []
+    for word in _WORD.findall(text.lower()):
+        terms.append(word)
+        parts = [part for part in re.split(r"[-_.]", word) if part]
+        if len(parts) > 1:
+            terms.extend(parts)
+    return terms
+
+
+def _summary(markdown: str) -> str:
+    for line in markdown.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            return line
+    return ""
+
+
+def pages_stamp(help_dir: Optional[Path] = None) -> Stamp:
+    """
+    Get the name, modification time and size of every help page.
+
+    Args:
+        help_dir: Directory of the help pages (default: help_markdown.HELP_DIR)
+
+    Returns:
+        Sorted (file name, mtime_ns, size) of each page
+    """
+    stamp = []
+    with os.scandir(help_dir or help_markdown.HELP_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith(".md") and entry.is_file():
+                stat = entry.stat()
+                stamp.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(stamp))
+
+
+def build_index(help_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Build the search index of the help pages.
+
+    Args:
+        help_dir: Directory of the help pages (default: help_markdown.HELP_DIR)
+
+    Returns:
+        The index: the pages' stamp, their commands and summaries, and the
+        postings of each term as (page number, weighted count) pairs
+    """
+    help_dir = Path(help_dir or help_markdown.HELP_DIR)
+    stamp = pages_stamp(help_dir)
+    pages = []
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    for number, (name, _mtime, _size) in enumerate(stamp):
+        markdown = (help_dir / name).read_text(encoding="utf-8")
+        pages.append((name[: -len(".md")], _summary(markdown)))
+        counts: Dict[str, int] = {}
+        for line in markdown.splitlines():
+            weight = HEADING_WEIGHT if line.startswith("#") else 1
+            for term in tokenize(line):
+                counts[term] = counts.get(term, 0) + weight
+        for term, count in counts.items():
+            postings.setdefault(term, []).append((number, count))
+    return {
+        "format": INDEX_FORMAT,
+        "stamp": stamp,
+        "pages": tuple(pages),
+        "terms": tuple(sorted(postings)),
+        "postings": tuple(tuple(postings[term]) for term in sorted(postings)),
+    }
+
+
+def load_index(
+    help_dir: Optional[Path] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> Dict[str, Any]:
+    """
+    Load the search index, building and storing it if it is missing or out of date.
+
+    Args:
+        help_dir: Directory of the help pages (default: help_markdown.HELP_DIR)
+        cache_dir: Directory the index is stored in (default: help_markdown.default_cache_dir())
+
+    Returns:
+        The index, as returned by build_index
+    """
+    stamp = pages_stamp(help_dir)
+    path = Path(cache_dir or help_markdown.default_cache_dir()) / INDEX_NAME
+    try:
+        with open(path, "rb") as f:
+            index = marshal.load(f)
+        if isinstance(index, dict) and index.get("format") == INDEX_FORMAT and index.get("stamp") == stamp:
+            return index
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    index = build_index(help_dir)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            marshal.dump(index, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Without a writable cache every search builds the index again
+        if tmp_path.exists():
+            os.remove(tmp_path)
+    return index
+
+
+def _matches(index: Dict[str, Any], term: str) -> Dict[int, int]:
+    """Weighted counts per page of the index terms starting with term."""
+    terms = index["terms"]
+    matches: Dict[int, int] = {}
+    position = bisect.bisect_left(terms, term)
+    while position < len(terms) and terms[position].startswith(term):
+        for page, count in index["postings"][position]:
+            matches[page] = matches.get(page, 0) + count
+        position += 1
+    return matches
+
+
+def search_help(
+    query: str,
+    help_dir: Optional[Path] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Search the help pages.
+
+    A page matches if it contains every term of the query, where a query
+    term matches any word it is a prefix of. Matches are ranked by tf-idf.
+
+    Args:
+        query: Search terms
+        help_dir: Directory of the help pages (default: help_markdown.HELP_DIR)
+        cache_dir: Directory the index is stored in (default: help_markdown.default_cache_dir())
+
+    Returns:
+        Matching pages, best first, as dicts with command, summary and score
+    """
+    terms = list(dict.fromkeys(_WORD.findall(query.lower())))
+    if not terms:
+        return []
+    index = load_index(help_dir, cache_dir)
+    page_count = len(index["pages"])
+    scores: Optional[Dict[int, float]] = None
+    for term in terms:
+        matches = _matches(index, term)
+        idf = math.log(1 + page_count / (1 + len(matches)))
+        term_scores = {page: (1 + math.log(count)) * idf for page, count in matches.items()}
+        if scores is None:
+            scores = term_scores
+        else:
+            scores = {page: score + term_scores[page] for page, score in scores.items() if page in term_scores}
+    results = [
+        {"command": index["pages"][page][0], "summary": index["pages"][page][1], "score": round(score, 4)}
+        for page, score in (scores or {}).items()
+    ]
+    results.sort(key=lambda result: (-result["score"], result["command"]))
+    return results
+
+
+__all__ = ["tokenize", "pages_stamp", "build_index", "load_index", "search_help"]
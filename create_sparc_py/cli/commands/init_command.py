@@ -13,7 +13,7 @@ import argparse
 import os
 from pathlib import Path
 
-from create_sparc_py.utils import logger
+from create_sparc_py.utils import logger, output
 from create_sparc_py.core.project_generator import project_generator
 
 
@@ -30,13 +30,15 @@ def run(args: argparse.Namespace) -> int:
     name = args.name
     template = args.template
     directory = args.directory
+    resume = getattr(args, "resume", False)
 
     logger.info(f"Initializing new project '{name}' using template '{template}'")
 
     # Use project_generator to generate the project
     success = project_generator.generate_project(
-        project_name=name, template_name=template, output_dir=directory
+        project_name=name, template_name=template, output_dir=directory, resume=resume
     )
+    output.emit("project", name=name, template=template, directory=str(directory or name), created=success)
 
     if success:
         logger.success(f"Project '{name}' initialized successfully")
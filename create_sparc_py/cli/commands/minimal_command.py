@@ -4,7 +4,7 @@ Minimal command implementation for create-sparc-py.
 
 import argparse
 from typing import Any, Dict, Optional
-from create_sparc_py.utils import logger
+from create_sparc_py.utils import logger, output
 from create_sparc_py.core.project_generator import project_generator
 
 
@@ -29,6 +29,7 @@ def run(args: Any) -> int:
         template_name="minimal_roo",
         output_dir=directory,
     )
+    output.emit("project", name=name, template="minimal_roo", directory=str(directory or name), created=success)
     if success:
         logger.success(f"Minimal Roo project '{name}' created successfully.")
         return 0
@@ -1,7 +1,13 @@
 import argparse
-import json
 import sys
+from create_sparc_py.core import json_codec
 from create_sparc_py.core.registry_client import RegistryClient
+from create_sparc_py.utils import output
+
+
+def _print_result(subcommand, path, result):
+    if not output.emit("registry", subcommand=subcommand, path=path, data=result):
+        print(json_codec.dumps(result, indent=2))
 
 
 def registry_command(args):
@@ -34,23 +40,25 @@ def registry_command(args):
 
     if parsed.subcommand == "list":
         result = client.get(f"{parsed.resource}")
-        print(json.dumps(result, indent=2))
+        _print_result("list", parsed.resource, result)
         return 0
     elif parsed.subcommand == "get":
         result = client.get(parsed.path)
-        print(json.dumps(result, indent=2))
+        _print_result("get", parsed.path, result)
         return 0
     elif parsed.subcommand == "post":
         try:
-            data = json.loads(parsed.data_json)
+            data = json_codec.loads(parsed.data_json)
         except Exception as e:
             print(f"Invalid JSON: {e}", file=sys.stderr)
             return 1
         result = client.post(parsed.path, data)
-        print(json.dumps(result, indent=2))
+        _print_result("post", parsed.path, result)
         return 0
     elif parsed.subcommand == "auth":
         ok = client.authenticate({"api_key": parsed.api_key})
+        if output.emit("registry_auth", authenticated=bool(ok)):
+            return 0
         if ok:
             print("Authenticated successfully.")
             return 0
@@ -60,3 +68,7 @@ def registry_command(args):
     else:
         parser.print_help()
         return 1
+
+
+# Entry point under the name every command module uses
+run = registry_command
@@ -0,0 +1,151 @@
+"""
+'run-script' command implementation for create-sparc-py.
+
+This module provides the implementation of the 'run-script' command, which
+runs a file of create-sparc-py commands, one per line, in a single process.
+The commands share the process's parser, configuration and caches, so only
+the first pays for startup. Each command's exit code and duration are
+reported on standard error.
+
+Lines are split like shell words. Blank lines and lines starting with ``#``
+are skipped, and a leading ``create-sparc-py`` or ``create-sparc`` is
+optional, so existing provisioning scripts can be run as they are.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import argparse
+import shlex
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
+
+from create_sparc_py.cli.command_table import OPTIONS
+from create_sparc_py.utils import logger, output
+
+PROGRAM_NAMES = ("create-sparc-py", "create-sparc")
+
+# Global options followed by a value, which is not the command name
+_VALUE_FLAGS = frozenset(flag for option in OPTIONS if option.takes_value for flag in option.flags)
+
+
+def _command_name(words: List[str]) -> Optional[str]:
+    """Name of the command in a command line, skipping the options before it."""
+    words_iter = iter(words)
+    for word in words_iter:
+        if word in _VALUE_FLAGS:
+            next(words_iter, None)
+        elif not word.startswith("-"):
+            return word
+    return None
+
+
+def parse_script(lines: Iterable[str]) -> List[Tuple[int, List[str]]]:
+    """
+    Parse the lines of a script into commands.
+
+    Args:
+        lines: Lines of the script
+
+    Returns:
+        (line number, command arguments without the program name) of each command
+
+    Raises:
+        ValueError: If a line cannot be split or runs another script
+    """
+    commands = []
+    for number, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        try:
+            words = shlex.split(stripped, comments=True)
+        except ValueError as e:
+            raise ValueError(f"Line {number}: {e}") from None
+        if words and words[0] in PROGRAM_NAMES:
+            words = words[1:]
+        if not words:
+            continue
+        if _command_name(words) == "run-script":
+            raise ValueError(f"Line {number}: scripts cannot run other scripts")
+        commands.append((number, words))
+    return commands
+
+
+def run_script(
+    commands: List[Tuple[int, List[str]]],
+    keep_going: bool = False,
+    report: Optional[TextIO] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run commands through the CLI, one after another, in this process.
+
+    Args:
+        commands: Commands, as returned by parse_script
+        keep_going: Run the remaining commands after one fails
+        report: Stream each command's exit code and duration are written to
+                (default: standard error); in the json output format they
+                are emitted as script_command records instead
+
+    Returns:
+        Results of the commands that ran, as dicts with line, command,
+        exit_code and duration_ms
+    """
+    from create_sparc_py.cli import run as run_cli
+
+    report = report or sys.stderr
+    results = []
+    for number, words in commands:
+        command = shlex.join(words)
+        start = time.perf_counter()
+        try:
+            exit_code = run_cli([PROGRAM_NAMES[0], *words])
+        except SystemExit as e:
+            # argparse errors and --help, and commands that exit themselves
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        duration_ms = (time.perf_counter() - start) * 1000
+        result = {"line": number, "command": command, "exit_code": exit_code, "duration_ms": duration_ms}
+        results.append(result)
+        if not output.emit("script_command", **result):
+            print(f"[line {number}] exit {exit_code} in {duration_ms:.1f} ms: {command}", file=report, flush=True)
+        if exit_code != 0 and not keep_going:
+            break
+    return results
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Run the 'run-script' command.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        Exit code (0 if every command succeeded, otherwise the exit code of
+        the first command that failed)
+    """
+    path = getattr(args, "file", None) or "-"
+    try:
+        if path == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            lines = Path(path).read_text(encoding="utf-8").splitlines()
+        commands = parse_script(lines)
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        logger.error(f"{path}: {e}")
+        return 1
+
+    start = time.perf_counter()
+    results = run_script(commands, keep_going=getattr(args, "keep_going", False))
+    failed = [result for result in results if result["exit_code"] != 0]
+    skipped = len(commands) - len(results)
+    duration_ms = (time.perf_counter() - start) * 1000
+    if not output.emit("script", run=len(results), failed=len(failed), skipped=skipped, duration_ms=duration_ms):
+        print(
+            f"{len(results)} commands run, {len(failed)} failed, {skipped} skipped in {duration_ms:.1f} ms",
+            file=sys.stderr,
+        )
+    return failed[0]["exit_code"] if failed else 0
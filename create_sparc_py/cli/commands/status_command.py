@@ -0,0 +1,58 @@
+"""
+'status' command implementation for create-sparc-py.
+
+This module provides the implementation of the 'status' command, which
+reports how generated projects have drifted from the files their template
+produced, as recorded in each project's ``.sparc/lock.json``.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import argparse
+
+from create_sparc_py.utils import logger, output
+from create_sparc_py.core.project_lock import project_status
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Run the 'status' command.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        Exit code (0 for success, non-zero if a project has no usable lockfile)
+    """
+    exit_code = 0
+    for path in getattr(args, "paths", None) or ["."]:
+        try:
+            status = project_status(path)
+        except (OSError, ValueError) as e:
+            logger.error(f"{path}: {e}")
+            exit_code = 1
+            continue
+        if status is None:
+            logger.error(f"{path}: no lockfile; not generated by create-sparc-py")
+            exit_code = 1
+            continue
+        if output.emit("status", path=path, **status):
+            continue
+
+        template = f"{status['template']} {status['version'] or ''}".strip()
+        changed = len(status["modified"]) + len(status["deleted"])
+        if not changed:
+            logger.success(f"{path}: {template}, {status['clean']} files clean")
+            continue
+        logger.warning(
+            f"{path}: {template}, {len(status['modified'])} modified, "
+            f"{len(status['deleted'])} deleted, {status['clean']} clean"
+        )
+        for rel_path in status["modified"]:
+            print(f"  modified: {rel_path}")
+        for rel_path in status["deleted"]:
+            print(f"  deleted:  {rel_path}")
+        logger.debug(f"{path}: hashed {status['hashed']} files")
+    return exit_code
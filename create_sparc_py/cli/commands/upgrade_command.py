@@ -0,0 +1,57 @@
+"""
+'upgrade' command implementation for create-sparc-py.
+
+This module provides the implementation of the 'upgrade' command, which
+applies the current version of a project's template to an existing generated
+project, merging template changes with the user's own.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import argparse
+from collections import Counter
+
+from create_sparc_py.utils import logger, output
+from create_sparc_py.core.project_upgrade import upgrade_project, CONFLICT_SUFFIX
+
+# Actions that leave the project file as it was
+_QUIET_ACTIONS = ("unchanged", "up-to-date")
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Run the 'upgrade' command.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        Exit code (0 for success, 1 on error or if conflicts need resolving)
+    """
+    path = getattr(args, "path", None) or "."
+    dry_run = getattr(args, "dry_run", False)
+    try:
+        result = upgrade_project(path, dry_run=dry_run)
+    except (OSError, ValueError, RuntimeError) as e:
+        logger.error(f"Failed to upgrade {path}: {e}")
+        return 1
+
+    counts = Counter(result["files"].values())
+    if not output.emit("upgrade", path=path, dry_run=dry_run, counts=dict(counts), **result):
+        for rel_path, action in result["files"].items():
+            if action not in _QUIET_ACTIONS:
+                print(f"  {action:<9} {rel_path}")
+        summary = ", ".join(f"{count} {action}" for action, count in sorted(counts.items()))
+        versions = f"{result['from_version']} -> {result['to_version']}"
+        prefix = "Would upgrade" if dry_run else "Upgraded"
+        logger.info(f"{prefix} {path} ({result['template']} {versions}): {summary or 'no files'}")
+    logger.debug(f"Rendered {result['rendered']} of {len(result['files'])} files")
+    if counts["conflict"]:
+        logger.warning(
+            f"{counts['conflict']} files have conflicts; resolve the conflict markers "
+            f"or the '{CONFLICT_SUFFIX}' files"
+        )
+        return 1
+    return 0
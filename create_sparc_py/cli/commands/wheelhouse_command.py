@@ -0,0 +1,98 @@
+"""
+Wheelhouse command implementation for create-sparc-py.
+
+Populates and inspects the local wheelhouse that generated projects install
+their dependencies from offline.
+"""
+
+import argparse
+import os
+from pathlib import Path
+from typing import Any, List
+
+from create_sparc_py.utils import logger, output
+from create_sparc_py.core.config_manager import config_manager
+from create_sparc_py.core.template_manager import template_manager
+from create_sparc_py.core.wheelhouse import Wheelhouse
+
+
+def _template_requirements(template_name: str) -> List[Path]:
+    """
+    Find the requirements files shipped with a template.
+
+    Args:
+        template_name: Name of the template
+
+    Returns:
+        Paths of the template's requirements files
+    """
+    template_dir = Path(template_manager.templates_dir) / template_name
+    if not template_dir.is_dir():
+        raise ValueError(f"Template '{template_name}' not found")
+    found = []
+    for root, _, files in os.walk(template_dir):
+        for name in sorted(files):
+            if name.startswith("requirements") and name.endswith(".txt"):
+                found.append(Path(root) / name)
+    return found
+
+
+def run(args: Any) -> int:
+    """
+    Run the wheelhouse command.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        Exit code (0 for success, non-zero for failure).
+    """
+    parser = argparse.ArgumentParser(
+        prog="create-sparc-py wheelhouse",
+        description="Manage the local wheelhouse used for offline installs (sync, list)",
+    )
+    subparsers = parser.add_subparsers(dest="subcommand", required=True)
+
+    parser_sync = subparsers.add_parser("sync", help="Download wheels for requirements into the wheelhouse")
+    parser_sync.add_argument(
+        "-r", "--requirement", action="append", default=[], help="Requirements file (may be repeated)"
+    )
+    parser_sync.add_argument(
+        "-t", "--template", action="append", default=[], help="Sync the requirements of a template (may be repeated)"
+    )
+
+    parser_list = subparsers.add_parser("list", help="List the wheels in the wheelhouse")
+
+    for subparser in (parser_sync, parser_list):
+        subparser.add_argument("--dir", help="Wheelhouse directory (default: configured wheelhouse_dir)")
+
+    parsed = parser.parse_args(getattr(args, "wheelhouse_args", []))
+    wheelhouse = Wheelhouse(parsed.dir or config_manager.get_wheelhouse_dir())
+
+    if parsed.subcommand == "sync":
+        try:
+            requirements = list(parsed.requirement)
+            for template_name in parsed.template:
+                requirements.extend(_template_requirements(template_name))
+            if not requirements:
+                logger.error("Nothing to sync; pass --requirement FILE or --template NAME")
+                return 1
+            added = wheelhouse.sync(requirements)
+        except (ValueError, RuntimeError) as e:
+            logger.error(str(e))
+            return 1
+        if not output.emit("wheelhouse_sync", path=wheelhouse.path, added=added):
+            logger.success(f"Wheelhouse {wheelhouse.path} synced ({len(added)} new wheels)")
+        return 0
+
+    wheels = wheelhouse.list_wheels()
+    if output.emit("wheelhouse", path=wheelhouse.path, wheels=wheels, resolutions=wheelhouse.status()["resolutions"]):
+        return 0
+    if not wheels:
+        logger.info(f"Wheelhouse {wheelhouse.path} is empty")
+        return 0
+    for wheel in wheels:
+        print(wheel)
+    status = wheelhouse.status()
+    logger.info(f"{status['wheels']} wheels, {status['resolutions']} cached resolutions in {wheelhouse.path}")
+    return 0
@@ -3,30 +3,71 @@ Interactive MCP Configuration Wizard command for create-sparc-py using click.
 Implements listing, adding, and removing MCP servers via CLI prompts.
 """
 
-import json
+import copy
 from pathlib import Path
 from typing import Any, Dict
 import click
+from create_sparc_py.core.json_document import ANY_VERSION, JsonDocument
 from create_sparc_py.core.mcp_wizard_workflow import MCPWizardWorkflow
+from create_sparc_py.utils import logger, output
 import sys
 
-try:
-    from rich import print as rich_print
-    from rich.console import Console
+# rich console, created on first use; False if rich is not installed
+_console = None
+
+
+def _get_console():
+    global _console
+    if _console is None:
+        try:
+            from rich.console import Console
+
+            _console = Console()
+        except ImportError:
+            _console = False
+    return _console or None
+
+
+def _echo(markup, plain):
+    """Print rich markup, or the plain text if rich is not installed."""
+    console = _get_console()
+    if console:
+        console.print(markup)
+    else:
+        click.echo(plain)
+
+
+def _echo_issue(issue):
+    sev = issue.get("severity", "info").capitalize()
+    color = {"critical": "red", "warning": "yellow", "info": "blue"}.get(issue.get("severity", "info"), "white")
+    _echo(
+        f"[{color}]- {sev}: {issue['message']}[/] Recommendation: {issue.get('recommendation', '')}",
+        f"- {sev}: {issue['message']}\n  Recommendation: {issue.get('recommendation', '')}",
+    )
+
+
+def _workflow():
+    cwd = Path.cwd()
+    logger.debug(f"CWD: {cwd}")
+    logger.debug(f"Looking for config at: {cwd / '.roo' / 'mcp.json'}")
+    return MCPWizardWorkflow(project_path=cwd)
+
+
+def _unexpected_error(e):
+    if not output.emit("mcp_error", error=str(e)):
+        _echo(f"[red]Unexpected error:[/red] {e}", f"Unexpected error: {e}")
+    sys.exit(1)
 
-    console = Console()
-except ImportError:
-    rich_print = None
-    console = None
 
 CONFIG_PATH = Path(".roo/mcp.json")
+# Content and version of each config file as last loaded, to merge concurrent saves
+_loaded: Dict[Path, Any] = {}
 
 
 def load_config(config_path=CONFIG_PATH):
-    if config_path.exists():
-        with open(config_path, "r") as f:
-            return json.load(f)
-    return {}
+    config, version = JsonDocument(config_path).read({})
+    _loaded[config_path] = (copy.deepcopy(config), version)
+    return config
 
 
 def save_config(config, config_path=CONFIG_PATH):
@@ -34,13 +75,15 @@ def save_config(config, config_path=CONFIG_PATH):
     to_save = config.copy()
     if not to_save or "mcpServers" not in to_save:
         to_save = {"mcpServers": {}}
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(config_path, "w") as f:
-        json.dump(to_save, f, indent=2)
+    base, version = _loaded.get(config_path, (None, ANY_VERSION))
+    written, version = JsonDocument(config_path).write(to_save, version, base)
+    _loaded[config_path] = (copy.deepcopy(written), version)
 
 
 def list_servers(config):
     servers = config.get("mcpServers", {})
+    if output.emit("mcp_servers", servers=servers):
+        return
     if not servers:
         click.echo("No MCP servers configured.")
         return
@@ -59,7 +102,8 @@ def add_server(config):
         "args": [a.strip() for a in args.split(",") if a.strip()],
         "permissions": [p.strip() for p in permissions.split(",") if p.strip()],
     }
-    click.echo(f"Added/updated server: {server_id}")
+    if not output.emit("mcp_server", action="added", server_id=server_id):
+        click.echo(f"Added/updated server: {server_id}")
 
 
 @click.group()
@@ -109,7 +153,8 @@ def remove(server_id):
     if not servers:
         config.clear()
         config["mcpServers"] = {}
-    click.echo(f"Removed server: {server_id}")
+    if not output.emit("mcp_server", action="removed", server_id=server_id):
+        click.echo(f"Removed server: {server_id}")
     save_config(config)
 
 
@@ -118,166 +163,111 @@ def remove(server_id):
 def audit_security_cmd(auto_fix):
     """Run a security audit on the MCP configuration."""
     try:
-        cwd = Path.cwd()
-        config_path = cwd / ".roo" / "mcp.json"
-        print(f"[DEBUG] CWD: {cwd}")
-        print(f"[DEBUG] Looking for config at: {config_path}")
-        workflow = MCPWizardWorkflow(project_path=cwd)
+        workflow = _workflow()
+        config_path = workflow.mcp_config_path
         result = workflow.audit_security()
         if not result["success"]:
-            msg = f"[red]Error:[/red] {result['error']}" if rich_print else f"Error: {result['error']}"
-            (console.print(msg) if console else click.echo(msg))
+            if not output.emit("mcp_audit", **result):
+                _echo(f"[red]Error:[/red] {result['error']}", f"Error: {result['error']}")
             sys.exit(1)
+        fixes = None
+        if auto_fix and not result["secure"]:
+            # Auto-fix and write config
+            document = JsonDocument(config_path)
+            config, version = document.read()
+            fix_result = workflow.secure_configuration(copy.deepcopy(config))
+            document.write(fix_result["securedConfig"], version, config)
+            fixes = fix_result["appliedFixes"]
+        if output.emit("mcp_audit", applied_fixes=fixes, **result):
+            sys.exit(0)
         if result["secure"]:
-            msg = (
-                "[green]✅ MCP configuration passed security audit.[/green]"
-                if rich_print
-                else "✅ MCP configuration passed security audit."
+            _echo(
+                "[green]✅ MCP configuration passed security audit.[/green]",
+                "✅ MCP configuration passed security audit.",
             )
-            (console.print(msg) if console else click.echo(msg))
         else:
-            msg = (
-                f"[yellow]⚠️ Security issues detected: {len(result['issues'])} issues found[/yellow]"
-                if rich_print
-                else f"⚠️ Security issues detected: {len(result['issues'])} issues found"
+            _echo(
+                f"[yellow]⚠️ Security issues detected: {len(result['issues'])} issues found[/yellow]",
+                f"⚠️ Security issues detected: {len(result['issues'])} issues found",
             )
-            (console.print(msg) if console else click.echo(msg))
             for issue in result["issues"]:
-                sev = issue.get("severity", "info").capitalize()
-                color = {"critical": "red", "warning": "yellow", "info": "blue"}.get(
-                    issue.get("severity", "info"), "white"
-                )
-                if rich_print:
-                    msg = f"[{color}]- {sev}: {issue['message']}[/] Recommendation: {issue.get('recommendation', '')}"
-                else:
-                    msg = f"- {sev}: {issue['message']}\n  Recommendation: {issue.get('recommendation', '')}"
-                (console.print(msg) if console else click.echo(msg))
+                _echo_issue(issue)
             if result.get("recommendations"):
-                (console.print("\n[bold]Recommendations:[/bold]") if console else click.echo("\nRecommendations:"))
+                _echo("\n[bold]Recommendations:[/bold]", "\nRecommendations:")
                 for rec in result["recommendations"]:
                     title = rec.get("title", "")
-                    steps = rec.get("steps", [])
-                    (console.print(f"[bold]{title}[/bold]") if console else click.echo(title))
-                    for step in steps:
-                        (console.print(f"- {step}") if console else click.echo(f"- {step}"))
-            if auto_fix and not result["secure"]:
-                # Auto-fix and write config
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-                fix_result = workflow.secure_configuration(config)
-                with open(config_path, "w") as f:
-                    json.dump(fix_result["securedConfig"], f, indent=2)
-                fixes = fix_result["appliedFixes"]
-                if fixes:
-                    (
-                        console.print(f"\n[green]🔧 Applied Fixes: {len(fixes)}[/green]")
-                        if console
-                        else click.echo(f"\n🔧 Applied Fixes: {len(fixes)}")
-                    )
-                    for fix in fixes:
-                        (console.print(f"- {fix['message']}") if console else click.echo(f"- {fix['message']}"))
-                else:
-                    (
-                        console.print("[yellow]No fixes were applied.[/yellow]")
-                        if console
-                        else click.echo("No fixes were applied.")
-                    )
+                    _echo(f"[bold]{title}[/bold]", title)
+                    for step in rec.get("steps", []):
+                        _echo(f"- {step}", f"- {step}")
+            if fixes:
+                _echo(f"\n[green]🔧 Applied Fixes: {len(fixes)}[/green]", f"\n🔧 Applied Fixes: {len(fixes)}")
+                for fix in fixes:
+                    _echo(f"- {fix['message']}", f"- {fix['message']}")
+            elif fixes is not None:
+                _echo("[yellow]No fixes were applied.[/yellow]", "No fixes were applied.")
         sys.exit(0)
     except Exception as e:
-        msg = f"[red]Unexpected error:[/red] {e}" if rich_print else f"Unexpected error: {e}"
-        (console.print(msg) if console else click.echo(msg))
-        sys.exit(1)
+        _unexpected_error(e)
 
 
 @wizard.command("validate-env")
 def validate_env_cmd():
     """Validate environment variable references in MCP configuration."""
     try:
-        cwd = Path.cwd()
-        config_path = cwd / ".roo" / "mcp.json"
-        print(f"[DEBUG] CWD: {cwd}")
-        print(f"[DEBUG] Looking for config at: {config_path}")
-        workflow = MCPWizardWorkflow(project_path=cwd)
-        result = workflow.validate_env_var_references()
+        result = _workflow().validate_env_var_references()
+        if output.emit("mcp_env", **result):
+            sys.exit(0 if result["success"] else 1)
         if not result["success"]:
-            msg = f"[red]Error:[/red] {result['error']}" if rich_print else f"Error: {result['error']}"
-            (console.print(msg) if console else click.echo(msg))
+            _echo(f"[red]Error:[/red] {result['error']}", f"Error: {result['error']}")
             sys.exit(1)
         if result["valid"]:
-            msg = (
-                "[green]✅ All environment variable references are set.[/green]"
-                if rich_print
-                else "✅ All environment variable references are set."
+            _echo(
+                "[green]✅ All environment variable references are set.[/green]",
+                "✅ All environment variable references are set.",
             )
-            (console.print(msg) if console else click.echo(msg))
         else:
-            msg = (
-                f"[yellow]⚠️ Missing environment variables: {', '.join(result['missingVariables'])}[/yellow]"
-                if rich_print
-                else f"⚠️ Missing environment variables: {', '.join(result['missingVariables'])}"
+            missing = ", ".join(result["missingVariables"])
+            _echo(
+                f"[yellow]⚠️ Missing environment variables: {missing}[/yellow]",
+                f"⚠️ Missing environment variables: {missing}",
             )
-            (console.print(msg) if console else click.echo(msg))
             for ref in result["references"]:
                 if not ref["isSet"]:
-                    msg = (
-                        f"[red]- {ref['name']} (server: {ref['serverId']}) not set[/red]"
-                        if rich_print
-                        else f"- {ref['name']} (server: {ref['serverId']}) not set"
+                    _echo(
+                        f"[red]- {ref['name']} (server: {ref['serverId']}) not set[/red]",
+                        f"- {ref['name']} (server: {ref['serverId']}) not set",
                     )
-                    (console.print(msg) if console else click.echo(msg))
         sys.exit(0)
     except Exception as e:
-        msg = f"[red]Unexpected error:[/red] {e}" if rich_print else f"Unexpected error: {e}"
-        (console.print(msg) if console else click.echo(msg))
-        sys.exit(1)
+        _unexpected_error(e)
 
 
 @wizard.command("validate")
 def validate_cmd():
     """Validate the MCP configuration and print any errors or security issues."""
     try:
-        cwd = Path.cwd()
-        config_path = cwd / ".roo" / "mcp.json"
-        print(f"[DEBUG] CWD: {cwd}")
-        print(f"[DEBUG] Looking for config at: {config_path}")
-        workflow = MCPWizardWorkflow(project_path=cwd)
+        workflow = _workflow()
         result = workflow.validate_configuration()
-        if not result["success"]:
-            msg = f"[red]Error:[/red] {result['errors']}" if rich_print else f"Error: {result['errors']}"
-            (console.print(msg) if console else click.echo(msg))
-        else:
-            if result["errors"]:
-                msg = (
-                    f"[yellow]⚠️ Configuration errors: {len(result['errors'])} issues found[/yellow]"
-                    if rich_print
-                    else f"⚠️ Configuration errors: {len(result['errors'])} issues found"
-                )
-                (console.print(msg) if console else click.echo(msg))
-                for err in result["errors"]:
-                    (console.print(f"- {err}") if console else click.echo(f"- {err}"))
-            else:
-                msg = (
-                    "[green]✅ MCP configuration is valid.[/green]" if rich_print else "✅ MCP configuration is valid."
-                )
-                (console.print(msg) if console else click.echo(msg))
         # Also run security audit for dangerous commands
         audit = workflow.audit_security()
-        if audit["issues"]:
-            for issue in audit["issues"]:
-                sev = issue.get("severity", "info").capitalize()
-                color = {"critical": "red", "warning": "yellow", "info": "blue"}.get(
-                    issue.get("severity", "info"), "white"
-                )
-                if rich_print:
-                    msg = f"[{color}]- {sev}: {issue['message']}[/] Recommendation: {issue.get('recommendation', '')}"
-                else:
-                    msg = f"- {sev}: {issue['message']}\n  Recommendation: {issue.get('recommendation', '')}"
-                (console.print(msg) if console else click.echo(msg))
+        if output.emit("mcp_validation", **result, issues=audit["issues"]):
+            sys.exit(0)
+        if not result["success"]:
+            _echo(f"[red]Error:[/red] {result['errors']}", f"Error: {result['errors']}")
+        elif result["errors"]:
+            _echo(
+                f"[yellow]⚠️ Configuration errors: {len(result['errors'])} issues found[/yellow]",
+                f"⚠️ Configuration errors: {len(result['errors'])} issues found",
+            )
+            for err in result["errors"]:
+                _echo(f"- {err}", f"- {err}")
+        else:
+            _echo("[green]✅ MCP configuration is valid.[/green]", "✅ MCP configuration is valid.")
+        for issue in audit["issues"]:
+            _echo_issue(issue)
         sys.exit(0)
     except Exception as e:
-        msg = f"[red]Unexpected error:[/red] {e}" if rich_print else f"Unexpected error: {e}"
-        (console.print(msg) if console else click.echo(msg))
-        sys.exit(1)
+        _unexpected_error(e)
 
 
 def run(args: Any) -> int:
@@ -0,0 +1,365 @@
+"""
+Shell completion scripts of the create-sparc-py CLI.
+
+The scripts are generated from the command table and are static: completing
+commands, options and their values never starts Python. Template names are
+completed from the file listed by
+create_sparc_py.core.template_manager.template_names_cache, which the shell
+reads directly and which listing the templates keeps up to date.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import argparse
+import shlex
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from create_sparc_py.cli.command_table import (
+    COMMANDS,
+    COMPLETE_COMMANDS,
+    COMPLETE_DIRECTORIES,
+    COMPLETE_FILES,
+    COMPLETE_TEMPLATES,
+    OPTIONS,
+    Argument,
+)
+
+PROG = "create-sparc-py"
+# Every name the CLI is installed under (see [tool.poetry.scripts])
+PROGS = (PROG, "create-sparc")
+SHELLS = ("bash", "zsh", "fish")
+
+_HELP_OPTION = Argument(("-h", "--help"), {"action": "help", "help": "Show help for the command"})
+
+# Help argparse gives options of these actions when they have none of their own
+_DEFAULT_HELP = {"version": "Show the version and exit"}
+
+
+class _Option(NamedTuple):
+    flags: Tuple[str, ...]
+    help: str
+    takes_value: bool
+    repeatable: bool
+    metavar: str
+    values: Optional[Tuple[str, ...]]
+    complete: Optional[str]
+
+
+class _Positional(NamedTuple):
+    name: str
+    nargs: Union[None, int, str]
+    values: Optional[Tuple[str, ...]]
+    complete: Optional[str]
+
+
+def _values(argument: Argument) -> Optional[Tuple[str, ...]]:
+    """Fixed values of an argument: its choices, or the command names."""
+    if argument.complete == COMPLETE_COMMANDS:
+        return tuple(command.name for command in COMMANDS)
+    choices = argument.options.get("choices")
+    return tuple(choices) if choices else None
+
+
+def _split(arguments: Sequence[Argument]) -> Tuple[List[_Option], List[_Positional]]:
+    options, positionals = [], []
+    for argument in arguments:
+        if argument.flags[0].startswith("-"):
+            action = argument.options.get("action")
+            dest = argument.options.get("dest") or argument.flags[-1].lstrip("-").replace("-", "_")
+            options.append(
+                _Option(
+                    flags=argument.flags,
+                    help=argument.options.get("help") or _DEFAULT_HELP.get(action, ""),
+                    takes_value=argument.takes_value,
+                    repeatable=action in ("append", "count"),
+                    metavar=argument.options.get("metavar") or dest.upper(),
+                    values=_values(argument),
+                    complete=argument.complete,
+                )
+            )
+        else:
+            name = argument.flags[0]
+            positionals.append(_Positional(name, argument.options.get("nargs"), _values(argument), argument.complete))
+    return options, positionals
+
+
+def _commands() -> List[Tuple[str, str, List[_Option], List[_Positional]]]:
+    """Name, help, options and positionals of each command."""
+    result = []
+    for command in COMMANDS:
+        options, positionals = _split((*command.arguments, _HELP_OPTION))
+        result.append((command.name, command.help, options, positionals))
+    return result
+
+
+def _global_options() -> List[_Option]:
+    return _split((*OPTIONS, _HELP_OPTION))[0]
+
+
+def _bash_values(values: Optional[Tuple[str, ...]], complete: Optional[str]) -> str:
+    """Bash statements setting COMPREPLY to the values of an argument."""
+    if values:
+        return f'COMPREPLY=($(compgen -W {shlex.quote(" ".join(values))} -- "$cur"))'
+    if complete == COMPLETE_TEMPLATES:
+        return "_create_sparc_py_templates"
+    if complete == COMPLETE_DIRECTORIES:
+        return 'compopt -o filenames 2>/dev/null; COMPREPLY=($(compgen -d -- "$cur"))'
+    if complete == COMPLETE_FILES:
+        return 'compopt -o filenames 2>/dev/null; COMPREPLY=($(compgen -f -- "$cur"))'
+    return ":"
+
+
+def _bash_case(options: List[_Option], positionals: List[_Positional], words: str, indent: str) -> List[str]:
+    """Bash completing the options and positionals of the CLI or of one command."""
+    lines = []
+    for option in options:
+        if option.takes_value:
+            values = _bash_values(option.values, option.complete)
+            lines.append(f"{indent}    {'|'.join(option.flags)}) {values}; return ;;")
+    if lines:
+        lines = [f"{indent}case $prev in", *lines, f"{indent}esac"]
+    flags = " ".join(flag for option in options for flag in option.flags)
+    # Commands have at most one positional with completable values
+    completed = next((p for p in positionals if p.values or p.complete), None)
+    lines.append(f"{indent}if [[ $cur == -* ]]; then")
+    lines.append(f'{indent}    COMPREPLY=($(compgen -W {shlex.quote(flags)} -- "$cur"))')
+    if words:
+        lines.append(f"{indent}else")
+        lines.append(f'{indent}    COMPREPLY=($(compgen -W {shlex.quote(words)} -- "$cur"))')
+    elif completed is not None:
+        lines.append(f"{indent}else")
+        lines.append(f"{indent}    {_bash_values(completed.values, completed.complete)}")
+    lines.append(f"{indent}fi")
+    return lines
+
+
+def _bash(template_names: str) -> str:
+    global_options = _global_options()
+    commands = _commands()
+    skip_values = "|".join(flag for option in global_options if option.takes_value for flag in option.flags)
+    lines = [
+        f"# bash completion for {PROG}",
+        f"# Generated by `{PROG} completion bash`. Install it with:",
+        f"#   {PROG} completion bash > ~/.local/share/bash-completion/completions/{PROG}",
+        *(f"#   ln -s {PROG} ~/.local/share/bash-completion/completions/{alias}" for alias in PROGS[1:]),
+        "",
+        "_create_sparc_py_templates() {",
+        f"    local cache={shlex.quote(template_names)}",
+        '    [[ -r $cache ]] && COMPREPLY=($(compgen -W "$(<"$cache")" -- "$cur"))',
+        "}",
+        "",
+        "_create_sparc_py() {",
+        "    local cur=${COMP_WORDS[COMP_CWORD]} prev=${COMP_WORDS[COMP_CWORD-1]}",
+        "    local command= i",
+        "    COMPREPLY=()",
+        "    for ((i = 1; i < COMP_CWORD; i++)); do",
+        "        case ${COMP_WORDS[i]} in",
+        f"            {skip_values}) ((i++)) ;;",
+        "            -*) ;;",
+        "            *) command=${COMP_WORDS[i]}; break ;;",
+        "        esac",
+        "    done",
+        "    case $command in",
+        "        '')",
+    ]
+    lines += _bash_case(global_options, [], " ".join(name for name, _, _, _ in commands), " " * 12)
+    lines.append("            ;;")
+    for name, _help, options, positionals in commands:
+        lines.append(f"        {name})")
+        lines += _bash_case(options, positionals, "", " " * 12)
+        lines.append("            ;;")
+    lines += [
+        "    esac",
+        "}",
+        "",
+        f"complete -F _create_sparc_py {' '.join(PROGS)}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def _zsh_quote(text: str) -> str:
+    return "'" + text.replace("'", "'\\''") + "'"
+
+
+def _zsh_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("[", "\\[").replace("]", "\\]")
+
+
+def _zsh_action(values: Optional[Tuple[str, ...]], complete: Optional[str]) -> str:
+    if values:
+        return f"({' '.join(values)})"
+    if complete == COMPLETE_TEMPLATES:
+        return "_create_sparc_py_templates"
+    if complete == COMPLETE_DIRECTORIES:
+        return "_files -/"
+    if complete == COMPLETE_FILES:
+        return "_files"
+    return " "
+
+
+def _zsh_specs(options: List[_Option], positionals: List[_Positional]) -> List[str]:
+    """_arguments specs of the options and positionals of the CLI or of one command."""
+    specs = []
+    for option in options:
+        exclusive = "" if option.repeatable or len(option.flags) == 1 else f"({' '.join(option.flags)})"
+        for flag in option.flags:
+            spec = f"{exclusive}{'*' if option.repeatable else ''}{flag}[{_zsh_help(option.help)}]"
+            if option.takes_value:
+                spec += f":{option.metavar.lower()}:{_zsh_action(option.values, option.complete)}"
+            specs.append(_zsh_quote(spec))
+    for position, positional in enumerate(positionals, 1):
+        action = _zsh_action(positional.values, positional.complete)
+        if positional.nargs in ("*", "+", argparse.REMAINDER):
+            specs.append(_zsh_quote(f"*:{positional.name}:{action}"))
+        else:
+            optional = ":" if positional.nargs == "?" else ""
+            specs.append(_zsh_quote(f"{position}:{optional}{positional.name}:{action}"))
+    return specs
+
+
+def _zsh(template_names: str) -> str:
+    commands = _commands()
+    lines = [
+        f"#compdef {' '.join(PROGS)}",
+        f"# zsh completion for {PROG}",
+        f"# Generated by `{PROG} completion zsh`. Install it as _{PROG} in a directory on $fpath.",
+        "",
+        "_create_sparc_py_templates() {",
+        f"    local cache={shlex.quote(template_names)}",
+        '    [[ -r $cache ]] && compadd -- ${(f)"$(<$cache)"}',
+        "}",
+        "",
+        "_create_sparc_py() {",
+        "    local curcontext=$curcontext state line",
+        "    typeset -A opt_args",
+        "    _arguments -C \\",
+    ]
+    for spec in _zsh_specs(_global_options(), []):
+        lines.append(f"        {spec} \\")
+    lines += [
+        "        '1:command:->command' \\",
+        "        '*::argument:->argument' && return",
+        "    case $state in",
+        "        command)",
+        "            local -a commands=(",
+    ]
+    for name, help, _options, _positionals in commands:
+        lines.append(f"                {_zsh_quote(name + ':' + help.replace(':', chr(92) + ':'))}")
+    lines += [
+        "            )",
+        "            _describe -t commands command commands",
+        "            ;;",
+        "        argument)",
+        "            curcontext=${curcontext%:*:*}:$service-$words[1]:",
+        "            case $words[1] in",
+    ]
+    for name, _help, options, positionals in commands:
+        lines.append(f"                {name})")
+        lines.append("                    _arguments \\")
+        lines += [f"                        {spec} \\" for spec in _zsh_specs(options, positionals)]
+        lines[-1] = lines[-1][: -len(" \\")]
+        lines.append("                    ;;")
+    lines += [
+        "            esac",
+        "            ;;",
+        "    esac",
+        "}",
+        "",
+        "if [[ $zsh_eval_context[-1] == loadautofunc ]]; then",
+        '    _create_sparc_py "$@"',
+        "else",
+        f"    compdef _create_sparc_py {' '.join(PROGS)}",
+        "fi",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+# fish takes -c once per command name
+_FISH_COMMANDS = " ".join(f"-c {prog}" for prog in PROGS)
+
+
+def _fish_quote(text: str) -> str:
+    return "'" + text.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _fish_option(condition: str, option: _Option) -> str:
+    parts = [f"complete {_FISH_COMMANDS} -n {_fish_quote(condition)}"]
+    for flag in option.flags:
+        parts.append(f"-l {flag[2:]}" if flag.startswith("--") else f"-s {flag[1:]}")
+    if option.takes_value:
+        parts.append("-x")
+        parts.append(_fish_values(option.values, option.complete))
+    parts.append(f"-d {_fish_quote(option.help)}")
+    return " ".join(part for part in parts if part)
+
+
+def _fish_values(values: Optional[Tuple[str, ...]], complete: Optional[str]) -> str:
+    if values:
+        return f"-a {_fish_quote(' '.join(values))}"
+    if complete == COMPLETE_TEMPLATES:
+        return "-a '(__create_sparc_py_templates)'"
+    if complete == COMPLETE_DIRECTORIES:
+        return "-a '(__fish_complete_directories)'"
+    if complete == COMPLETE_FILES:
+        return "-F"
+    return ""
+
+
+def _fish(template_names: str) -> str:
+    lines = [
+        f"# fish completion for {PROG}",
+        f"# Generated by `{PROG} completion fish`. Install it with:",
+        f"#   {PROG} completion fish > ~/.config/fish/completions/{PROG}.fish",
+        *(f"#   ln -s {PROG}.fish ~/.config/fish/completions/{alias}.fish" for alias in PROGS[1:]),
+        "",
+        "function __create_sparc_py_templates",
+        f"    test -r {_fish_quote(template_names)}; and cat {_fish_quote(template_names)}",
+        "end",
+        "",
+        f"complete {_FISH_COMMANDS} -f",
+    ]
+    lines += [_fish_option("__fish_use_subcommand", option) for option in _global_options()]
+    for name, help, options, positionals in _commands():
+        lines.append(
+            f"complete {_FISH_COMMANDS} -n {_fish_quote('__fish_use_subcommand')} -a {name} -d {_fish_quote(help)}"
+        )
+        condition = f"__fish_seen_subcommand_from {name}"
+        lines += [_fish_option(condition, option) for option in options]
+        for positional in positionals:
+            values = _fish_values(positional.values, positional.complete)
+            if values:
+                lines.append(f"complete {_FISH_COMMANDS} -n {_fish_quote(condition)} {values}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+_GENERATORS: Dict[str, Callable[[str], str]] = {"bash": _bash, "zsh": _zsh, "fish": _fish}
+
+
+def completion_script(shell: str, template_names: Union[str, Path]) -> str:
+    """
+    Generate the completion script of a shell.
+
+    Args:
+        shell: One of SHELLS
+        template_names: File the script reads template names from, one per line
+
+    Returns:
+        The completion script
+
+    Raises:
+        ValueError: If the shell is not supported
+    """
+    try:
+        generate = _GENERATORS[shell]
+    except KeyError:
+        raise ValueError(f"Unsupported shell: {shell} (expected one of: {', '.join(SHELLS)})") from None
+    return generate(str(template_names))
+
+
+__all__ = ["PROG", "PROGS", "SHELLS", "completion_script"]
@@ -1,137 +1,89 @@
+"""
+Argument parser of the create-sparc-py CLI.
+
+The parser is built once per process from the command table in
+create_sparc_py.cli.command_table. Building it imports no command module:
+each subcommand's handler is looked up in create_sparc_py.cli.commands, and
+so imported, only when that subcommand runs.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
 import argparse
-from create_sparc_py.cli.commands.help_markdown import get_help_markdown
-from rich.console import Console
-from rich.markdown import Markdown
+import functools
+from typing import Any, Optional
+
+from create_sparc_py.cli.command_table import COMMANDS, OPTIONS
+
+
+class MarkdownHelpParser(argparse.ArgumentParser):
+    """Argument parser that prints a command's markdown help page, if it has one."""
+
+    def __init__(self, *args: Any, command_name: Optional[str] = None, **kwargs: Any):
+        self.command_name = command_name
+        super().__init__(*args, **kwargs)
+
+    def print_help(self, file: Any = None) -> None:
+        if self.command_name:
+            from create_sparc_py.cli.commands.help_markdown import print_help_markdown
+
+            if print_help_markdown(self.command_name, file):
+                return
+        super().print_help(file=file)
+
 
+class CommandHandler:
+    """Runs a command's handler, importing its module on first use."""
 
+    def __init__(self, name: str):
+        """
+        Initialize the CommandHandler.
+
+        Args:
+            name: Name of the handler in create_sparc_py.cli.commands
+        """
+        self.name = name
+
+    def __call__(self, args: argparse.Namespace) -> int:
+        from create_sparc_py.cli import commands
+
+        return getattr(commands, self.name)(args)
+
+    def __repr__(self) -> str:
+        return f"CommandHandler({self.name!r})"
+
+
+@functools.lru_cache(maxsize=None)
 def create_parser() -> argparse.ArgumentParser:
-    class MarkdownHelpParser(argparse.ArgumentParser):
-        def __init__(self, *args, **kwargs):
-            self.command_name = kwargs.pop("command_name", None)
-            super().__init__(*args, **kwargs)
-
-        def print_help(self, file=None):
-            if getattr(self, "command_name", None):
-                help_md = get_help_markdown(self.command_name)
-                if not help_md.startswith("No help available"):
-                    console = Console()
-                    console.print(Markdown(help_md))
-                    return
-            super().print_help(file=file)
+    """
+    Get the CLI's argument parser.
+
+    The parser is built on the first call and shared afterwards.
 
+    Returns:
+        The argument parser
+    """
     parser = MarkdownHelpParser(
         prog="create-sparc-py",
         description="Python scaffolding tool using the SPARC methodology",
         epilog="For more information, visit: https://github.com/yourusername/create-sparc-py",
-        command_name=None,
     )
-    parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output")
-    parser.add_argument("--debug", action="store_true", help="Enable debug output")
-    parser.add_argument("--version", action="version", version="%(prog)s 0.1.0")
+    for argument in OPTIONS:
+        parser.add_argument(*argument.flags, **argument.options)
     subparsers = parser.add_subparsers(
         title="commands",
         dest="command",
         help="Commands to run",
         parser_class=MarkdownHelpParser,
     )
-
-    def add_subparser_with_markdown(name, help_text, add_args_fn):
-        subparser = subparsers.add_parser(
-            name,
-            help=help_text,
-        )
-        subparser.command_name = name
-        add_args_fn(subparser)
-        return subparser
-
-    def _add_init_args(parser):
-        from create_sparc_py.cli.commands import init_command
-
-        parser.add_argument("name", help="Name of the project to create")
-        parser.add_argument(
-            "-t",
-            "--template",
-            default="default",
-            help="Template to use (default: 'default')",
-        )
-        parser.add_argument("-d", "--directory", help="Directory to create the project in (default: <name>)")
-        parser.set_defaults(func=init_command)
-
-    def _add_add_args(parser):
-        from create_sparc_py.cli.commands import add_command
-
-        parser.add_argument("component", help="Component to add")
-        parser.add_argument("name", help="Name of the component")
-        parser.add_argument(
-            "-d",
-            "--directory",
-            help="Directory to add the component to (default: current directory)",
-        )
-        parser.set_defaults(func=add_command)
-
-    def _add_help_args(parser):
-        from create_sparc_py.cli.commands import help_command
-
-        parser.add_argument("command", nargs="?", help="Command to show help for")
-        parser.set_defaults(func=help_command)
-
-    def _add_wizard_args(parser):
-        from create_sparc_py.cli.commands import wizard_command
-
-        parser.add_argument(
-            "wizard_args",
-            nargs=argparse.REMAINDER,
-            help="Arguments for the wizard subcommands (e.g., list, add, audit-security, etc.)",
-        )
-        parser.set_defaults(func=wizard_command)
-
-    def _add_mcp_args(parser):
-        from create_sparc_py.cli.commands import configure_mcp_command
-
-        parser.add_argument(
-            "mcp_args",
-            nargs=argparse.REMAINDER,
-            help="Arguments for the configure-mcp subcommands (e.g., add, remove, update, list, etc.)",
-        )
-        parser.set_defaults(func=configure_mcp_command)
-
-    def _add_aigi_args(parser):
-        from create_sparc_py.cli.commands import aigi_command
-
-        parser.add_argument(
-            "aigi_args",
-            nargs=argparse.REMAINDER,
-            help="Arguments for the aigi subcommands (e.g., init, etc.)",
-        )
-        parser.set_defaults(func=aigi_command)
-
-    def _add_minimal_args(parser):
-        from create_sparc_py.cli.commands import minimal_command
-
-        parser.add_argument("name", help="Name of the minimal Roo project to create")
-        parser.add_argument(
-            "-d",
-            "--directory",
-            help="Directory to create the project in (default: <name>)",
-        )
-        parser.set_defaults(func=minimal_command)
-
-    def _add_registry_args(parser):
-        from create_sparc_py.cli.commands.registry_command import registry_command
-
-        parser.add_argument(
-            "registry_args",
-            nargs=argparse.REMAINDER,
-            help="Arguments for the registry subcommands (e.g., list, get, post, auth, etc.)",
-        )
-        parser.set_defaults(func=registry_command)
-
-    add_subparser_with_markdown("init", "Initialize a new project using a template", _add_init_args)
-    add_subparser_with_markdown("add", "Add a component to an existing project", _add_add_args)
-    add_subparser_with_markdown("help", "Show help for a command", _add_help_args)
-    add_subparser_with_markdown("wizard", "Run the project creation wizard", _add_wizard_args)
-    add_subparser_with_markdown("configure-mcp", "Configure Multi-Cloud Provider settings", _add_mcp_args)
-    add_subparser_with_markdown("aigi", "AI-Guided Implementation commands", _add_aigi_args)
-    add_subparser_with_markdown("minimal", "Create a minimal Roo mode framework", _add_minimal_args)
-    add_subparser_with_markdown("registry", "Registry client commands", _add_registry_args)
+    for command in COMMANDS:
+        subparser = subparsers.add_parser(command.name, help=command.help, command_name=command.name)
+        for argument in command.arguments:
+            subparser.add_argument(*argument.flags, **argument.options)
+        subparser.set_defaults(func=CommandHandler(command.handler))
     return parser
+
+
+__all__ = ["create_parser", "MarkdownHelpParser", "CommandHandler"]
@@ -0,0 +1,231 @@
+"""
+Layered configuration helpers for create-sparc-py.
+
+Configuration is assembled from layers, each overriding the ones before it:
+
+1. ``default``: built-in defaults
+2. ``user``: ``~/.create-sparc-py/config.json``
+3. ``project``: ``<project>/.sparc/config.json`` of the enclosing project
+4. ``env``: ``CREATE_SPARC_PY_*`` environment variables, with ``__``
+   separating nested keys (``CREATE_SPARC_PY_AI_SETTINGS__MODEL=gpt-4o``)
+5. ``cli``: ``-c KEY=VALUE`` options, with ``.`` separating nested keys
+   (``-c ai_settings.model=gpt-4o``)
+
+Layers are deep-merged: a nested dictionary only overrides the keys it sets.
+The merge also records, for every leaf key, the layer its value came from.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+LAYERS = ("default", "user", "project", "env", "cli")
+ENV_PREFIX = "CREATE_SPARC_PY_"
+
+
+def deep_merge(base: Mapping[str, Any], override: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Merge override into a copy of base, recursing into nested dictionaries.
+
+    Args:
+        base: Configuration to merge into
+        override: Configuration whose values take precedence
+
+    Returns:
+        New merged dictionary; neither argument is modified
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, Mapping) and isinstance(merged.get(key), Mapping):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def diff_config(config: Mapping[str, Any], base: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Keep only the parts of config that differ from base.
+
+    ``deep_merge(base, diff_config(config, base))`` equals
+    ``deep_merge(base, config)``.
+
+    Args:
+        config: Configuration to reduce
+        base: Configuration it is compared against
+
+    Returns:
+        The values of config that are missing from or different in base
+    """
+    diff = {}
+    for key, value in config.items():
+        if key not in base:
+            diff[key] = value
+        elif isinstance(value, Mapping) and isinstance(base[key], Mapping):
+            nested = diff_config(value, base[key])
+            if nested:
+                diff[key] = nested
+        elif value != base[key]:
+            diff[key] = value
+    return diff
+
+
+def parse_value(text: str) -> Any:
+    """
+    Parse a configuration value given as text.
+
+    Args:
+        text: JSON value (number, boolean, null, list or object) or a plain string
+
+    Returns:
+        The decoded JSON value, or text itself if it is not valid JSON
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def set_path(config: Dict[str, Any], path: Iterable[str], value: Any) -> None:
+    """
+    Set a nested value, creating intermediate dictionaries.
+
+    Args:
+        config: Dictionary to modify
+        path: Keys from the outermost to the innermost
+        value: Value to set
+    """
+    *parents, leaf = path
+    for key in parents:
+        child = config.get(key)
+        if not isinstance(child, dict):
+            child = config[key] = {}
+        config = child
+    config[leaf] = value
+
+
+def get_path(config: Mapping[str, Any], key: str, default: Any = None) -> Any:
+    """
+    Get a nested value by dotted key.
+
+    Args:
+        config: Configuration to read
+        key: Dotted key, e.g. 'ai_settings.model'
+        default: Value returned if the key is not set
+
+    Returns:
+        The value, or default
+    """
+    value: Any = config
+    for part in key.split("."):
+        if not isinstance(value, Mapping) or part not in value:
+            return default
+        value = value[part]
+    return value
+
+
+def parse_assignments(assignments: Iterable[str]) -> Dict[str, Any]:
+    """
+    Parse ``KEY=VALUE`` assignments into a nested configuration.
+
+    Args:
+        assignments: Strings such as ``ai_settings.model=gpt-4o``
+
+    Returns:
+        Nested configuration dictionary
+
+    Raises:
+        ValueError: If an assignment has no ``=`` or an empty key
+    """
+    config: Dict[str, Any] = {}
+    for assignment in assignments:
+        key, sep, value = assignment.partition("=")
+        path = key.strip().split(".")
+        if not sep or not all(path):
+            raise ValueError(f"Invalid assignment '{assignment}'; expected KEY=VALUE")
+        set_path(config, path, parse_value(value))
+    return config
+
+
+def env_items(environ: Optional[Mapping[str, str]] = None) -> Tuple[Tuple[str, str], ...]:
+    """
+    Collect the configuration variables from the environment.
+
+    Args:
+        environ: Environment to read (default: os.environ)
+
+    Returns:
+        Sorted (name, value) pairs of variables starting with ENV_PREFIX
+    """
+    environ = os.environ if environ is None else environ
+    return tuple(sorted((name, value) for name, value in environ.items() if name.startswith(ENV_PREFIX)))
+
+
+def env_overrides(items: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+    """
+    Convert environment variables into a nested configuration.
+
+    Args:
+        items: (name, value) pairs as returned by env_items
+
+    Returns:
+        Nested configuration dictionary
+    """
+    config: Dict[str, Any] = {}
+    for name, value in items:
+        path = [part.lower() for part in name[len(ENV_PREFIX) :].split("__")]
+        if all(path):
+            set_path(config, path, parse_value(value))
+    return config
+
+
+def _leaves(config: Mapping[str, Any], prefix: str = "") -> Iterable[str]:
+    for key, value in config.items():
+        if isinstance(value, Mapping):
+            yield from _leaves(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}"
+
+
+def merge_layers(layers: List[Tuple[str, Mapping[str, Any]]]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Deep-merge configuration layers, lowest precedence first.
+
+    Args:
+        layers: (layer name, configuration) pairs
+
+    Returns:
+        Tuple of (merged configuration, provenance), where provenance maps
+        each dotted leaf key to the name of the layer that set it
+    """
+    merged: Dict[str, Any] = {}
+    provenance: Dict[str, str] = {}
+    for name, config in layers:
+        if not config:
+            continue
+        merged = deep_merge(merged, config)
+        for key in _leaves(config):
+            # A plain value and a nested dictionary replace each other wholesale
+            for stale in [k for k in provenance if k.startswith(f"{key}.") or key.startswith(f"{k}.")]:
+                del provenance[stale]
+            provenance[key] = name
+    return merged, provenance
+
+
+__all__ = [
+    "LAYERS",
+    "ENV_PREFIX",
+    "deep_merge",
+    "diff_config",
+    "parse_value",
+    "set_path",
+    "get_path",
+    "parse_assignments",
+    "env_items",
+    "env_overrides",
+    "merge_layers",
+]
@@ -4,17 +4,41 @@ Configuration management for create-sparc-py.
 This module provides the ConfigManager class for loading, validating,
 and saving configuration settings.
 
+Settings are read from a merged view of several layers (see config_layers):
+built-in defaults, the user's config.json, the enclosing project's
+``.sparc/config.json``, ``CREATE_SPARC_PY_*`` environment variables and
+``-c KEY=VALUE`` command-line options. The merged view is computed once and
+reused until a layer changes; file layers are checked by mtime and size.
+Changes made with set and update are saved to the user's config.json,
+immediately or, inside a transaction, once when it commits. The file is a
+JsonDocument, so saves from parallel processes are serialized and merged
+rather than overwriting each other.
+
 This project is a Python port of the original create-sparc Node.js tool created by
 Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
 https://github.com/ruvnet/rUv-dev.
 """
 
 import os
-import json
+import copy
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Iterator, Optional, List, Set, Tuple, Union
 
 from create_sparc_py.utils import logger, fs_utils, path_utils
+from create_sparc_py.core.config_layers import (
+    LAYERS,
+    deep_merge,
+    diff_config,
+    env_items,
+    env_overrides,
+    merge_layers,
+)
+from create_sparc_py.core import json_codec
+from create_sparc_py.core.config_snapshot import ConfigSnapshot
+from create_sparc_py.core.json_document import JsonDocument, Version
+from create_sparc_py.core.project_root import PROJECT_DIR, PROJECT_MARKERS, ProjectRootResolver
+from create_sparc_py.core.schema_validation import validate as validate_schema
 
 
 class ConfigManager:
@@ -49,6 +73,10 @@ class ConfigManager:
                 "max_tokens": 2000,
             },
             "default_template": "default",
+            "wheelhouse_dir": str(self.config_dir / "wheelhouse"),
+            "venv_cache_dir": str(self.config_dir / "venv-cache"),
+            "venv_cache_max_bytes": 2 * 1024 * 1024 * 1024,
+            "project_root_hints": False,
             "version": "0.1.0",
         }
 
@@ -57,58 +85,305 @@ class ConfigManager:
             logger.info(f"Creating configuration directory: {self.config_dir}")
             fs_utils.create_dir(self.config_dir)
 
+        self._cli_overrides: Dict[str, Any] = {}
+        self._generation = 0
+        self._merged: Optional[Dict[str, Any]] = None
+        self._provenance: Dict[str, str] = {}
+        self._merged_key: Optional[Tuple[Any, ...]] = None
+        self._project_layers: Dict[str, Tuple[Optional[Version], Dict[str, Any], List[str]]] = {}
+        self._transaction_depth = 0
+        self._pending_save = False
+        self._document = JsonDocument(self.config_file)
+        self._snapshot = ConfigSnapshot(self.config_dir / "config.snapshot")
+        self._reported_errors: Set[Tuple[str, Optional[Version]]] = set()
+        # The user's config.json as last read or written, and its version
+        self._base: Optional[Dict[str, Any]] = None
+        self._user_version: Optional[Version] = None
+
         # Load or create the config file
         self.config = self._load_config()
 
+        # Read from the user layer, since the project layer needs the resolver
+        hint_file = self.config_dir / "project-roots.json" if self.config.get("project_root_hints") else None
+        self.project_root_resolver = ProjectRootResolver(hint_file)
+
     def _load_config(self) -> Dict[str, Any]:
         """
         Load configuration from the config file.
 
+        The file as read and its schema errors are cached in the snapshot, so
+        an unchanged file is neither parsed nor validated again.
+
         Returns:
             Configuration dictionary
         """
         if not fs_utils.exists(self.config_file):
             logger.info(f"Creating default configuration file: {self.config_file}")
+            self._base, self._user_version = None, None
             self._save_config(self.default_config)
             return dict(self.default_config)
 
+        version = self._document.version()
+        cached = self._snapshot.get("user", "config", (version, self.default_config))
+        if cached is not None:
+            self._base, errors = cached
+            self._user_version = version
+            self._report_schema_errors(self.config_file, version, errors)
+            return deep_merge(self.default_config, copy.deepcopy(self._base))
+
         try:
-            config_str = fs_utils.read_file(self.config_file)
-            config = json.loads(config_str)
+            config, self._user_version = self._document.read()
+            self._base = copy.deepcopy(config)
+            errors = validate_schema("config", config)
+            self._report_schema_errors(self.config_file, self._user_version, errors)
 
-            # Merge with defaults to ensure all keys are present
-            merged_config = dict(self.default_config)
-            merged_config.update(config)
+            # Merge with defaults to ensure all keys, including nested ones, are present
+            merged_config = deep_merge(self.default_config, config)
 
             # Update the file if any defaults were missing
-            if len(merged_config) > len(config):
+            if merged_config != config:
                 logger.info("Updating configuration with new default settings")
                 self._save_config(merged_config)
 
+            if self._base is not None:
+                self._snapshot.put("user", "config", (self._user_version, self.default_config), (self._base, errors))
             return merged_config
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
             logger.warning("Using default configuration")
+            self._base, self._user_version = None, self._document.version()
             return dict(self.default_config)
 
     def _save_config(self, config: Dict[str, Any]) -> bool:
         """
         Save configuration to the config file.
 
+        Inside a transaction the configuration only becomes the in-memory
+        user configuration, and is written when the transaction commits.
+
         Args:
             config: Configuration dictionary to save
 
         Returns:
             True if successful, False otherwise
         """
+        if self._transaction_depth:
+            self.config = config
+            self._pending_save = True
+            self._generation += 1
+            return True
         try:
-            config_str = json.dumps(config, indent=2)
-            fs_utils.write_file(self.config_file, config_str)
+            written, self._user_version = self._document.write(config, self._user_version, self._base)
+            if written is not config:
+                # Another process saved since we read the file; keep its changes too
+                config.clear()
+                config.update(written)
+            self._base = copy.deepcopy(config)
+            self._generation += 1
             return True
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
             return False
 
+    @contextmanager
+    def transaction(self) -> Iterator["ConfigManager"]:
+        """
+        Batch configuration changes into a single write.
+
+        Calls to set, update, reset and the other setters inside the block
+        change the in-memory configuration only; the user's config.json is
+        written once when the outermost transaction exits. If the block
+        raises, the changes are discarded and nothing is written.
+
+        Yields:
+            This ConfigManager
+
+        Raises:
+            RuntimeError: If the configuration cannot be written on commit
+        """
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield self
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        snapshot = copy.deepcopy(self.config)
+        self._transaction_depth = 1
+        self._pending_save = False
+        try:
+            yield self
+        except BaseException:
+            self.config = snapshot
+            self._generation += 1
+            raise
+        finally:
+            self._transaction_depth = 0
+        if self._pending_save:
+            self._pending_save = False
+            if not self._save_config(self.config):
+                raise RuntimeError(f"Could not save configuration to {self.config_file}")
+
+    def merge(self, updates: Dict[str, Any]) -> bool:
+        """
+        Deep-merge nested updates into the user's configuration.
+
+        Unlike update, a nested dictionary only replaces the keys it contains.
+
+        Args:
+            updates: Nested dictionary of updates
+
+        Returns:
+            True if successful, False otherwise
+        """
+        self.config = deep_merge(self.config, updates)
+        return self._save_config(self.config)
+
+    def _report_schema_errors(self, path: Any, version: Optional[Version], errors: List[str]) -> None:
+        """Log the schema errors of a configuration file once per version; the file is still used."""
+        if not errors or (str(path), version) in self._reported_errors:
+            return
+        self._reported_errors.add((str(path), version))
+        for error in errors:
+            logger.warning(f"Invalid configuration in {path}: {error}")
+
+    def _project_file(self) -> Tuple[Optional[str], Optional[Version]]:
+        """
+        Find the configuration file of the project containing the current directory.
+
+        Returns:
+            Tuple of (config file path, its stat key); the path is None
+            outside a project and the stat key is None if the file does not exist
+        """
+        root = self.project_root_resolver.resolve()
+        if root is None:
+            return None, None
+        path = str(root / PROJECT_DIR / "config.json")
+        return path, _stat_key(path)
+
+    def _project_layer(self, path: Optional[str], stat_key: Optional[Version]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Load the configuration of a project.
+
+        Args:
+            path: Project config file path, as returned by _project_file
+            stat_key: Its stat key, as returned by _project_file
+
+        Returns:
+            Tuple of (settings, schema errors)
+        """
+        if path is None:
+            return {}, []
+        cached = self._project_layers.get(path)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1], cached[2]
+        settings: Dict[str, Any] = {}
+        errors: List[str] = []
+        if stat_key is not None:
+            try:
+                settings = json_codec.load_file(path)
+            except ValueError as e:
+                logger.warning(f"Ignoring invalid project configuration {path}: {e}")
+            errors = validate_schema("config", settings)
+            self._report_schema_errors(path, stat_key, errors)
+            if not isinstance(settings, dict):
+                settings = {}
+        self._project_layers[path] = (stat_key, settings, errors)
+        return settings, errors
+
+    def _merged_config(self) -> Dict[str, Any]:
+        """
+        Get the merged view of all configuration layers.
+
+        The view is rebuilt only when a layer changed: the user or project
+        config file (by mtime, size and inode), the CREATE_SPARC_PY_*
+        environment or the command-line overrides. Rebuilt views are cached
+        in the snapshot, keyed on all of these, so another process with the
+        same inputs neither parses the project configuration nor merges.
+
+        Returns:
+            Merged configuration dictionary
+        """
+        if self._document.version() != self._user_version and not self._transaction_depth:
+            # Changed by another process since it was loaded or saved here
+            self.config = self._load_config()
+        project_path, project_stat = self._project_file()
+        env = env_items()
+        key = (self._generation, self._user_version, project_path, project_stat, env)
+        if self._merged is None or key != self._merged_key:
+            user_layer = diff_config(self.config, self.default_config)
+            snapshot_key = (self.default_config, user_layer, project_stat, env, self._cli_overrides)
+            cached = self._snapshot.get("merged", project_path or "", snapshot_key)
+            if cached is not None:
+                self._merged, self._provenance, errors = cached
+                self._report_schema_errors(project_path, project_stat, errors)
+            else:
+                project_settings, errors = self._project_layer(project_path, project_stat)
+                self._merged, self._provenance = merge_layers(
+                    [
+                        ("default", self.default_config),
+                        ("user", user_layer),
+                        ("project", project_settings),
+                        ("env", env_overrides(env)),
+                        ("cli", self._cli_overrides),
+                    ]
+                )
+                self._snapshot.put(
+                    "merged", project_path or "", snapshot_key, (self._merged, self._provenance, errors)
+                )
+            self._merged_key = key
+        return self._merged
+
+    def set_cli_overrides(self, overrides: Dict[str, Any]) -> None:
+        """
+        Set the command-line configuration layer.
+
+        Args:
+            overrides: Nested settings, as returned by config_layers.parse_assignments
+        """
+        self._cli_overrides = overrides
+        self._generation += 1
+
+    def get_all(self) -> Dict[str, Any]:
+        """
+        Get every effective setting.
+
+        Returns:
+            Copy of the merged configuration
+        """
+        return copy.deepcopy(self._merged_config())
+
+    def get_provenance(self) -> Dict[str, str]:
+        """
+        Get the layer each setting comes from.
+
+        Returns:
+            Dictionary mapping dotted leaf keys (e.g. 'ai_settings.model') to
+            'default', 'user', 'project', 'env' or 'cli'
+        """
+        self._merged_config()
+        return dict(self._provenance)
+
+    def get_source(self, key: str) -> Optional[str]:
+        """
+        Get the layer a setting comes from.
+
+        Args:
+            key: Dotted configuration key; for a nested dictionary, the
+                 highest-precedence layer among its keys is returned
+
+        Returns:
+            Layer name, or None if the key is not set
+        """
+        self._merged_config()
+        if key in self._provenance:
+            return self._provenance[key]
+        layers = [layer for k, layer in self._provenance.items() if k.startswith(f"{key}.")]
+        if not layers:
+            return None
+        return max(layers, key=LAYERS.index)
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a configuration value.
@@ -120,11 +395,14 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        return self.config.get(key, default)
+        return self._merged_config().get(key, default)
 
     def set(self, key: str, value: Any) -> bool:
         """
-        Set a configuration value.
+        Set a configuration value in the user's config.json.
+
+        The project, environment and command-line layers still take
+        precedence over the value.
 
         Args:
             key: Configuration key
@@ -215,8 +493,69 @@ class ConfigManager:
         """
         return self.set("default_template", template_name)
 
+    def get_wheelhouse_dir(self) -> Path:
+        """
+        Get the local wheelhouse directory used for offline installs.
+
+        Returns:
+            Path to the wheelhouse directory
+        """
+        return Path(self.get("wheelhouse_dir") or self.config_dir / "wheelhouse")
+
+    def get_venv_cache_dir(self) -> Path:
+        """
+        Get the directory holding prebuilt virtual environments.
+
+        Returns:
+            Path to the virtual environment cache
+        """
+        return Path(self.get("venv_cache_dir") or self.config_dir / "venv-cache")
+
+    def find_project_config(self, start: Optional[Union[str, Path]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find the SPARC project containing a directory.
+
+        The project root is found by the cached ProjectRootResolver, which
+        searches upward from ``start`` but not past a repository root or
+        mount point.
+
+        Args:
+            start: Directory to start from (default: the current directory)
+
+        Returns:
+            None if no project is found, otherwise the project's
+            ``.sparc/config.json`` settings plus 'project_root',
+            'project_name' and 'template' keys
+        """
+        directory = self.project_root_resolver.resolve(start)
+        if directory is None:
+            return None
+        sparc_dir = directory / PROJECT_DIR
+        project_config: Dict[str, Any] = {}
+        lock: Dict[str, Any] = {}
+        try:
+            if (sparc_dir / "config.json").is_file():
+                project_config.update(json_codec.load_file(sparc_dir / "config.json"))
+            if (sparc_dir / "lock.json").is_file():
+                lock = json_codec.load_file(sparc_dir / "lock.json")
+        except ValueError as e:
+            logger.warning(f"Ignoring invalid project configuration in {sparc_dir}: {e}")
+        project_config.setdefault("project_name", lock.get("context", {}).get("project_name", directory.name))
+        project_config.setdefault("template", lock.get("template", {}).get("name"))
+        project_config["project_root"] = str(directory)
+        return project_config
+
+
+def _stat_key(path: Union[str, Path]) -> Optional[Version]:
+    """Return (mtime_ns, size, inode) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
 
 # Create a singleton instance
 config_manager = ConfigManager()
 
-__all__ = ["ConfigManager", "config_manager"]
+__all__ = ["ConfigManager", "config_manager", "PROJECT_DIR", "PROJECT_MARKERS"]
@@ -0,0 +1,125 @@
+"""
+Binary snapshot cache of loaded configuration.
+
+Every command starts by loading the user's ``config.json``, the project's
+``.sparc/config.json`` and merging them with the other configuration layers.
+Tooling runs the CLI in tight loops, so this module lets the results be
+reused across processes: the ConfigSnapshot class keeps them in a single
+``marshal`` file next to ``config.json``. A warm start reads that one file
+instead of parsing and validating the JSON sources.
+
+Each entry is stored with the key it was computed from, and is only used
+while the key matches exactly. Keys identify input files by their
+``(st_mtime_ns, st_size, st_ino)``, which changes whenever a file is
+rewritten, and in-memory inputs (defaults, environment, command-line
+overrides) by value. Entries are kept marshalled until they are used, so
+every value returned is a fresh copy that callers may modify. A snapshot
+written by another Python version, or one that cannot be read, is ignored
+and rewritten.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+# marshal's format is only stable within a Python version
+SNAPSHOT_FORMAT = (1, marshal.version, sys.version_info[:2])
+# Entries kept per section, most recently stored last
+MAX_ENTRIES = 32
+
+
+class ConfigSnapshot:
+    """
+    A marshal file of cached values, each valid only for the key it was stored with.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the ConfigSnapshot.
+
+        Args:
+            path: Path of the snapshot file
+        """
+        self.path = Path(path)
+        self._data: Optional[Dict[str, Any]] = None
+
+    def _load(self) -> Dict[str, Any]:
+        """Read the snapshot file once, starting empty if it is missing, stale or corrupt."""
+        if self._data is None:
+            self._data = {"format": SNAPSHOT_FORMAT, "sections": {}}
+            try:
+                with open(self.path, "rb") as f:
+                    data = marshal.loads(f.read())
+                if isinstance(data, dict) and data.get("format") == SNAPSHOT_FORMAT:
+                    self._data = data
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+        return self._data
+
+    def get(self, section: str, name: str, key: Any) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            section: Kind of value, e.g. 'user' or 'merged'
+            name: Name of the entry within the section
+            key: Inputs the value must have been computed from
+
+        Returns:
+            The cached value, or None if there is none for this key
+        """
+        entry = self._load()["sections"].get(section, {}).get(name)
+        if entry is None:
+            return None
+        try:
+            entry_key, value = marshal.loads(entry)
+        except (EOFError, ValueError, TypeError):
+            return None
+        return value if entry_key == key else None
+
+    def put(self, section: str, name: str, key: Any, value: Any) -> None:
+        """
+        Store a value and write the snapshot file.
+
+        Failures to write are ignored; the value is simply recomputed next time.
+
+        Args:
+            section: Kind of value, e.g. 'user' or 'merged'
+            name: Name of the entry within the section
+            key: Inputs the value was computed from
+            value: Value to cache; must contain only marshal-compatible types
+        """
+        try:
+            entry = marshal.dumps((key, value))
+        except ValueError:
+            return
+        entries = self._load()["sections"].setdefault(section, {})
+        entries.pop(name, None)
+        entries[name] = entry
+        while len(entries) > MAX_ENTRIES:
+            del entries[next(iter(entries))]
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(marshal.dumps(self._data))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if tmp_path.exists():
+                os.remove(tmp_path)
+
+    def invalidate(self) -> None:
+        """Drop every cached value, in memory and on disk."""
+        self._data = {"format": SNAPSHOT_FORMAT, "sections": {}}
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+__all__ = ["ConfigSnapshot", "SNAPSHOT_FORMAT", "MAX_ENTRIES"]
@@ -0,0 +1,148 @@
+"""
+Fleet operations across many generated projects.
+
+This module finds every generated project under a directory and brings the
+stale ones up to date with their templates. Discovery is a single iterative
+``os.scandir`` walk that recognises projects by their ``.sparc/lock.json``
+and never descends into a project it has found, nor into VCS metadata,
+virtual environments or ``node_modules``.
+
+A project is stale when the template digest recorded in its lockfile differs
+from the digest of the template as it is now; each template is hashed once
+per run. Stale projects are upgraded (see project_upgrade) on a process
+pool, so user changes are merged rather than overwritten.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from create_sparc_py.core.project_lock import LOCK_PATH, read_lock
+from create_sparc_py.core.project_upgrade import upgrade_project
+from create_sparc_py.core.template_manager import template_manager
+from create_sparc_py.utils import logger
+
+# Directories that never contain generated projects
+SKIP_DIRS = frozenset({".git", ".hg", ".svn", ".venv", "venv", "node_modules", "__pycache__", ".tox", ".mypy_cache"})
+_MARKER_DIR, _LOCK_NAME = LOCK_PATH.parts
+
+
+def discover_projects(root: Union[str, Path]) -> List[Path]:
+    """
+    Find generated projects under root.
+
+    Args:
+        root: Directory to search
+
+    Returns:
+        Sorted paths of directories containing a lockfile
+    """
+    projects = []
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        is_project = False
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if entry.name == _MARKER_DIR:
+                        is_project = os.path.isfile(os.path.join(entry.path, _LOCK_NAME))
+                    elif entry.name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {directory}: {e}")
+            continue
+        if is_project:
+            projects.append(Path(directory))
+        else:
+            stack.extend(subdirs)
+    return sorted(projects)
+
+
+def _refresh_project(project_dir: Path, dry_run: bool) -> Dict[str, Any]:
+    """Upgrade one project; runs in a worker process."""
+    try:
+        result = upgrade_project(project_dir, dry_run=dry_run)
+    except Exception as e:
+        return {"path": str(project_dir), "status": "failed", "error": str(e)}
+    actions = Counter(result["files"].values())
+    if actions["conflict"]:
+        status = "conflict"
+    else:
+        status = "would_refresh" if dry_run else "refreshed"
+    return {
+        "path": str(project_dir),
+        "status": status,
+        "template": result["template"],
+        "from_version": result["from_version"],
+        "to_version": result["to_version"],
+        "actions": dict(actions),
+    }
+
+
+def refresh_fleet(
+    root: Union[str, Path],
+    max_workers: Optional[int] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Upgrade every stale generated project under root.
+
+    Args:
+        root: Directory to search for projects
+        max_workers: Number of worker processes (default: CPU count)
+        dry_run: Report what would change without writing anything
+
+    Returns:
+        Dictionary with 'projects' (one result per project, in path order,
+        each with 'path' and 'status': current, refreshed, conflict or
+        failed, with would_refresh instead of refreshed on a dry run) and
+        'summary' (count of projects per status)
+    """
+    digests: Dict[str, Optional[str]] = {}
+    results: Dict[str, Dict[str, Any]] = {}
+    stale: List[Path] = []
+    for project_dir in discover_projects(root):
+        try:
+            lock = read_lock(project_dir)
+            template_name = lock["template"]["name"]
+            if template_name not in digests:
+                try:
+                    digests[template_name] = template_manager.get_template_digest(template_name)
+                except FileNotFoundError:
+                    digests[template_name] = None
+            if digests[template_name] is None:
+                raise ValueError(f"Template '{template_name}' not found")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            results[str(project_dir)] = {"path": str(project_dir), "status": "failed", "error": str(e)}
+            continue
+        if lock["template"].get("sha256") == digests[template_name]:
+            results[str(project_dir)] = {"path": str(project_dir), "status": "current", "template": template_name}
+        else:
+            stale.append(project_dir)
+
+    logger.verbose(f"{len(stale)} of {len(results) + len(stale)} projects are stale")
+    if len(stale) == 1 or max_workers == 1:
+        refreshed = [_refresh_project(project_dir, dry_run) for project_dir in stale]
+    elif stale:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            refreshed = list(executor.map(_refresh_project, stale, [dry_run] * len(stale)))
+    else:
+        refreshed = []
+    for result in refreshed:
+        results[result["path"]] = result
+
+    projects = [results[path] for path in sorted(results)]
+    return {"projects": projects, "summary": dict(Counter(result["status"] for result in projects))}
+
+
+__all__ = ["discover_projects", "refresh_fleet", "SKIP_DIRS"]
@@ -0,0 +1,206 @@
+"""
+Generation journal for resuming interrupted project generation.
+
+This module provides the GenerationJournal class, an append-only record of
+the files a generation has finished writing, together with the SHA-256 of
+each file's output. If a generation is interrupted, a later run in resume
+mode verifies the journal against the output directory and skips every file
+that is already present and intact.
+
+The journal lives at ``<project>/.sparc/journal.jsonl``. Its first line is a
+header holding a fingerprint of the template and context; each following
+line records one file. Lines that cannot be used, such as a line torn by
+an interrupted write, are ignored, so their files are generated again. It is
+removed once a generation completes.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, TextIO, Union
+
+from create_sparc_py.utils import logger
+
+JOURNAL_PATH = Path(".sparc") / "journal.jsonl"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def context_fingerprint(template_name: str, context: Dict[str, Any]) -> str:
+    """
+    Compute a stable fingerprint of a template name and rendering context.
+
+    Args:
+        template_name: Name of the template
+        context: Rendering context
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps({"template": template_name, "context": context}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    """
+    Compute the SHA-256 of a file's content.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class GenerationJournal:
+    """
+    Append-only journal of files completed by a generation.
+
+    ``completed`` maps output paths (relative to the project, ``/``-separated)
+    to the hash of their content for every file that a resumed generation may
+    skip. It is empty unless the journal was started in resume mode.
+    """
+
+    def __init__(self, output_dir: Union[str, Path], fingerprint: str):
+        """
+        Initialize the GenerationJournal.
+
+        Args:
+            output_dir: Project output directory
+            fingerprint: Fingerprint of the template and context being generated
+        """
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / JOURNAL_PATH
+        self.fingerprint = fingerprint
+        self.completed: Dict[str, str] = {}
+        self._file: Optional[TextIO] = None
+        self._append: Optional[bool] = None
+        # The journal on disk ends in a torn line, which appends must not extend
+        self._torn = False
+
+    def _read_entries(self) -> Optional[Dict[str, str]]:
+        """
+        Read the journal on disk.
+
+        Returns:
+            Recorded hashes by path, or None if there is no usable journal for
+            this fingerprint
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            return None
+        lines = text.splitlines()
+        if not lines:
+            return None
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            return None
+        if not isinstance(header, dict):
+            return None
+        if header.get("fingerprint") != self.fingerprint:
+            logger.warning("Generation journal belongs to a different template or context; starting over")
+            return None
+        entries: Dict[str, str] = {}
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A torn line from an interrupted write
+                continue
+            if not isinstance(record, dict):
+                continue
+            path, sha256 = record.get("path"), record.get("sha256")
+            if isinstance(path, str) and isinstance(sha256, str):
+                entries[path] = sha256
+        self._torn = not text.endswith("\n")
+        return entries
+
+    def start(self, resume: bool = False) -> None:
+        """
+        Prepare the journal for appending.
+
+        In resume mode the existing journal is kept and each recorded file is
+        verified against the output directory; only intact files are added to
+        ``completed``. Otherwise any existing journal is replaced. The file is
+        opened on the first record, so nothing is created if nothing is written.
+
+        Args:
+            resume: Whether to resume from an existing journal
+        """
+        entries = self._read_entries() if resume else None
+        if entries is None:
+            self._append = False
+            return
+
+        for rel_path, expected in entries.items():
+            target = self.output_dir / rel_path
+            try:
+                if hash_file(target) == expected:
+                    self.completed[rel_path] = expected
+            except OSError:
+                continue
+        logger.info(f"Resuming generation: {len(self.completed)} of {len(entries)} journaled files verified")
+        self._append = True
+
+    def _write_line(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def record(self, rel_path: str, sha256: str) -> None:
+        """
+        Append a completed file to the journal.
+
+        Args:
+            rel_path: Output path relative to the project, ``/``-separated
+            sha256: Hex SHA-256 of the file's content
+        """
+        if self._append is None:
+            raise RuntimeError("Generation journal has not been started")
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self._append:
+                self._file = open(self.path, "a", encoding="utf-8")
+                if self._torn:
+                    self._file.write("\n")
+                    self._torn = False
+            else:
+                self._file = open(self.path, "w", encoding="utf-8")
+                self._write_line({"fingerprint": self.fingerprint})
+        self._write_line({"path": rel_path, "sha256": sha256})
+
+    def close(self) -> None:
+        """Close the journal, keeping it on disk for a later resume."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._append = True
+
+    def finish(self) -> None:
+        """Close and remove the journal after a successful generation."""
+        self.close()
+        if self._append is None:
+            return
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        try:
+            self.path.parent.rmdir()
+        except OSError:
+            pass
+
+
+__all__ = ["GenerationJournal", "JOURNAL_PATH", "context_fingerprint", "hash_file"]
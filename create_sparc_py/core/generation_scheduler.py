@@ -0,0 +1,223 @@
+"""
+Bounded scheduling of concurrent project generations.
+
+This module provides the ByteBudget class, which limits how many bytes of
+template content may be held in memory at once across all running
+generations, and the GenerationScheduler class, which runs generations on a
+thread pool bounded by task count and by that byte budget.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+# Default limits, sized for small CI runners
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_INFLIGHT_BYTES = 64 * 1024 * 1024
+
+
+class ByteBudget:
+    """
+    Counting limit on in-flight bytes, shared by concurrent renderers.
+
+    Renderers reserve the size of a file before reading it and release the
+    reservation once the output is written. A reservation blocks while it
+    would push the total over the limit, which applies backpressure to the
+    render stage. A single reservation larger than the whole budget is let
+    through once nothing else is in flight, so oversized files cannot
+    deadlock.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_INFLIGHT_BYTES):
+        """
+        Initialize the ByteBudget.
+
+        Args:
+            max_bytes: Maximum number of bytes that may be reserved at once
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._peak = 0
+        self._waiting = 0
+
+    def acquire(self, nbytes: int) -> None:
+        """
+        Reserve bytes, blocking until they fit in the budget.
+
+        Args:
+            nbytes: Number of bytes to reserve
+        """
+        with self._cond:
+            self._waiting += 1
+            try:
+                while self._inflight and self._inflight + nbytes > self.max_bytes:
+                    self._cond.wait()
+            finally:
+                self._waiting -= 1
+            self._inflight += nbytes
+            self._peak = max(self._peak, self._inflight)
+
+    def release(self, nbytes: int) -> None:
+        """
+        Return reserved bytes to the budget and wake blocked renderers.
+
+        Args:
+            nbytes: Number of bytes previously reserved
+        """
+        with self._cond:
+            self._inflight -= nbytes
+            self._cond.notify_all()
+
+    @contextmanager
+    def reserve(self, nbytes: int) -> Iterator[None]:
+        """
+        Reserve bytes for the duration of a with-block.
+
+        Args:
+            nbytes: Number of bytes to reserve
+        """
+        self.acquire(nbytes)
+        try:
+            yield
+        finally:
+            self.release(nbytes)
+
+    def gauges(self) -> Dict[str, int]:
+        """
+        Get the current budget gauges.
+
+        Returns:
+            Dictionary with in-flight, peak, limit and waiting counts
+        """
+        with self._cond:
+            return {
+                "inflight_bytes": self._inflight,
+                "peak_inflight_bytes": self._peak,
+                "max_inflight_bytes": self.max_bytes,
+                "render_waiters": self._waiting,
+            }
+
+
+class GenerationScheduler:
+    """
+    Runs project generations concurrently within task and memory limits.
+
+    At most ``max_workers`` generations run at once, all drawing on one
+    ByteBudget. If ``max_pending`` is set, submit() blocks once that many
+    generations are queued, so producers are throttled as well.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[..., bool],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_inflight_bytes: int = DEFAULT_MAX_INFLIGHT_BYTES,
+        max_pending: Optional[int] = None,
+    ):
+        """
+        Initialize the GenerationScheduler.
+
+        Args:
+            generate: Callable that generates one project; it receives the
+                      submitted keyword arguments plus ``memory_budget``
+            max_workers: Maximum number of generations running at once
+            max_inflight_bytes: Byte budget shared by all running generations
+            max_pending: Maximum number of queued generations, or None for no limit
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        self._generate = generate
+        self.max_workers = max_workers
+        self.budget = ByteBudget(max_inflight_bytes)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sparc-gen")
+        self._pending_slots = threading.BoundedSemaphore(max_pending) if max_pending else None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+
+    def submit(self, **kwargs: Any) -> "Future[bool]":
+        """
+        Queue a generation.
+
+        Args:
+            **kwargs: Keyword arguments for the generate callable
+
+        Returns:
+            Future resolving to the generation result
+        """
+        if self._pending_slots is not None:
+            self._pending_slots.acquire()
+        with self._lock:
+            self._queued += 1
+        return self._executor.submit(self._run, kwargs)
+
+    def _run(self, kwargs: Dict[str, Any]) -> bool:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        if self._pending_slots is not None:
+            self._pending_slots.release()
+        ok = False
+        try:
+            ok = bool(self._generate(memory_budget=self.budget, **kwargs))
+            return ok
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                if not ok:
+                    self._failed += 1
+
+    def gauges(self) -> Dict[str, int]:
+        """
+        Get queue-depth and memory gauges.
+
+        Returns:
+            Dictionary of gauge names to current values
+        """
+        with self._lock:
+            gauges = {
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "max_workers": self.max_workers,
+            }
+        gauges.update(self.budget.gauges())
+        if resource is not None:
+            # ru_maxrss is KiB on Linux and bytes on macOS; reported as-is
+            gauges["max_rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return gauges
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting work and optionally wait for queued generations.
+
+        Args:
+            wait: Whether to block until all generations have finished
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "GenerationScheduler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown(wait=True)
+
+
+__all__ = ["ByteBudget", "GenerationScheduler", "DEFAULT_MAX_WORKERS", "DEFAULT_MAX_INFLIGHT_BYTES"]
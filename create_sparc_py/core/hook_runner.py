@@ -0,0 +1,239 @@
+"""
+Post-processing hooks for generated projects.
+
+This module provides the HookRunner class, which runs the ``hooks`` declared
+in a template's ``template.json`` once the project files have been written.
+Hooks form a dependency graph through their ``needs`` lists; every hook whose
+dependencies have succeeded is started immediately on a bounded pool of
+subprocesses, so independent steps such as ``git init`` and venv creation
+run concurrently::
+
+    "hooks": [
+        {"name": "git", "command": ["git", "init", "-q"]},
+        {"name": "venv", "command": "python -m venv .venv", "timeout": 120},
+        {"name": "pre-commit", "command": "pre-commit install", "needs": ["git"],
+         "when": "use_pre_commit", "optional": true}
+    ]
+
+Each hook runs in the project directory with a timeout (``timeout``, in
+seconds), and its exit code, captured output and duration are reported.
+``when`` takes the same conditions as template rules. A hook whose
+dependency did not succeed is skipped. A dependency disabled by its
+``when`` condition is passed over: its dependents wait for its own
+dependencies instead, so ``"needs": ["pre-commit"]`` above still runs after
+``git`` when ``use_pre_commit`` is off. Failures of hooks marked
+``optional`` are reported but do not fail the generation.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import shlex
+import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from create_sparc_py.core.template_rules import compile_condition
+from create_sparc_py.utils import logger
+
+DEFAULT_HOOK_TIMEOUT = 300
+DEFAULT_MAX_WORKERS = 4
+
+
+def compile_hooks(hooks: Optional[List[Dict[str, Any]]], context: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Validate hook declarations and resolve their conditions.
+
+    Args:
+        hooks: Hook dictionaries from ``template.json``
+        context: Rendering context used to evaluate ``when`` conditions
+
+    Returns:
+        Normalized hooks in declaration order, each with 'name', 'command',
+        'needs', 'timeout', 'optional' and 'enabled' keys
+
+    Raises:
+        ValueError: If a hook is malformed, names are duplicated, a dependency
+                    is unknown or the dependencies contain a cycle
+    """
+    if hooks is None:
+        return []
+    if not isinstance(hooks, list):
+        raise ValueError("Template 'hooks' must be a list")
+    compiled: List[Dict[str, Any]] = []
+    names = set()
+    for hook in hooks:
+        if not isinstance(hook, dict) or not hook.get("name") or not hook.get("command"):
+            raise ValueError(f"Hook needs a 'name' and a 'command': {hook!r}")
+        name = hook["name"]
+        if name in names:
+            raise ValueError(f"Duplicate hook name: {name}")
+        names.add(name)
+        command = hook["command"]
+        if isinstance(command, str):
+            command = shlex.split(command)
+        if not isinstance(command, list) or not all(isinstance(arg, str) for arg in command):
+            raise ValueError(f"Hook '{name}' command must be a string or a list of strings")
+        needs = hook.get("needs", [])
+        if isinstance(needs, str):
+            needs = [needs]
+        compiled.append(
+            {
+                "name": name,
+                "command": command,
+                "needs": list(needs),
+                "timeout": hook.get("timeout", DEFAULT_HOOK_TIMEOUT),
+                "optional": bool(hook.get("optional", False)),
+                "enabled": compile_condition(hook.get("when"))(context),
+            }
+        )
+
+    for hook in compiled:
+        unknown = [dep for dep in hook["needs"] if dep not in names]
+        if unknown:
+            raise ValueError(f"Hook '{hook['name']}' needs unknown hooks: {', '.join(unknown)}")
+
+    # Kahn's algorithm, only to reject cycles up front
+    remaining = {hook["name"]: set(hook["needs"]) for hook in compiled}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Hook dependencies contain a cycle: {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return compiled
+
+
+class HookRunner:
+    """
+    Runs post-processing hooks concurrently in dependency order.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Initialize the HookRunner.
+
+        Args:
+            max_workers: Maximum number of hook subprocesses running at once
+        """
+        self.max_workers = max_workers
+
+    @staticmethod
+    def _run_hook(hook: Dict[str, Any], cwd: str) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            "name": hook["name"],
+            "command": hook["command"],
+            "returncode": None,
+            "stdout": "",
+            "stderr": "",
+        }
+        start = time.perf_counter()
+        try:
+            completed = subprocess.run(
+                hook["command"],
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                timeout=hook["timeout"],
+            )
+            result.update(
+                status="success" if completed.returncode == 0 else "failed",
+                returncode=completed.returncode,
+                stdout=completed.stdout,
+                stderr=completed.stderr,
+            )
+        except subprocess.TimeoutExpired as e:
+            result.update(
+                status="timeout",
+                stdout=e.stdout.decode(errors="replace") if isinstance(e.stdout, bytes) else (e.stdout or ""),
+                stderr=f"Timed out after {hook['timeout']}s",
+            )
+        except OSError as e:
+            result.update(status="failed", stderr=str(e))
+        result["duration"] = time.perf_counter() - start
+        return result
+
+    def run(self, hooks: List[Dict[str, Any]], cwd: Union[str, Path]) -> List[Dict[str, Any]]:
+        """
+        Run compiled hooks.
+
+        Args:
+            hooks: Hooks from compile_hooks
+            cwd: Directory to run the hooks in (the generated project)
+
+        Returns:
+            One result per hook, in declaration order. Each result has 'name',
+            'status' (success, failed, timeout or skipped), 'optional',
+            'returncode', 'stdout', 'stderr' and 'duration' keys.
+        """
+        cwd = str(cwd)
+        by_name = {hook["name"]: hook for hook in hooks}
+
+        def enabled_needs(name: str) -> List[str]:
+            # Disabled dependencies are replaced by their own dependencies
+            needs: List[str] = []
+            for dep in by_name[name]["needs"]:
+                for need in [dep] if by_name[dep]["enabled"] else enabled_needs(dep):
+                    if need not in needs:
+                        needs.append(need)
+            return needs
+
+        needs = {name: enabled_needs(name) for name in by_name}
+        results: Dict[str, Dict[str, Any]] = {}
+        pending = dict(by_name)
+        running: Dict[Future, str] = {}
+
+        def skip(name: str, reason: str) -> None:
+            results[name] = {
+                "name": name,
+                "command": by_name[name]["command"],
+                "status": "skipped",
+                "returncode": None,
+                "stdout": "",
+                "stderr": reason,
+                "duration": 0.0,
+            }
+            del pending[name]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sparc-hook") as executor:
+            while pending or running:
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for name, hook in list(pending.items()):
+                        if not hook["enabled"]:
+                            skip(name, "Condition not met")
+                            progressed = True
+                            continue
+                        blocked = [
+                            dep for dep in needs[name] if dep in results and results[dep]["status"] != "success"
+                        ]
+                        if blocked:
+                            skip(name, f"Dependency did not succeed: {', '.join(blocked)}")
+                            progressed = True
+                        elif all(dep in results for dep in needs[name]):
+                            logger.verbose(f"Running hook '{name}': {' '.join(hook['command'])}")
+                            running[executor.submit(self._run_hook, hook, cwd)] = name
+                            del pending[name]
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results[running.pop(future)] = result
+                    logger.verbose(f"Hook '{result['name']}' {result['status']} in {result['duration']:.2f}s")
+
+        ordered = []
+        for hook in hooks:
+            result = results[hook["name"]]
+            result["optional"] = hook["optional"]
+            ordered.append(result)
+        return ordered
+
+
+__all__ = ["HookRunner", "compile_hooks", "DEFAULT_HOOK_TIMEOUT", "DEFAULT_MAX_WORKERS"]
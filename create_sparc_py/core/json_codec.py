@@ -0,0 +1,225 @@
+"""
+JSON encoding and decoding for create-sparc-py.
+
+All configuration files, MCP configurations and registry payloads are
+parsed and serialized through this module. It uses the fastest library
+available:
+
+- ``orjson`` for decoding and encoding, if installed;
+- otherwise ``msgspec`` for decoding, if installed;
+- otherwise the standard library ``json`` module.
+
+The output of dumps is identical whichever library is used, so files
+written by different installations do not churn. Where the fast encoder
+would format a document differently from ``json.dumps`` (non-ASCII text,
+which ``json.dumps`` escapes; floats that ``json.dumps`` writes with an
+exponent; non-string keys; subclasses of built-in types), the document is
+encoded with the standard library instead. The one difference left is
+``NaN`` and infinite floats, which are not valid JSON and which ``orjson``
+writes as ``null``.
+
+Likewise, documents the fast decoders do not handle like ``json.loads``
+(integers beyond 64 bits, ``NaN``, encodings other than UTF-8) are decoded
+with the standard library, which also produces the error messages for
+invalid JSON.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# Documents are scanned with every digit mapped to 0, which is much faster
+# than a regular expression over megabytes of JSON
+_MASK_DIGITS = bytes.maketrans(b"123456789", b"000000000")
+# Integers this long may not fit in 64 bits, which the fast decoders turn
+# into floats or reject
+_LONG_NUMBER = b"0" * 19
+
+Decoder = Callable[[Union[str, bytes]], Any]
+
+_backend = "json"
+_decode: Optional[Decoder] = None
+_decode_errors: Tuple[Type[BaseException], ...] = ()
+_encode: Optional[Callable[..., bytes]] = None
+
+
+def available_backends() -> List[str]:
+    """
+    List the JSON libraries that can be used.
+
+    Returns:
+        Backend names, fastest first; 'json' is always available
+    """
+    backends = []
+    if orjson is not None:
+        backends.append("orjson")
+    if msgspec is not None:
+        backends.append("msgspec")
+    backends.append("json")
+    return backends
+
+
+def backend() -> str:
+    """
+    Get the name of the JSON library in use.
+
+    Returns:
+        'orjson', 'msgspec' or 'json'
+    """
+    return _backend
+
+
+def use_backend(name: str) -> None:
+    """
+    Select the JSON library to use.
+
+    Args:
+        name: 'orjson', 'msgspec' or 'json'
+
+    Raises:
+        ValueError: If the library is not installed
+    """
+    global _backend, _decode, _decode_errors, _encode
+    if name not in available_backends():
+        raise ValueError(f"JSON backend '{name}' is not available; available: {', '.join(available_backends())}")
+    _backend = name
+    if name == "orjson":
+        _decode, _decode_errors, _encode = orjson.loads, (orjson.JSONDecodeError,), orjson.dumps
+    elif name == "msgspec":
+        _decode, _decode_errors, _encode = msgspec.json.decode, (msgspec.DecodeError,), None
+    else:
+        _decode, _decode_errors, _encode = None, (), None
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        data: JSON text, or its bytes (UTF-8, UTF-16 or UTF-32)
+
+    Returns:
+        The decoded value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if _decode is not None:
+        raw = data.encode("utf-8", "surrogatepass") if isinstance(data, str) else data
+        if _LONG_NUMBER not in raw.translate(_MASK_DIGITS):
+            try:
+                return _decode(raw)
+            except _decode_errors:
+                pass
+    return json.loads(data)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """
+    Decode a JSON file.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        The decoded value
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dumps(obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+    """
+    Encode a value as JSON, formatted exactly as ``json.dumps`` would.
+
+    Args:
+        obj: Value to encode
+        indent: Indentation, or None for a single line
+        sort_keys: Whether to sort dictionary keys
+
+    Returns:
+        The JSON text
+
+    Raises:
+        TypeError: If the value cannot be encoded
+    """
+    # Only the indented form is encoded in pure Python by json; its
+    # single-line form already uses json's C encoder
+    if _encode is not None and indent == 2:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_SUBCLASS
+        option |= orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            encoded = _encode(obj, option=option)
+        except TypeError:
+            pass
+        else:
+            if _formatted_like_json(encoded):
+                return encoded.decode("ascii")
+    return json.dumps(obj, indent=indent, sort_keys=sort_keys)
+
+
+def dumps_line(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Encode a value as one line of compact JSON, for streams of JSON records.
+
+    Unlike dumps, the output is not formatted like ``json.dumps``: it has no
+    spaces after separators, and non-ASCII text is written as UTF-8.
+
+    Args:
+        obj: Value to encode
+        default: Called with values JSON has no type for; returns an encodable value
+
+    Returns:
+        The UTF-8 encoded JSON, ending with a newline
+
+    Raises:
+        TypeError: If the value cannot be encoded
+    """
+    if _encode is not None:
+        try:
+            return _encode(obj, default=default, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # Integers beyond 64 bits and non-string keys
+            pass
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default) + "\n").encode("utf-8")
+
+
+def _formatted_like_json(encoded: bytes) -> bool:
+    """
+    Check that fast encoder output is what json.dumps would have written.
+
+    json.dumps escapes non-ASCII and DEL characters, writes exponents with a
+    sign and at least two digits (1e+16, 1e-07) and writes floats below
+    0.0001 with an exponent. A false negative, e.g. for a string that looks
+    like a float, only costs encoding the document again with json.
+    """
+    if not encoded.isascii() or b"\x7f" in encoded or b"0.0000" in encoded:
+        return False
+    masked = encoded.translate(_MASK_DIGITS)
+    return b"0e0" not in masked and b"0e-" not in masked
+
+
+use_backend(available_backends()[0])
+
+
+__all__ = ["available_backends", "backend", "use_backend", "loads", "load_file", "dumps", "dumps_line"]
@@ -0,0 +1,206 @@
+"""
+JSON documents shared safely between processes.
+
+This module provides the JsonDocument class, used for the user's
+``config.json`` and a project's ``.roo/mcp.json``, which parallel CI jobs and
+concurrent wizard runs may write at the same time.
+
+- Writes take an exclusive ``fcntl`` advisory lock, write a temporary file
+  and rename it over the document, so a document is never seen half-written
+  and writers never interleave. The lock is an empty file in
+  ``~/.create-sparc-py/locks`` named after the document's resolved path, so
+  no lock file is left in the project; deleting one is harmless.
+- Reads take no lock: the rename makes every read a consistent snapshot, so
+  read-heavy commands never wait for a writer.
+- Writes are checked optimistically. A writer passes the version it read and,
+  if the document changed since then, its own changes relative to what it
+  read are merged into the current document instead of overwriting the other
+  writer's changes.
+
+A version is the ``(st_mtime_ns, st_size, st_ino)`` of the file; each write
+replaces the file, so the inode changes even when the timestamp does not.
+On platforms without ``fcntl`` writes are still atomic but not serialized.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import hashlib
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, Tuple, Union
+
+from create_sparc_py.core import json_codec
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+Version = Tuple[int, int, int]
+# Sentinel for JsonDocument.write: overwrite whatever version is on disk
+ANY_VERSION = object()
+_DELETED = object()
+
+
+def lock_dir() -> Path:
+    """
+    Get the directory holding the write locks of all documents.
+
+    Returns:
+        Path to the lock directory
+    """
+    return Path.home() / ".create-sparc-py" / "locks"
+
+
+class StaleDocumentError(RuntimeError):
+    """Raised when a document changed since it was read and cannot be merged."""
+
+
+def merge_changes(current: Any, base: Any, ours: Any) -> Any:
+    """
+    Apply the changes between base and ours to current.
+
+    Dictionaries are merged key by key: keys we left as they were in base
+    keep their current value, keys we removed are removed, and keys we
+    changed take our value (merging recursively if all three are
+    dictionaries). Any other value we changed replaces the current one.
+
+    Args:
+        current: Document as it is now
+        base: Document as it was when we read it
+        ours: Document as we want to write it
+
+    Returns:
+        The merged document
+    """
+    if ours == base:
+        return current
+    if not (isinstance(current, dict) and isinstance(base, dict) and isinstance(ours, dict)):
+        return ours
+    merged = dict(current)
+    for key in base.keys() | ours.keys():
+        base_value = base.get(key, _DELETED)
+        our_value = ours.get(key, _DELETED)
+        if our_value == base_value:
+            continue
+        if our_value is _DELETED:
+            merged.pop(key, None)
+        elif key in merged and base_value is not _DELETED:
+            merged[key] = merge_changes(merged[key], base_value, our_value)
+        else:
+            merged[key] = our_value
+    return merged
+
+
+class JsonDocument:
+    """
+    A JSON file with lock-free reads and locked, atomic, version-checked writes.
+    """
+
+    def __init__(self, path: Union[str, Path], indent: Optional[int] = 2):
+        """
+        Initialize the JsonDocument.
+
+        Args:
+            path: Path of the JSON file
+            indent: Indentation of the written JSON
+        """
+        self.path = Path(path)
+        key = hashlib.sha256(os.fsencode(self.path.resolve())).hexdigest()
+        self.lock_path = lock_dir() / f"{key[:32]}.lock"
+        self.indent = indent
+
+    def version(self) -> Optional[Version]:
+        """
+        Get the version of the document on disk.
+
+        Returns:
+            The version, or None if the file does not exist
+        """
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def read(self, default: Any = None) -> Tuple[Any, Optional[Version]]:
+        """
+        Read a consistent snapshot of the document without locking.
+
+        Args:
+            default: Value returned if the file does not exist
+
+        Returns:
+            Tuple of (data, version); version is None if the file does not exist
+
+        Raises:
+            ValueError: If the file is not valid JSON
+        """
+        try:
+            with open(self.path, "rb") as f:
+                st = os.fstat(f.fileno())
+                data = json_codec.loads(f.read())
+        except FileNotFoundError:
+            return default, None
+        return data, (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the document's exclusive write lock."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def write(self, data: Any, expected_version: Any = ANY_VERSION, base: Any = None) -> Tuple[Any, Version]:
+        """
+        Write the document.
+
+        Args:
+            data: Document to write
+            expected_version: Version the caller read data from (None if the
+                              file did not exist), or ANY_VERSION to
+                              overwrite unconditionally
+            base: The document as the caller read it. If the document changed
+                  since expected_version, the caller's changes from base to
+                  data are merged into the current document (see
+                  merge_changes) and the result is written instead.
+
+        Returns:
+            Tuple of (data written, its version)
+
+        Raises:
+            StaleDocumentError: If the document changed since expected_version
+                                and no base was given to merge from
+            ValueError: If the document changed and is not valid JSON
+        """
+        with self._locked():
+            if expected_version is not ANY_VERSION and self.version() != expected_version:
+                if base is None:
+                    raise StaleDocumentError(f"{self.path} was changed by another process")
+                current, _ = self.read()
+                data = merge_changes(current, base, data)
+            tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(json_codec.dumps(data, indent=self.indent))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                if tmp_path.exists():
+                    os.remove(tmp_path)
+                raise
+            return data, self.version()
+
+
+__all__ = ["JsonDocument", "StaleDocumentError", "merge_changes", "lock_dir", "ANY_VERSION", "Version"]
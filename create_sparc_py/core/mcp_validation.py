@@ -45,6 +45,27 @@ def validate_permissions(
     return {"valid": True}
 
 
+_SENSITIVE_PATTERNS = [
+    re.compile(r"^[A-Za-z0-9-_]{20,}$"),
+    re.compile(r"^sk-[A-Za-z0-9]{20,}$"),
+    re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"),
+]
+SENSITIVE_ARGS_ERROR = (
+    "Potential sensitive information detected in arguments. Use environment variable references instead."
+)
+
+
+def has_sensitive_args(args: Any) -> bool:
+    """Check whether server arguments look like they contain secrets rather than env var references."""
+    if not isinstance(args, list):
+        return False
+    for arg in args:
+        if isinstance(arg, str) and not arg.startswith("${env:"):
+            if any(pattern.match(arg) for pattern in _SENSITIVE_PATTERNS):
+                return True
+    return False
+
+
 def validate_server_config(server_config: Dict[str, Any]) -> Dict[str, Any]:
     """Validate server configuration."""
     errors = []
@@ -52,21 +73,8 @@ def validate_server_config(server_config: Dict[str, Any]) -> Dict[str, Any]:
         errors.append("Server command is required")
     if not isinstance(server_config.get("args"), list):
         errors.append("Server arguments must be an array")
-    sensitive_patterns = [
-        re.compile(r"^[A-Za-z0-9-_]{20,}$"),
-        re.compile(r"^sk-[A-Za-z0-9]{20,}$"),
-        re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"),
-    ]
-    args = server_config.get("args", [])
-    if isinstance(args, list):
-        for arg in args:
-            if isinstance(arg, str):
-                for pattern in sensitive_patterns:
-                    if pattern.match(arg) and not arg.startswith("${env:"):
-                        errors.append(
-                            "Potential sensitive information detected in arguments. Use environment variable references instead."
-                        )
-                        break
+    if has_sensitive_args(server_config.get("args", [])):
+        errors.append(SENSITIVE_ARGS_ERROR)
     if "alwaysAllow" in server_config and not isinstance(server_config["alwaysAllow"], list):
         errors.append("alwaysAllow must be an array of permission strings")
     return {"valid": len(errors) == 0, "errors": errors}
@@ -1,7 +1,9 @@
-import json
+import copy
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from create_sparc_py.core.json_document import JsonDocument
+
 CONFIG_PATH = Path(".roo/mcp.json")
 
 
@@ -12,18 +14,18 @@ class MCPWizard:
 
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or CONFIG_PATH
+        self._document = JsonDocument(self.config_path)
         self.config = self.load_config()
 
     def load_config(self) -> Dict[str, Any]:
-        if self.config_path.exists():
-            with open(self.config_path, "r") as f:
-                return json.load(f)
-        return {"mcpServers": {}}
+        config, self._version = self._document.read({"mcpServers": {}})
+        self._base = copy.deepcopy(config)
+        return config
 
     def save_config(self):
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, "w") as f:
-            json.dump(self.config, f, indent=2)
+        # Servers changed by another wizard since load_config are kept
+        self.config, self._version = self._document.write(self.config, self._version, self._base)
+        self._base = copy.deepcopy(self.config)
 
     def run(self):
         """
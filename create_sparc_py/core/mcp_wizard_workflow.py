@@ -9,7 +9,11 @@ from .mcp_validation import (
     validate_permissions,
     validate_server_config,
     validate_env_var_reference,
+    has_sensitive_args,
+    SENSITIVE_ARGS_ERROR,
 )
+from . import json_codec
+from .schema_validation import validate as validate_schema
 from .mcp_security import MCPSecurity
 
 
@@ -78,35 +82,37 @@ class MCPWizardWorkflow:
         try:
             if not self.mcp_config_path.exists():
                 return {"success": True, "servers": []}
-            import json
-
-            with open(self.mcp_config_path, "r") as f:
-                config = json.load(f)
+            config = json_codec.load_file(self.mcp_config_path)
             servers = config.get("mcpServers", {})
             return {"success": True, "servers": list(servers.keys()), "details": servers}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     def validate_configuration(self) -> Dict[str, Any]:
-        """Validate the MCP configuration file using advanced validation logic."""
+        """Validate the MCP configuration file against the MCP schema and check it for exposed secrets."""
         try:
-            import json
-
             if not self.mcp_config_path.exists():
                 return {"success": False, "errors": ["Config file does not exist."]}
-            with open(self.mcp_config_path, "r") as f:
-                config = json.load(f)
-            errors = []
-            if "mcpServers" not in config or not isinstance(config["mcpServers"], dict):
-                errors.append("Missing or invalid 'mcpServers' key.")
-            for server_id, server in config.get("mcpServers", {}).items():
-                id_result = validate_server_id(server_id)
-                if not id_result["valid"]:
-                    errors.append(f"Server ID '{server_id}': {id_result['error']}")
-                server_result = validate_server_config(server)
-                if not server_result["valid"]:
-                    for err in server_result["errors"]:
-                        errors.append(f"Server '{server_id}': {err}")
+            config = json_codec.load_file(self.mcp_config_path)
+            errors = validate_schema("mcp", config)
+            servers = config.get("mcpServers") if isinstance(config, dict) else None
+            if isinstance(servers, dict):
+                for server_id, server in servers.items():
+                    if isinstance(server, dict) and has_sensitive_args(server.get("args")):
+                        errors.append(f"Server '{server_id}': {SENSITIVE_ARGS_ERROR}")
+            return {"success": len(errors) == 0, "errors": errors}
+        except Exception as e:
+            return {"success": False, "errors": [str(e)]}
+
+    def validate_roomodes(self) -> Dict[str, Any]:
+        """Validate the .roomodes file against the custom modes schema; an empty file is valid."""
+        try:
+            if not self.roomodes_path.exists():
+                return {"success": False, "errors": [".roomodes file does not exist."]}
+            content = self.roomodes_path.read_text(encoding="utf-8")
+            if not content.strip():
+                return {"success": True, "errors": []}
+            errors = validate_schema("roomodes", json_codec.loads(content))
             return {"success": len(errors) == 0, "errors": errors}
         except Exception as e:
             return {"success": False, "errors": [str(e)]}
@@ -163,14 +169,11 @@ class MCPWizardWorkflow:
 
     def audit_security(self, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Perform a security audit on the MCP configuration using MCPSecurity."""
-        import json
-
         config = None
         try:
             if not self.mcp_config_path.exists():
                 return {"success": False, "error": "Config file does not exist."}
-            with open(self.mcp_config_path, "r") as f:
-                config = json.load(f)
+            config = json_codec.load_file(self.mcp_config_path)
         except Exception as e:
             return {"success": False, "error": f"Failed to load config: {e}"}
         results = self.security.audit_configuration(config)
@@ -180,15 +183,13 @@ class MCPWizardWorkflow:
 
     def validate_env_var_references(self, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Validate environment variable references in the MCP configuration."""
-        import json
         import os
 
         config = None
         try:
             if not self.mcp_config_path.exists():
                 return {"success": False, "error": "Config file does not exist."}
-            with open(self.mcp_config_path, "r") as f:
-                config = json.load(f)
+            config = json_codec.load_file(self.mcp_config_path)
         except Exception as e:
             return {"success": False, "error": f"Failed to load config: {e}"}
 
@@ -335,9 +336,9 @@ class MCPWizardWorkflow:
         return {"securedConfig": secured, "appliedFixes": applied_fixes}
 
     def calculate_integrity_hash(self, config: dict) -> str:
-        import hashlib, json
+        import hashlib
 
-        config_str = json.dumps(config, sort_keys=True)
+        config_str = json_codec.dumps(config, sort_keys=True)
         return hashlib.sha256(config_str.encode()).hexdigest()
 
     def verify_integrity(self, config: dict, expected_hash: str) -> bool:
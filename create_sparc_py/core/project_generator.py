@@ -10,13 +10,30 @@ https://github.com/ruvnet/rUv-dev.
 """
 
 import os
+import re
 import json
+import keyword
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 
 from create_sparc_py.utils import logger, fs_utils, path_utils
-from create_sparc_py.core.template_manager import template_manager
+from create_sparc_py.core.template_manager import TemplateManager, template_manager
+from create_sparc_py.core.project_index import ProjectIndex
 from create_sparc_py.core.config_manager import config_manager
+from create_sparc_py.core.hook_runner import HookRunner, compile_hooks
+from create_sparc_py.core.template_rules import compile_condition
+from create_sparc_py.core.venv_cache import VenvCache, DEFAULT_MAX_CACHE_BYTES
+from create_sparc_py.core.generation_journal import GenerationJournal, context_fingerprint
+from create_sparc_py.core.project_lock import store_base, write_lock
+from create_sparc_py.core.generation_scheduler import (
+    ByteBudget,
+    GenerationScheduler,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MAX_INFLIGHT_BYTES,
+)
+
+# Component templates live in this subdirectory of the templates directory
+COMPONENTS_DIR = "components"
 
 
 class ProjectGenerator:
@@ -29,7 +46,9 @@ class ProjectGenerator:
 
     def __init__(self):
         """Initialize the ProjectGenerator."""
-        pass
+        # Results of the hooks run by the most recent post_process call
+        self.last_hook_results: List[Dict[str, Any]] = []
+        self._component_manager: Optional[TemplateManager] = None
 
     def generate_project(
         self,
@@ -37,6 +56,8 @@ class ProjectGenerator:
         template_name: Optional[str] = None,
         output_dir: Optional[Union[str, Path]] = None,
         variables: Optional[Dict[str, Any]] = None,
+        memory_budget: Optional[ByteBudget] = None,
+        resume: bool = False,
     ) -> bool:
         """
         Generate a new project.
@@ -46,6 +67,9 @@ class ProjectGenerator:
             template_name: Name of the template to use (defaults to configured default)
             output_dir: Directory to create the project in (defaults to project_name)
             variables: Additional template variables
+            memory_budget: Optional byte budget shared with concurrent generations
+            resume: Continue an interrupted generation, re-rendering only files
+                    that its journal does not show as present and intact
 
         Returns:
             True if successful, False otherwise
@@ -84,15 +108,60 @@ class ProjectGenerator:
 
             # Apply template
             logger.info(f"Generating project '{project_name}' using template '{template_name}'")
-            template_manager.apply_template(template_name, str(output_dir), context)
+            journal = GenerationJournal(output_dir, context_fingerprint(template_name, context))
+            journal.start(resume=resume)
+            sources: Dict[str, str] = {}
+            source_hashes: Dict[str, str] = {}
+            stored_bases = set()
+
+            def on_write(written: Dict[str, Any]) -> None:
+                sources[written["path"]] = source_hashes[written["source"]] = written["source_sha256"]
+                # Merge bases are kept from the rendered text; files skipped on resume are read by write_lock
+                if written["path"] not in journal.completed:
+                    if written["content"] is not None:
+                        store_base(output_dir, written["sha256"], written["content"])
+                    stored_bases.add(written["path"])
+
+            try:
+                manifest = template_manager.apply_template(
+                    template_name,
+                    str(output_dir),
+                    context,
+                    memory_budget=memory_budget,
+                    journal=journal,
+                    on_write=on_write,
+                )
+            finally:
+                # Left on disk on failure or interrupt so a later run can resume
+                journal.close()
+            template_config = template_manager.get_template_config(template_name)
+            if manifest:
+                write_lock(
+                    output_dir,
+                    template_name,
+                    template_config.get("version"),
+                    context,
+                    manifest,
+                    sources,
+                    template_manager.get_template_digest(template_name, source_hashes),
+                    stored_bases,
+                )
+                # Directories inside the new project may have been resolved to another project
+                config_manager.project_root_resolver.invalidate()
+            journal.finish()
 
             # Additional project setup
             self._setup_additional_components(project_name, output_dir, variables)
 
             # Post-processing step
-            self.post_process(project_name, output_dir, variables)
-
-            return True
+            return self.post_process(
+                project_name,
+                output_dir,
+                variables,
+                hooks=template_config.get("hooks"),
+                context=context,
+                venv=template_config.get("venv"),
+            )
 
         except Exception as e:
             logger.error(f"Error generating project: {e}")
@@ -102,6 +171,198 @@ class ProjectGenerator:
                 traceback.print_exc()
             return False
 
+    def create_scheduler(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_inflight_bytes: int = DEFAULT_MAX_INFLIGHT_BYTES,
+        max_pending: Optional[int] = None,
+    ) -> GenerationScheduler:
+        """
+        Create a scheduler that runs generate_project concurrently.
+
+        Use it as a context manager, submit generate_project keyword arguments,
+        and read ``gauges()`` for queue depth and in-flight memory.
+
+        Args:
+            max_workers: Maximum number of generations running at once
+            max_inflight_bytes: Byte budget for template content being rendered
+            max_pending: Maximum number of queued generations, or None for no limit
+
+        Returns:
+            GenerationScheduler bound to this generator
+        """
+        return GenerationScheduler(
+            self.generate_project,
+            max_workers=max_workers,
+            max_inflight_bytes=max_inflight_bytes,
+            max_pending=max_pending,
+        )
+
+    def generate_projects(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_inflight_bytes: int = DEFAULT_MAX_INFLIGHT_BYTES,
+    ) -> List[bool]:
+        """
+        Generate several projects concurrently within task and memory limits.
+
+        Args:
+            jobs: generate_project keyword arguments, one dictionary per project
+            max_workers: Maximum number of generations running at once
+            max_inflight_bytes: Byte budget for template content being rendered
+
+        Returns:
+            Result of each generation, in the order of ``jobs``
+        """
+        with self.create_scheduler(max_workers, max_inflight_bytes, max_pending=max_workers * 2) as scheduler:
+            futures = [scheduler.submit(**job) for job in jobs]
+            results = [future.result() for future in futures]
+            gauges = scheduler.gauges()
+        logger.verbose(
+            f"Generated {gauges['completed'] - gauges['failed']}/{len(jobs)} projects "
+            f"(peak in-flight bytes: {gauges['peak_inflight_bytes']})"
+        )
+        return results
+
+    def _get_component_manager(self) -> TemplateManager:
+        """
+        Get the template manager for component templates.
+
+        Returns:
+            TemplateManager rooted at the ``components`` template directory
+        """
+        components_dir = os.path.join(template_manager.templates_dir, COMPONENTS_DIR)
+        if self._component_manager is None or self._component_manager.templates_dir != components_dir:
+            self._component_manager = TemplateManager(components_dir)
+        return self._component_manager
+
+    def list_component_types(self) -> List[str]:
+        """
+        List the component types that can be added to a project.
+
+        Returns:
+            Sorted component type names
+        """
+        return sorted(self._get_component_manager().list_templates())
+
+    def _package_dir(self, project_root: Path, project_name: str) -> Path:
+        """
+        Find the directory new modules go in: ``src/<package>``, ``src`` or the root.
+
+        Args:
+            project_root: Project root directory
+            project_name: Name of the project
+
+        Returns:
+            Package directory
+        """
+        src = project_root / "src"
+        package = src / project_name
+        if package.is_dir():
+            return package
+        return src if src.is_dir() else project_root
+
+    def add_component(self, component_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add a component to an existing project.
+
+        The component type's template writes a module into the project's
+        package directory and a test module into ``tests/``. The project
+        index is refreshed beforehand and updated with only the new files.
+
+        Args:
+            component_config: Dictionary with 'name', 'type', optional 'path'
+                              (directory for the module, relative to the
+                              project root; default: the package directory)
+                              and 'project_config' (from
+                              ConfigManager.find_project_config)
+
+        Returns:
+            Dictionary with 'name', 'type' and 'files' (created paths,
+            relative to the project root)
+
+        Raises:
+            ValueError: If the type is unknown, the name is invalid or a
+                        component with the name already exists
+            FileExistsError: If a file the component would create already exists
+        """
+        project_config = component_config["project_config"]
+        project_root = Path(project_config["project_root"]).resolve()
+        component_type = component_config.get("type") or "module"
+        name = component_config["name"]
+
+        available = self.list_component_types()
+        if component_type not in available:
+            raise ValueError(f"Unknown component type '{component_type}'; available: {', '.join(available)}")
+        module_name = re.sub(r"\W+", "_", name).strip("_").lower()
+        if not module_name.isidentifier() or keyword.iskeyword(module_name):
+            raise ValueError(f"Invalid component name: {name!r}")
+
+        index = ProjectIndex(project_root)
+        index.refresh()
+        if name in index.components:
+            raise ValueError(f"Component '{name}' already exists")
+
+        project_name = project_config.get("project_name") or project_root.name
+        if component_config.get("path"):
+            package_dir = (project_root / component_config["path"]).resolve()
+        else:
+            package_dir = self._package_dir(project_root, project_name)
+        if package_dir != project_root and project_root not in package_dir.parents:
+            raise ValueError(f"Component directory {package_dir} is outside the project {project_root}")
+        package_rel = package_dir.relative_to(project_root)
+        import_parts = [part for part in package_rel.parts if part != "src"]
+        context = {
+            "name": name,
+            "module_name": module_name,
+            "class_name": "".join(part.capitalize() for part in module_name.split("_")),
+            "project_name": project_name,
+            "import_path": ".".join([*import_parts, module_name]),
+        }
+
+        # Map each planned file to its place in the project before writing anything
+        manager = self._get_component_manager()
+        targets: Dict[str, str] = {}
+        for rel_path, src_file in manager.plan_template(component_type, context).items():
+            if rel_path == "template.json":
+                continue
+            top, _, rest = rel_path.partition("/")
+            if top == "package":
+                dest_rel = (package_rel / rest).as_posix()
+            else:
+                dest_rel = rel_path
+            if (project_root / dest_rel).exists():
+                raise FileExistsError(f"Component file already exists: {dest_rel}")
+            targets[dest_rel] = src_file
+
+        for dest_rel, src_file in targets.items():
+            dest = project_root / dest_rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(manager.render_file(src_file, context))
+
+        files = sorted(targets)
+        index.add_files(files)
+        index.register_component(name, component_type, files)
+        index.save()
+        return {"name": name, "type": component_type, "files": files}
+
+    def list_components(self, project_root: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Describe what is installed in a project, using its index.
+
+        Args:
+            project_root: Project root directory
+
+        Returns:
+            Dictionary with 'components' (name -> type and files), 'modules'
+            and 'tests' (sorted relative paths)
+        """
+        index = ProjectIndex(project_root)
+        index.refresh()
+        index.save()
+        return {"components": index.components, "modules": index.modules(), "tests": index.tests()}
+
     def _setup_additional_components(
         self,
         project_name: str,
@@ -116,26 +377,94 @@ class ProjectGenerator:
             output_dir: Project directory
             variables: Additional template variables
         """
-        # This method can be expanded to add more project setup steps, such as:
-        # - Setting up virtual environments
-        # - Initializing git repositories
-        # - Installing dependencies
-        # - Additional SPARC-specific structure
+        # Commands such as git init, venv creation and dependency installation
+        # are declared as template hooks and run by post_process. This method
+        # is for SPARC-specific structure that is not part of a template.
 
         # For now, just log completion
         logger.info(f"Project '{project_name}' generated successfully in {output_dir}")
 
-    def post_process(self, project_name: str, output_dir: Path, variables: Optional[Dict[str, Any]] = None) -> None:
+    def post_process(
+        self,
+        project_name: str,
+        output_dir: Path,
+        variables: Optional[Dict[str, Any]] = None,
+        hooks: Optional[List[Dict[str, Any]]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        venv: Optional[Dict[str, Any]] = None,
+    ) -> bool:
         """
-        Perform post-generation steps for the project (stub).
+        Perform post-generation steps for the project.
+
+        Materializes the template's virtual environment from the prebuilt venv
+        cache, then runs the template's post-processing hooks (git init,
+        pre-commit install, ...) concurrently in dependency order.
 
         Args:
             project_name: Name of the project
             output_dir: Project directory
             variables: Additional template variables
+            hooks: Hook declarations from the template's ``template.json``
+            context: Rendering context used to evaluate hook conditions
+            venv: The template's ``venv`` settings, e.g.
+                  ``{"path": ".venv", "requirements": "requirements.txt"}``
+
+        Returns:
+            True unless a non-optional hook failed, timed out or was skipped
+            because a dependency failed
+
+        Raises:
+            RuntimeError: If the virtual environment cannot be built
         """
-        # TODO: Implement symlink creation, dependency installation, etc.
         logger.info(f"Post-processing for project '{project_name}' in {output_dir}")
+        self.last_hook_results = []
+        if context is None:
+            context = {"project_name": project_name, **(variables or {})}
+        if venv and compile_condition(venv.get("when"))(context):
+            self._setup_venv(Path(output_dir), venv)
+        compiled = compile_hooks(hooks, context)
+        if not compiled:
+            return True
+
+        results = HookRunner().run(compiled, output_dir)
+        ok = True
+        for result in results:
+            if result["status"] == "success":
+                logger.verbose(f"Hook '{result['name']}' finished in {result['duration']:.2f}s")
+            elif result["status"] == "skipped" and result["stderr"] == "Condition not met":
+                logger.debug(f"Hook '{result['name']}' skipped: condition not met")
+            else:
+                report = logger.warning if result["optional"] else logger.error
+                report(f"Hook '{result['name']}' {result['status']}: {result['stderr'].strip()}")
+                ok = ok and result["optional"]
+        self.last_hook_results = results
+        return ok
+
+    def _setup_venv(self, output_dir: Path, venv: Dict[str, Any]) -> None:
+        """
+        Clone a prebuilt virtual environment into the project.
+
+        The environment is keyed on the running Python version and the
+        project's rendered requirements file, and is built offline from the
+        configured wheelhouse on a cache miss.
+
+        Args:
+            output_dir: Project directory
+            venv: The template's ``venv`` settings
+        """
+        target = output_dir / venv.get("path", ".venv")
+        if target.exists():
+            logger.warning(f"Virtual environment already exists, leaving it untouched: {target}")
+            return
+        requirements_file = output_dir / venv.get("requirements", "requirements.txt")
+        requirements = requirements_file.read_bytes() if requirements_file.exists() else b""
+        cache = VenvCache(
+            config_manager.get_venv_cache_dir(),
+            wheelhouse=config_manager.get_wheelhouse_dir(),
+            max_bytes=config_manager.get("venv_cache_max_bytes", DEFAULT_MAX_CACHE_BYTES),
+        )
+        cache.clone(cache.get(requirements), target)
+        logger.verbose(f"Virtual environment ready in {target}")
 
 
 # Create a singleton instance
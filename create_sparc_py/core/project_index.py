@@ -0,0 +1,262 @@
+"""
+Persistent index of a project's modules, tests and components.
+
+This module provides the ProjectIndex class, which keeps
+``<project>/.sparc/index`` up to date with the Python modules and tests in a
+project and the components added to it with ``add``.
+
+Only directories are tracked by modification time, so the index is brought
+up to date without walking the whole tree: adding, removing or renaming a
+file changes its directory's mtime, and only those directories are rescanned.
+New directories are scanned when they first appear. Files written by
+``add`` are recorded directly, so adding a component costs work proportional
+to the files it creates.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Union
+
+INDEX_PATH = Path(".sparc") / "index"
+INDEX_VERSION = 1
+# Directories that never hold project sources; hidden directories are skipped too
+SKIP_DIRS = frozenset({"venv", "node_modules", "__pycache__", "build", "dist"})
+
+
+def _parent(rel_path: str) -> str:
+    return rel_path.rpartition("/")[0]
+
+
+def _classify(rel_path: str) -> str:
+    """Return 'test' or 'module' for a ``.py`` path relative to the project."""
+    parts = rel_path.split("/")
+    name = parts[-1]
+    if name.startswith("test_") or name.endswith("_test.py") or "tests" in parts[:-1] or "test" in parts[:-1]:
+        return "test"
+    return "module"
+
+
+class ProjectIndex:
+    """
+    Index of the modules, tests and components of one project.
+
+    Paths are relative to the project root and ``/``-separated; the root
+    directory itself is ``""``.
+    """
+
+    def __init__(self, project_root: Union[str, Path]):
+        """
+        Initialize the ProjectIndex.
+
+        Args:
+            project_root: Root directory of the project
+        """
+        self.root = Path(project_root)
+        self.path = self.root / INDEX_PATH
+        self.dirs: Dict[str, int] = {}
+        self.files: Dict[str, str] = {}
+        self.components: Dict[str, Dict[str, Any]] = {}
+        self.loaded = False
+        self._dirty = False
+
+    def load(self) -> bool:
+        """
+        Load the index from disk.
+
+        Returns:
+            True if a usable index was loaded
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return False
+        self.dirs = data.get("dirs", {})
+        self.files = data.get("files", {})
+        self.components = data.get("components", {})
+        self.loaded = True
+        return True
+
+    def refresh(self) -> int:
+        """
+        Bring the index up to date with the project tree.
+
+        Loads the index if needed. Without an index on disk the whole tree is
+        scanned once; afterwards only directories whose mtime changed are.
+
+        Returns:
+            Number of directories scanned
+        """
+        if not self.loaded and not self.load():
+            self.dirs, self.files = {}, {}
+            self.loaded = True
+            return self._scan_tree("")
+        scanned = 0
+        # Sorted so that a parent is rescanned, and drops removed children, first
+        for rel_dir in sorted(self.dirs):
+            if rel_dir not in self.dirs:
+                continue
+            try:
+                mtime_ns = os.stat(self.root / rel_dir).st_mtime_ns
+            except OSError:
+                self._drop_dir(rel_dir)
+                continue
+            if mtime_ns != self.dirs[rel_dir]:
+                scanned += self._scan_dir(rel_dir)
+        return scanned
+
+    def _scan_dir(self, rel_dir: str) -> int:
+        """
+        Rescan the direct entries of one directory.
+
+        Returns:
+            Number of directories scanned, including new subdirectories
+        """
+        directory = self.root / rel_dir
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        mtime_ns = os.stat(directory).st_mtime_ns
+        py_files, subdirs = set(), set()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and entry.name not in SKIP_DIRS:
+                        subdirs.add(prefix + entry.name)
+                elif entry.name.endswith(".py"):
+                    py_files.add(prefix + entry.name)
+        self.dirs[rel_dir] = mtime_ns
+        self._dirty = True
+
+        for rel_path in [p for p in self.files if _parent(p) == rel_dir and p not in py_files]:
+            del self.files[rel_path]
+        for rel_path in py_files:
+            self.files.setdefault(rel_path, _classify(rel_path))
+        for sub in [d for d in self.dirs if d and _parent(d) == rel_dir and d not in subdirs]:
+            self._drop_dir(sub)
+        scanned = 1
+        for sub in subdirs:
+            if sub not in self.dirs:
+                scanned += self._scan_tree(sub)
+        return scanned
+
+    def _scan_tree(self, rel_dir: str) -> int:
+        """Scan a directory that is not yet indexed, and everything below it."""
+        scanned = 0
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            scanned += 1
+            directory = self.root / current
+            prefix = f"{current}/" if current else ""
+            try:
+                self.dirs[current] = os.stat(directory).st_mtime_ns
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith(".") and entry.name not in SKIP_DIRS:
+                                stack.append(prefix + entry.name)
+                        elif entry.name.endswith(".py"):
+                            self.files.setdefault(prefix + entry.name, _classify(prefix + entry.name))
+            except OSError:
+                self._drop_dir(current)
+        self._dirty = True
+        return scanned
+
+    def _drop_dir(self, rel_dir: str) -> None:
+        """Forget a directory and everything below it."""
+        prefix = f"{rel_dir}/"
+        for d in [d for d in self.dirs if d == rel_dir or d.startswith(prefix)]:
+            del self.dirs[d]
+        for p in [p for p in self.files if p.startswith(prefix)]:
+            del self.files[p]
+        self._dirty = True
+
+    def add_files(self, rel_paths: Iterable[str]) -> None:
+        """
+        Record files that were just written, without rescanning their directories.
+
+        The index should have been refreshed before the files were written,
+        so the only changes to their directories are the ones recorded here.
+
+        Args:
+            rel_paths: Paths of the written files, relative to the project root
+        """
+        touched = set()
+        for rel_path in rel_paths:
+            if rel_path.endswith(".py"):
+                self.files[rel_path] = _classify(rel_path)
+            parent = _parent(rel_path)
+            while parent not in touched:
+                touched.add(parent)
+                if not parent:
+                    break
+                parent = _parent(parent)
+        for rel_dir in touched:
+            self.dirs[rel_dir] = os.stat(self.root / rel_dir).st_mtime_ns
+        self._dirty = True
+
+    def register_component(self, name: str, component_type: str, files: List[str]) -> None:
+        """
+        Record a component added to the project.
+
+        Args:
+            name: Component name
+            component_type: Component type, e.g. 'module' or 'api'
+            files: Files created for the component
+        """
+        self.components[name] = {"type": component_type, "files": sorted(files), "added": time.time()}
+        self._dirty = True
+
+    def modules(self) -> List[str]:
+        """
+        List the project's Python modules.
+
+        Returns:
+            Sorted module paths
+        """
+        return sorted(p for p, kind in self.files.items() if kind == "module")
+
+    def tests(self) -> List[str]:
+        """
+        List the project's test modules.
+
+        Returns:
+            Sorted test module paths
+        """
+        return sorted(p for p, kind in self.files.items() if kind == "test")
+
+    def save(self) -> bool:
+        """
+        Write the index to disk if it changed.
+
+        Returns:
+            True if the index was written
+        """
+        if not self._dirty:
+            return False
+        if not self.path.parent.is_dir():
+            self.path.parent.mkdir(parents=True)
+            # Creating .sparc changed the root directory, but not its sources
+            if self.path.parent.parent == self.root and "" in self.dirs:
+                self.dirs[""] = os.stat(self.root).st_mtime_ns
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": INDEX_VERSION, "dirs": self.dirs, "files": self.files, "components": self.components},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        return True
+
+
+__all__ = ["ProjectIndex", "INDEX_PATH", "INDEX_VERSION", "SKIP_DIRS"]
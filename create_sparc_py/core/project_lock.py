@@ -0,0 +1,342 @@
+"""
+Project lockfile for generated projects.
+
+This module records which template produced a project and what it wrote.
+After generation, ``<project>/.sparc/lock.json`` holds the template name and
+version, the rendering context and its digest, and for every generated file
+the SHA-256, size and modification time of the output and the SHA-256 of the
+template source it was rendered from::
+
+    {
+      "lock_version": 1,
+      "template": {"name": "sparc", "version": "1.0.0", "sha256": "…"},
+      "context_sha256": "…",
+      "context": {"project_name": "demo", …},
+      "files": {"README.md": {"sha256": "…", "size": 812, "mtime_ns": …, "source_sha256": "…"}}
+    }
+
+The generated content of each text file is also kept, zlib-compressed, under
+``.sparc/base/<sha256>`` so that a later template upgrade can three-way merge
+it with the user's changes.
+
+project_status compares the lockfile against the working tree the way
+``git status`` uses its index: a file whose size and modification time match
+the recorded stat is clean without being read. Only files whose stat changed,
+or that are not older than the lockfile itself and so have an untrustworthy
+timestamp, are hashed. Files found clean by hashing have their recorded stat
+refreshed so the next check is stat-only again.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Any, Collection, Dict, Optional, Union
+
+from create_sparc_py.core.generation_journal import context_fingerprint, hash_file
+
+LOCK_PATH = Path(".sparc") / "lock.json"
+BASE_DIR = Path(".sparc") / "base"
+LOCK_VERSION = 1
+# Size of the leading block inspected to decide whether content is binary
+_SNIFF_SIZE = 8192
+
+
+def is_binary(content: bytes) -> bool:
+    """
+    Check whether content is binary, using the same test as template rendering.
+
+    Args:
+        content: File content
+
+    Returns:
+        True if the leading block contains a NUL byte
+    """
+    return b"\0" in content[:_SNIFF_SIZE]
+
+
+def file_entry(path: Union[str, Path], sha256: str, source_sha256: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build the lockfile entry for a file whose content matches sha256.
+
+    Args:
+        path: Path of the file in the project
+        sha256: Hex SHA-256 of the file's content
+        source_sha256: Hex SHA-256 of the template source it was rendered from
+
+    Returns:
+        Lockfile entry recording the hash and the file's current stat
+    """
+    st = os.stat(path)
+    entry = {"sha256": sha256, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    if source_sha256 is not None:
+        entry["source_sha256"] = source_sha256
+    return entry
+
+
+def store_base(project_dir: Union[str, Path], sha256: str, content: bytes) -> None:
+    """
+    Keep generated content so it can serve as a merge base.
+
+    Binary content is not stored, since it cannot be merged.
+
+    Args:
+        project_dir: Project directory
+        sha256: Hex SHA-256 of content
+        content: Generated file content
+    """
+    if is_binary(content):
+        return
+    path = Path(project_dir) / BASE_DIR / sha256
+    if path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(zlib.compress(content))
+    os.replace(tmp_path, path)
+
+
+def store_base_file(project_dir: Union[str, Path], sha256: str, path: Union[str, Path]) -> None:
+    """
+    Keep a generated file's content as a merge base, reading it only if needed.
+
+    Nothing is read if the base is already stored, and only the leading
+    block of a binary file is read.
+
+    Args:
+        project_dir: Project directory
+        sha256: Hex SHA-256 of the file's content
+        path: The generated file
+    """
+    if (Path(project_dir) / BASE_DIR / sha256).exists():
+        return
+    with open(path, "rb") as f:
+        head = f.read(_SNIFF_SIZE)
+        if is_binary(head):
+            return
+        store_base(project_dir, sha256, head + f.read())
+
+
+def load_base(project_dir: Union[str, Path], sha256: str) -> Optional[bytes]:
+    """
+    Load generated content stored by store_base.
+
+    Args:
+        project_dir: Project directory
+        sha256: Hex SHA-256 of the content
+
+    Returns:
+        The content, or None if it was not stored
+    """
+    try:
+        return zlib.decompress((Path(project_dir) / BASE_DIR / sha256).read_bytes())
+    except (OSError, zlib.error):
+        return None
+
+
+def save_lock(project_dir: Union[str, Path], lock: Dict[str, Any]) -> Path:
+    """
+    Atomically write a lockfile and drop stored bases it no longer references.
+
+    Args:
+        project_dir: Project directory
+        lock: Lockfile contents
+
+    Returns:
+        Path of the lockfile
+    """
+    project_dir = Path(project_dir)
+    lock_path = project_dir / LOCK_PATH
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = lock_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(lock, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, lock_path)
+
+    base_dir = project_dir / BASE_DIR
+    if base_dir.is_dir():
+        referenced = {entry["sha256"] for entry in lock["files"].values()}
+        for item in os.scandir(base_dir):
+            if item.name not in referenced:
+                os.remove(item.path)
+    return lock_path
+
+
+def build_lock(
+    template_name: str,
+    template_version: Optional[str],
+    context: Dict[str, Any],
+    files: Dict[str, Dict[str, Any]],
+    template_sha256: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Assemble lockfile contents.
+
+    Args:
+        template_name: Name of the template used
+        template_version: The template's ``version`` from ``template.json``
+        context: Rendering context used
+        files: Entries from file_entry, keyed by ``/``-separated relative path
+        template_sha256: Digest of the whole template directory
+
+    Returns:
+        Lockfile contents
+    """
+    return {
+        "lock_version": LOCK_VERSION,
+        "template": {"name": template_name, "version": template_version, "sha256": template_sha256},
+        "context_sha256": context_fingerprint(template_name, context),
+        "context": json.loads(json.dumps(context, default=str)),
+        "files": dict(sorted(files.items())),
+    }
+
+
+def write_lock(
+    project_dir: Union[str, Path],
+    template_name: str,
+    template_version: Optional[str],
+    context: Dict[str, Any],
+    manifest: Dict[str, str],
+    sources: Optional[Dict[str, str]] = None,
+    template_sha256: Optional[str] = None,
+    stored_bases: Optional[Collection[str]] = None,
+) -> Path:
+    """
+    Write the lockfile for a freshly generated project.
+
+    Args:
+        project_dir: Project directory
+        template_name: Name of the template used
+        template_version: The template's ``version`` from ``template.json``
+        context: Rendering context used
+        manifest: SHA-256 of each generated file keyed by its relative path,
+                  as returned by TemplateManager.apply_template
+        sources: SHA-256 of the template source of each generated file, keyed
+                 the same way
+        template_sha256: Digest of the whole template directory
+        stored_bases: Relative paths whose merge base the caller already
+                      stored (or that have none, being binary); the other
+                      files are read to store theirs
+
+    Returns:
+        Path of the lockfile
+    """
+    project_dir = Path(project_dir)
+    sources = sources or {}
+    stored_bases = stored_bases or ()
+    files = {}
+    for rel_path, digest in manifest.items():
+        path = project_dir / rel_path
+        files[rel_path] = file_entry(path, digest, sources.get(rel_path))
+        if rel_path not in stored_bases:
+            store_base_file(project_dir, digest, path)
+    lock = build_lock(template_name, template_version, context, files, template_sha256)
+    return save_lock(project_dir, lock)
+
+
+def read_lock(project_dir: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """
+    Read a project's lockfile.
+
+    Args:
+        project_dir: Project directory
+
+    Returns:
+        The lockfile contents, or None if the project has no lockfile
+
+    Raises:
+        ValueError: If the lockfile is not valid JSON or has an unsupported version
+    """
+    try:
+        with open(Path(project_dir) / LOCK_PATH, "r", encoding="utf-8") as f:
+            lock = json.load(f)
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid lockfile in {project_dir}: {e}")
+    if not isinstance(lock, dict) or lock.get("lock_version") != LOCK_VERSION:
+        raise ValueError(f"Unsupported lockfile version in {project_dir}")
+    return lock
+
+
+def project_status(project_dir: Union[str, Path], refresh: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Compare a project's working tree against its lockfile.
+
+    Args:
+        project_dir: Project directory
+        refresh: Whether to record refreshed stat data for files that were
+                 hashed and found unchanged
+
+    Returns:
+        None if the project has no lockfile, otherwise a dictionary with
+        'template', 'version', 'modified' and 'deleted' (sorted relative
+        paths), 'clean' (count of unchanged files) and 'hashed' (count of
+        files that had to be read)
+
+    Raises:
+        ValueError: If the lockfile is malformed
+    """
+    project_dir = Path(project_dir)
+    lock = read_lock(project_dir)
+    if lock is None:
+        return None
+    lock_mtime_ns = os.stat(project_dir / LOCK_PATH).st_mtime_ns
+    modified, deleted = [], []
+    clean = hashed = 0
+    refreshed = False
+    for rel_path, entry in lock["files"].items():
+        path = project_dir / rel_path
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            deleted.append(rel_path)
+            continue
+        if st.st_size != entry["size"]:
+            modified.append(rel_path)
+            continue
+        # A file modified in the same timestamp tick as the lockfile was
+        # written could have changed again without its mtime moving
+        if st.st_mtime_ns == entry["mtime_ns"] and st.st_mtime_ns < lock_mtime_ns:
+            clean += 1
+            continue
+        hashed += 1
+        if hash_file(path) != entry["sha256"]:
+            modified.append(rel_path)
+            continue
+        clean += 1
+        if st.st_mtime_ns != entry["mtime_ns"]:
+            entry["mtime_ns"] = st.st_mtime_ns
+            refreshed = True
+    if refresh and refreshed:
+        save_lock(project_dir, lock)
+    return {
+        "template": lock["template"].get("name"),
+        "version": lock["template"].get("version"),
+        "modified": sorted(modified),
+        "deleted": sorted(deleted),
+        "clean": clean,
+        "hashed": hashed,
+    }
+
+
+__all__ = [
+    "LOCK_PATH",
+    "BASE_DIR",
+    "LOCK_VERSION",
+    "is_binary",
+    "file_entry",
+    "store_base",
+    "store_base_file",
+    "load_base",
+    "save_lock",
+    "build_lock",
+    "write_lock",
+    "read_lock",
+    "project_status",
+]
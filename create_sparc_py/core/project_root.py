@@ -0,0 +1,189 @@
+"""
+Discovery of the project a directory belongs to.
+
+This module provides the ProjectRootResolver class, which finds the root of
+the SPARC project containing a directory by walking upward from it. A
+directory is a project root when it has a ``.sparc`` directory holding a
+lockfile, project configuration or project index, or a ``.roomodes`` file as
+written by the original create-sparc tool.
+
+Every command resolves the project root, so the walk is kept short:
+
+- results are memoized per directory for the lifetime of the process, and a
+  walk that reaches a memoized ancestor stops there;
+- the walk never goes past a repository root (a directory containing
+  ``.git``) or a mount point, since projects do not span either;
+- a directory without markers costs a few ``stat`` calls and is never
+  listed;
+- optionally, roots found by earlier processes are remembered in a small
+  JSON hint file. A hint is trusted only while its root still has its
+  markers, and ``invalidate`` drops all hints when a new project is created.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+# Per-project state lives in this directory at the project root
+PROJECT_DIR = ".sparc"
+PROJECT_MARKERS = ("lock.json", "config.json", "index")
+# Written at the root of projects generated by the original create-sparc tool
+LEGACY_MARKER = ".roomodes"
+# A project never extends above the root of the repository it is in
+REPO_MARKERS = (".git", ".hg", ".svn")
+# Hints are pruned to this many entries, most recently written first
+MAX_HINTS = 256
+
+
+def is_project_root(directory: Union[str, Path]) -> bool:
+    """
+    Check whether a directory is the root of a SPARC project.
+
+    Args:
+        directory: Directory to check
+
+    Returns:
+        True if the directory has project markers
+    """
+    sparc_dir = os.path.join(directory, PROJECT_DIR)
+    if os.path.isdir(sparc_dir):
+        if any(os.path.isfile(os.path.join(sparc_dir, name)) for name in PROJECT_MARKERS):
+            return True
+    return os.path.isfile(os.path.join(directory, LEGACY_MARKER))
+
+
+def _is_repo_root(directory: str) -> bool:
+    return any(os.path.lexists(os.path.join(directory, name)) for name in REPO_MARKERS)
+
+
+class ProjectRootResolver:
+    """
+    Resolves the project root of a directory, caching the answers.
+    """
+
+    def __init__(self, hint_file: Optional[Union[str, Path]] = None):
+        """
+        Initialize the ProjectRootResolver.
+
+        Args:
+            hint_file: JSON file remembering roots across processes, or None
+                       to only memoize within this process
+        """
+        self.hint_file = Path(hint_file) if hint_file is not None else None
+        self._memo: Dict[str, Optional[str]] = {}
+        self._hints: Optional[Dict[str, str]] = None
+
+    def resolve(self, start: Optional[Union[str, Path]] = None) -> Optional[Path]:
+        """
+        Find the root of the project containing a directory.
+
+        Args:
+            start: Directory to start from (default: the current directory)
+
+        Returns:
+            The project root, or None if the directory is not in a project
+        """
+        current = os.path.realpath(start or os.getcwd())
+        if current in self._memo:
+            root = self._memo[current]
+            return Path(root) if root is not None else None
+
+        root = self._from_hint(current)
+        visited: List[str] = [current]
+        if root is None:
+            root = self._walk(current, visited)
+            if root is not None and self.hint_file is not None:
+                self._store_hint(current, root)
+        for directory in visited:
+            self._memo[directory] = root
+        return Path(root) if root is not None else None
+
+    def _walk(self, current: str, visited: List[str]) -> Optional[str]:
+        """Walk upward from current, appending each directory checked to visited."""
+        try:
+            device = os.stat(current).st_dev
+        except OSError:
+            return None
+        while True:
+            if is_project_root(current):
+                return current
+            if _is_repo_root(current):
+                return None
+            parent = os.path.dirname(current)
+            if parent == current:
+                return None
+            if parent in self._memo:
+                return self._memo[parent]
+            try:
+                parent_device = os.stat(parent).st_dev
+            except OSError:
+                return None
+            if parent_device != device:
+                return None
+            current = parent
+            visited.append(current)
+
+    def _load_hints(self) -> Dict[str, str]:
+        if self._hints is None:
+            self._hints = {}
+            try:
+                with open(self.hint_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._hints = {k: v for k, v in data.items() if isinstance(v, str)}
+            except (OSError, ValueError):
+                pass
+        return self._hints
+
+    def _from_hint(self, current: str) -> Optional[str]:
+        if self.hint_file is None:
+            return None
+        root = self._load_hints().get(current)
+        if root is not None and is_project_root(root):
+            return root
+        return None
+
+    def _store_hint(self, current: str, root: str) -> None:
+        hints = self._load_hints()
+        hints.pop(current, None)
+        hints[current] = root
+        while len(hints) > MAX_HINTS:
+            del hints[next(iter(hints))]
+        try:
+            self.hint_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.hint_file.with_name(f"{self.hint_file.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(hints, f, indent=2)
+            os.replace(tmp_path, self.hint_file)
+        except OSError:
+            pass
+
+    def invalidate(self) -> None:
+        """
+        Forget every cached root, in memory and in the hint file.
+
+        Call this after creating a project, since directories below it may
+        have been resolved to an outer project or to none.
+        """
+        self._memo.clear()
+        self._hints = {}
+        if self.hint_file is not None:
+            try:
+                os.remove(self.hint_file)
+            except OSError:
+                pass
+
+
+__all__ = [
+    "ProjectRootResolver",
+    "is_project_root",
+    "PROJECT_DIR",
+    "PROJECT_MARKERS",
+    "LEGACY_MARKER",
+    "REPO_MARKERS",
+]
@@ -0,0 +1,181 @@
+"""
+Three-way template upgrades for generated projects.
+
+This module brings a generated project up to date with the current version of
+its template, using the project's lockfile (see project_lock) as the merge
+base. Every file is classified before anything is rendered:
+
+- unchanged in template: the template source hash matches the one recorded
+  at generation, so the file is skipped without rendering;
+- untouched by user: the project file still matches the recorded output, so
+  the new output is written over it (a fast-forward);
+- changed on both sides: the user's file and the new output are three-way
+  merged against the stored base content. Conflicts are left in the file
+  between ``<<<<<<< ours`` and ``>>>>>>> template`` markers.
+
+Files the new template no longer generates are removed if the user never
+changed them. Files the user deleted stay deleted. Binary files and new
+template files that collide with a user's file are not merged; the template's
+version is written next to them as ``<file>.sparc-new``.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import hashlib
+import os
+import stat
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from create_sparc_py.core.generation_journal import hash_file
+from create_sparc_py.core.project_lock import (
+    LOCK_PATH,
+    build_lock,
+    file_entry,
+    is_binary,
+    load_base,
+    read_lock,
+    save_lock,
+    store_base,
+)
+from create_sparc_py.core.template_manager import template_manager
+from create_sparc_py.core.three_way_merge import merge3
+
+CONFLICT_SUFFIX = ".sparc-new"
+
+
+def _write(path: Path, content: bytes, src_file: Optional[str] = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(content)
+    if src_file is not None:
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(src_file).st_mode))
+    os.replace(tmp_path, path)
+
+
+def _current_sha256(path: Path, entry: Dict[str, Any], lock_mtime_ns: int) -> str:
+    """Hash a project file, trusting the lockfile's stat data where it is safe to."""
+    st = os.stat(path)
+    if st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"] and st.st_mtime_ns < lock_mtime_ns:
+        return entry["sha256"]
+    return hash_file(path)
+
+
+def _unmerged_entry(sha256: str, content: bytes, source_sha256: str) -> Dict[str, Any]:
+    # The project file does not hold this content, so record a stat that
+    # never matches and status always hashes the file.
+    return {"sha256": sha256, "size": len(content), "mtime_ns": 0, "source_sha256": source_sha256}
+
+
+def upgrade_project(project_dir: Union[str, Path], dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Upgrade a generated project to the current version of its template.
+
+    Args:
+        project_dir: Project directory containing ``.sparc/lock.json``
+        dry_run: Classify files without writing anything
+
+    Returns:
+        Dictionary with 'template', 'from_version', 'to_version', 'rendered'
+        (number of files rendered) and 'files', mapping each affected path to
+        its action: unchanged, up-to-date, added, updated, merged, conflict,
+        deleted (the user deleted it; left deleted), removed (no longer in the
+        template) or kept (no longer in the template, but changed by the user)
+
+    Raises:
+        ValueError: If the project has no usable lockfile
+        FileNotFoundError: If the project's template no longer exists
+        RuntimeError: If a file fails to render
+    """
+    project_dir = Path(project_dir)
+    lock = read_lock(project_dir)
+    if lock is None:
+        raise ValueError(f"No lockfile in {project_dir}; it was not generated by create-sparc-py")
+    lock_mtime_ns = os.stat(project_dir / LOCK_PATH).st_mtime_ns
+    template_name = lock["template"]["name"]
+    context = lock["context"]
+    base_files = lock["files"]
+    plan = template_manager.plan_template(template_name, context)
+
+    actions: Dict[str, str] = {}
+    files: Dict[str, Dict[str, Any]] = {}
+    rendered = 0
+    for rel_path, src_file in plan.items():
+        path = project_dir / rel_path
+        base = base_files.get(rel_path)
+        source_sha256 = hash_file(src_file)
+        if base is not None and base.get("source_sha256") == source_sha256:
+            actions[rel_path] = "unchanged"
+            files[rel_path] = base
+            continue
+
+        new = template_manager.render_file(src_file, context)
+        new_sha256 = hashlib.sha256(new).hexdigest()
+        rendered += 1
+        exists = path.exists()
+        current = None
+        if exists:
+            current = _current_sha256(path, base, lock_mtime_ns) if base else hash_file(path)
+
+        if base is not None and new_sha256 == base["sha256"]:
+            action = "unchanged"
+        elif current == new_sha256:
+            action = "up-to-date"
+        elif not exists:
+            action = "deleted" if base is not None else "added"
+        elif base is not None and current == base["sha256"]:
+            action = "updated"
+        else:
+            action = "conflict"
+            base_content = load_base(project_dir, base["sha256"]) if base is not None else None
+            ours = path.read_bytes() if base_content is not None else b""
+            if base_content is not None and not is_binary(ours) and not is_binary(new):
+                merged, conflicts = merge3(base_content, ours, new)
+                action = "merged" if conflicts == 0 else "conflict"
+                if not dry_run:
+                    _write(path, merged, src_file)
+            elif not dry_run:
+                _write(path.with_name(path.name + CONFLICT_SUFFIX), new, src_file)
+        actions[rel_path] = action
+
+        if dry_run:
+            continue
+        if action in ("added", "updated"):
+            _write(path, new, src_file)
+        store_base(project_dir, new_sha256, new)
+        if action == "unchanged":
+            files[rel_path] = dict(base, source_sha256=source_sha256)
+        elif action in ("added", "updated", "up-to-date"):
+            files[rel_path] = file_entry(path, new_sha256, source_sha256)
+        else:
+            files[rel_path] = _unmerged_entry(new_sha256, new, source_sha256)
+
+    for rel_path, base in base_files.items():
+        if rel_path in plan:
+            continue
+        path = project_dir / rel_path
+        if not path.exists():
+            continue
+        if _current_sha256(path, base, lock_mtime_ns) == base["sha256"]:
+            actions[rel_path] = "removed"
+            if not dry_run:
+                os.remove(path)
+        else:
+            actions[rel_path] = "kept"
+
+    to_version = template_manager.get_template_config(template_name).get("version")
+    if not dry_run:
+        template_sha256 = template_manager.get_template_digest(template_name)
+        save_lock(project_dir, build_lock(template_name, to_version, context, files, template_sha256))
+    return {
+        "template": template_name,
+        "from_version": lock["template"].get("version"),
+        "to_version": to_version,
+        "rendered": rendered,
+        "files": dict(sorted(actions.items())),
+    }
+
+
+__all__ = ["upgrade_project", "CONFLICT_SUFFIX"]
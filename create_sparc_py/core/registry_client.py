@@ -4,8 +4,8 @@ Registry client for create-sparc-py (stub).
 
 import requests
 import os
-import json
 from typing import Any, Dict, Optional
+from create_sparc_py.core import json_codec
 from create_sparc_py.utils import logger
 
 
@@ -39,7 +39,7 @@ class RegistryClient:
             logger.info(f"[RegistryClient] GET {url}")
             resp = requests.get(url, headers=headers)
             resp.raise_for_status()
-            return resp.json()
+            return json_codec.loads(resp.content)
         except Exception as e:
             logger.error(f"RegistryClient GET error: {e}")
             return {"error": str(e), "status": "error"}
@@ -55,9 +55,9 @@ class RegistryClient:
         )
         try:
             logger.info(f"[RegistryClient] POST {url} with data: {data}")
-            resp = requests.post(url, headers=headers, data=json.dumps(data))
+            resp = requests.post(url, headers=headers, data=json_codec.dumps(data))
             resp.raise_for_status()
-            return resp.json()
+            return json_codec.loads(resp.content)
         except Exception as e:
             logger.error(f"RegistryClient POST error: {e}")
             return {"error": str(e), "status": "error"}
@@ -0,0 +1,422 @@
+"""
+Compiled schema validation for configuration files.
+
+This module validates the user's ``config.json``, a project's
+``.roo/mcp.json`` and its ``.roomodes`` against JSON schemas, ported from the
+schemas of the original Node.js tool and relaxed to accept the files this
+tool's own templates generate.
+
+A schema is not interpreted at validation time. compile_schema turns it into
+the source of a Python function specialized to that schema: type checks
+become ``isinstance`` calls, required properties become unrolled membership
+tests, patterns are precompiled and error paths are only built when an error
+is found. The function is compiled once per schema and cached, so validating
+a configuration costs one pass over the data, linear in its size.
+
+The supported keywords are ``type``, ``properties``, ``required``,
+``patternProperties``, ``additionalProperties``, ``items`` (a schema, or a
+list of schemas for tuples), ``enum``, ``pattern``, ``minLength``,
+``minimum``, ``anyOf`` and ``oneOf``.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Validator = Callable[[Any], List[str]]
+
+_STRING = {"type": "string"}
+_STRING_ARRAY = {"type": "array", "items": _STRING}
+_GROUP_NAME = {
+    "type": "string",
+    "enum": ["read", "edit", "browser", "command", "mcp", "database", "ai", "cloud"],
+}
+
+CONFIG_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "templates_dir": _STRING,
+        "ai_provider": _STRING,
+        "ai_settings": {
+            "type": "object",
+            "properties": {
+                "model": _STRING,
+                "temperature": {"type": "number", "minimum": 0},
+                "max_tokens": {"type": "integer", "minimum": 1},
+            },
+        },
+        "default_template": {"type": "string", "minLength": 1},
+        "wheelhouse_dir": _STRING,
+        "venv_cache_dir": _STRING,
+        "venv_cache_max_bytes": {"type": "integer", "minimum": 0},
+        "project_root_hints": {"type": "boolean"},
+        "version": _STRING,
+    },
+}
+
+MCP_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["mcpServers"],
+    "properties": {
+        "mcpServers": {
+            "type": "object",
+            "patternProperties": {
+                "^[a-zA-Z0-9-_]+$": {
+                    "type": "object",
+                    "properties": {
+                        "command": {"type": "string", "minLength": 1},
+                        "args": _STRING_ARRAY,
+                        "url": {"type": "string", "minLength": 1},
+                        "env": {"type": "object", "additionalProperties": _STRING},
+                        "alwaysAllow": _STRING_ARRAY,
+                        "permissions": _STRING_ARRAY,
+                        "disabled": {"type": "boolean"},
+                        "timeout": {"type": "number", "minimum": 0},
+                    },
+                    # Local servers are started with a command, remote ones are reached by URL
+                    "anyOf": [{"required": ["command", "args"]}, {"required": ["url"]}],
+                    "additionalProperties": False,
+                }
+            },
+            "additionalProperties": False,
+        }
+    },
+}
+
+ROOMODES_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["customModes"],
+    "properties": {
+        "customModes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["slug", "name", "roleDefinition", "groups"],
+                "properties": {
+                    "slug": {"type": "string", "pattern": "^[a-zA-Z0-9-_]+$"},
+                    "name": {"type": "string", "minLength": 1},
+                    "roleDefinition": _STRING,
+                    "customInstructions": _STRING,
+                    "whenToUse": _STRING,
+                    "model": _STRING,
+                    "groups": {
+                        "type": "array",
+                        "items": {
+                            "oneOf": [
+                                _GROUP_NAME,
+                                {
+                                    "type": "array",
+                                    "items": [
+                                        _GROUP_NAME,
+                                        {
+                                            "type": "object",
+                                            "required": ["fileRegex"],
+                                            "properties": {"fileRegex": _STRING, "description": _STRING},
+                                        },
+                                    ],
+                                },
+                            ]
+                        },
+                    },
+                    "source": {"type": "string", "enum": ["project", "user", "system", "global"]},
+                },
+            },
+        }
+    },
+}
+
+SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "config": CONFIG_SCHEMA,
+    "mcp": MCP_SCHEMA,
+    "roomodes": ROOMODES_SCHEMA,
+}
+
+_TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool))",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "null": "{v} is None",
+}
+_KEYWORDS = frozenset(
+    {
+        "type",
+        "properties",
+        "required",
+        "patternProperties",
+        "additionalProperties",
+        "items",
+        "enum",
+        "pattern",
+        "minLength",
+        "minimum",
+        "anyOf",
+        "oneOf",
+        "description",
+        "default",
+    }
+)
+
+
+def _closest(results: Tuple[List[str], ...]) -> List[str]:
+    """Pick the errors of the alternative a value came closest to matching."""
+    # An alternative of the wrong type is further off than one with wrong contents
+    return min(results, key=lambda errors: (any(e.startswith("$: expected ") for e in errors), len(errors)))
+
+
+# A path is a sequence of parts: ("key", name), ("pos", position), ("dyn", variable) or ("index", variable)
+_Path = Tuple[Tuple[str, str], ...]
+
+
+class _Compiler:
+    """Generates the source of a validator function for one schema."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {"_closest": _closest}
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _const(self, prefix: str, value: Any) -> str:
+        name = self._name(prefix)
+        self.namespace[name] = value
+        return name
+
+    @staticmethod
+    def _path_expr(path: _Path) -> str:
+        """Python expression building the '$.a.b[0]' form of a path."""
+        parts: List[str] = []
+        literal = "$"
+        for kind, value in path:
+            if kind == "key":
+                literal += f".{value}"
+                continue
+            if kind == "pos":
+                literal += f"[{value}]"
+                continue
+            parts.append(repr(literal))
+            literal = ""
+            if kind == "dyn":
+                parts.append(f"'.' + {value}")
+            else:
+                parts.append(f"'[' + str({value}) + ']'")
+        if literal:
+            parts.append(repr(literal))
+        return " + ".join(parts)
+
+    def _error(self, indent: str, path: _Path, message_expr: str) -> None:
+        self.lines.append(f"{indent}errors.append({self._path_expr(path)} + ': ' + {message_expr})")
+
+    def _guarded(self, header: Optional[str], indent: str, emit: Callable[[str], None]) -> None:
+        """Emit checks under a block header; an empty block is left out, and None means no header."""
+        if header is None:
+            emit(indent)
+            return
+        start = len(self.lines)
+        emit(indent + "    ")
+        if len(self.lines) > start:
+            self.lines.insert(start, f"{indent}{header}")
+
+    def node(self, schema: Dict[str, Any], var: str, path: _Path, indent: str) -> None:
+        """Emit the checks of schema for the value in var."""
+        unknown = set(schema) - _KEYWORDS
+        if unknown:
+            raise ValueError(f"Unsupported schema keywords: {', '.join(sorted(unknown))}")
+        types = schema.get("type")
+        types = [types] if isinstance(types, str) else list(types or [])
+        if not types:
+            self._checks(schema, var, path, indent, types)
+            return
+        check = " or ".join(_TYPE_CHECKS[t].format(v=var) for t in types)
+        self.lines.append(f"{indent}if not ({check}):")
+        self._error(indent + "    ", path, repr(f"expected {' or '.join(types)}"))
+        # The remaining checks only run on a value of the right type
+        self._guarded("else:", indent, lambda body: self._checks(schema, var, path, body, types))
+
+    def _checks(self, schema: Dict[str, Any], var: str, path: _Path, indent: str, types: List[str]) -> None:
+        """Emit the checks of schema other than its type."""
+        if "enum" in schema:
+            options = schema["enum"]
+            name = self._const("enum", frozenset(options) if all(isinstance(o, str) for o in options) else options)
+            message = repr(f"must be one of {', '.join(map(str, options))}")
+            self.lines.append(f"{indent}if {var} not in {name}:")
+            self._error(indent + "    ", path, message)
+
+        if "pattern" in schema or "minLength" in schema:
+            header = None if types == ["string"] else f"if isinstance({var}, str):"
+            self._guarded(header, indent, lambda body: self._string(schema, var, path, body))
+
+        if "minimum" in schema:
+            condition = f"{var} < {schema['minimum']!r}"
+            if not set(types) <= {"number", "integer"} or not types:
+                condition = f"{_TYPE_CHECKS['number'].format(v=var)} and {condition}"
+            self.lines.append(f"{indent}if {condition}:")
+            self._error(indent + "    ", path, repr(f"must be at least {schema['minimum']}"))
+
+        if any(k in schema for k in ("properties", "required", "patternProperties", "additionalProperties")):
+            header = None if types == ["object"] else f"if isinstance({var}, dict):"
+            self._guarded(header, indent, lambda body: self._object(schema, var, path, body))
+        if "items" in schema:
+            header = None if types == ["array"] else f"if isinstance({var}, list):"
+            self._guarded(header, indent, lambda body: self._array(schema["items"], var, path, body))
+        for keyword in ("anyOf", "oneOf"):
+            if keyword in schema:
+                self._alternatives(keyword, schema[keyword], var, path, indent)
+
+    def _string(self, schema: Dict[str, Any], var: str, path: _Path, indent: str) -> None:
+        if "pattern" in schema:
+            regex = self._const("pattern", re.compile(schema["pattern"]))
+            self.lines.append(f"{indent}if not {regex}.search({var}):")
+            self._error(indent + "    ", path, repr(f"must match {schema['pattern']}"))
+        if "minLength" in schema:
+            self.lines.append(f"{indent}if len({var}) < {int(schema['minLength'])}:")
+            self._error(indent + "    ", path, repr(f"must be at least {schema['minLength']} characters"))
+
+    def _object(self, schema: Dict[str, Any], var: str, path: _Path, indent: str) -> None:
+        for key in schema.get("required", []):
+            self.lines.append(f"{indent}if {key!r} not in {var}:")
+            self._error(indent + "    ", path, repr(f"missing required field '{key}'"))
+        properties = schema.get("properties", {})
+        for key, subschema in properties.items():
+            child = self._name("v")
+            self.lines.append(f"{indent}if {key!r} in {var}:")
+            self.lines.append(f"{indent}    {child} = {var}[{key!r}]")
+            self.node(subschema, child, path + (("key", key),), indent + "    ")
+
+        patterns = schema.get("patternProperties", {})
+        additional = schema.get("additionalProperties", True)
+        if not patterns and additional is True:
+            return
+        key_var, child = self._name("k"), self._name("v")
+        child_path = path + (("dyn", key_var),)
+        self.lines.append(f"{indent}for {key_var}, {child} in {var}.items():")
+        body = indent + "    "
+        if properties:
+            known = self._const("known", frozenset(properties))
+            self.lines.append(f"{body}if {key_var} in {known}:")
+            self.lines.append(f"{body}    continue")
+        matched = self._name("matched")
+        self.lines.append(f"{body}{matched} = False")
+        for pattern, subschema in patterns.items():
+            regex = self._const("pattern", re.compile(pattern))
+            self.lines.append(f"{body}if {regex}.search({key_var}):")
+            self.lines.append(f"{body}    {matched} = True")
+            self.node(subschema, child, child_path, body + "    ")
+        if additional is False:
+            self.lines.append(f"{body}if not {matched}:")
+            self._error(body + "    ", path, f"'unexpected field ' + repr({key_var})")
+        elif isinstance(additional, dict):
+            self.lines.append(f"{body}if not {matched}:")
+            self.node(additional, child, child_path, body + "    ")
+
+    def _array(self, items: Any, var: str, path: _Path, indent: str) -> None:
+        if isinstance(items, list):
+            for position, subschema in enumerate(items):
+                child = self._name("v")
+                self.lines.append(f"{indent}if len({var}) > {position}:")
+                self.lines.append(f"{indent}    {child} = {var}[{position}]")
+                self.node(subschema, child, path + (("pos", str(position)),), indent + "    ")
+            return
+        index, child = self._name("i"), self._name("v")
+        self._guarded(
+            f"for {index}, {child} in enumerate({var}):",
+            indent,
+            lambda body: self.node(items, child, path + (("index", index),), body),
+        )
+
+    def _alternatives(self, keyword: str, schemas: List[Dict[str, Any]], var: str, path: _Path, indent: str) -> None:
+        # Each alternative is compiled into its own validator. When none
+        # matches, the errors of the closest one are reported at this path.
+        checks = [self._const("alt", compile_schema(subschema)) for subschema in schemas]
+        results = self._name("results")
+        self.lines.append(f"{indent}{results} = ({', '.join(f'{check}({var})' for check in checks)},)")
+        self.lines.append(f"{indent}if all({results}):")
+        self.lines.append(f"{indent}    errors.extend({self._path_expr(path)} + e[1:] for e in _closest({results}))")
+        if keyword == "oneOf":
+            self.lines.append(f"{indent}elif len({results}) - sum(map(bool, {results})) > 1:")
+            self._error(indent + "    ", path, repr("must match exactly one of the allowed forms"))
+
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    """
+    Compile a schema into a validator function.
+
+    Args:
+        schema: JSON schema using the keywords listed in this module's docstring
+
+    Returns:
+        Function taking a decoded JSON value and returning a list of error
+        messages, each prefixed with the JSON path of the offending value;
+        the list is empty if the value is valid
+
+    Raises:
+        ValueError: If the schema uses an unsupported keyword
+    """
+    compiler = _Compiler()
+    compiler.lines.append("def validate(v0):")
+    compiler.lines.append("    errors = []")
+    compiler.node(schema, "v0", (), "    ")
+    compiler.lines.append("    return errors")
+    source = "\n".join(compiler.lines)
+    namespace = dict(compiler.namespace)
+    exec(compile(source, "<schema validator>", "exec"), namespace)
+    validate = namespace["validate"]
+    validate.source = source
+    return validate
+
+
+_validators: Dict[str, Validator] = {}
+
+
+def get_validator(name: str) -> Validator:
+    """
+    Get the compiled validator of a built-in schema, compiling it on first use.
+
+    Args:
+        name: Schema name: 'config', 'mcp' or 'roomodes'
+
+    Returns:
+        Validator function, as returned by compile_schema
+
+    Raises:
+        ValueError: If the schema name is unknown
+    """
+    validator = _validators.get(name)
+    if validator is None:
+        if name not in SCHEMAS:
+            raise ValueError(f"Unknown schema '{name}'; available: {', '.join(SCHEMAS)}")
+        validator = _validators[name] = compile_schema(SCHEMAS[name])
+    return validator
+
+
+def validate(name: str, data: Any) -> List[str]:
+    """
+    Validate data against a built-in schema.
+
+    Args:
+        name: Schema name: 'config', 'mcp' or 'roomodes'
+        data: Decoded JSON content
+
+    Returns:
+        List of error messages; empty if the data is valid
+    """
+    return get_validator(name)(data)
+
+
+__all__ = [
+    "CONFIG_SCHEMA",
+    "MCP_SCHEMA",
+    "ROOMODES_SCHEMA",
+    "SCHEMAS",
+    "compile_schema",
+    "get_validator",
+    "validate",
+]
@@ -11,13 +11,81 @@ https://github.com/ruvnet/rUv-dev.
 
 import os
 import json
+import stat
+import hashlib
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 from jinja2 import Environment, FileSystemLoader, StrictUndefined, TemplateError
 import shutil
 import re
+import tempfile
 
 from create_sparc_py.utils import logger, fs_utils, path_utils
+from create_sparc_py.core.template_rules import (
+    compile_rules,
+    resolve_skip_patterns,
+    is_dir_skipped,
+    is_file_skipped,
+)
+
+
+# Size of the leading block inspected to decide whether a file is binary
+_SNIFF_SIZE = 8192
+_COPY_CHUNK_SIZE = 1024 * 1024
+_UTF8_BOM = b"\xef\xbb\xbf"
+_JINJA_MARKERS = (b"{{", b"{%", b"{#")
+
+
+def _hash_file(path: str) -> str:
+    """Hex SHA-256 of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_COPY_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def template_names_cache() -> Path:
+    """
+    Get the file listing the template names offered by shell completion.
+
+    Returns:
+        Path to the file, which holds one template name per line
+    """
+    return Path.home() / ".create-sparc-py" / "completion" / "templates"
+
+
+def refresh_template_names_cache(names: List[str]) -> None:
+    """
+    Write the template names offered by shell completion, if they changed.
+
+    Args:
+        names: Names of the available templates
+    """
+    path = template_names_cache()
+    content = "".join(f"{name}\n" for name in sorted(names))
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return
+    except (OSError, UnicodeDecodeError):
+        pass
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique name per call: templates are listed from several threads at once
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            f.write(content)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not write the template name cache {path}: {e}")
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
 
 
 def _sanitize_context(obj):
@@ -48,11 +116,16 @@ class TemplateManager:
                           templates directory in the package.
         """
         self.templates_dir = templates_dir or os.path.join(os.path.dirname(__file__), "../templates")
+        # Only the package's own templates are offered by shell completion
+        self._completes_names = templates_dir is None
         self.env = Environment(
             loader=FileSystemLoader(self.templates_dir),
             undefined=StrictUndefined,
             keep_trailing_newline=True,
         )
+        self._crlf_env: Optional[Environment] = None
+        # Parsed template.json and compiled rules, keyed by template name
+        self._index: Dict[str, Dict[str, Any]] = {}
 
         # Ensure the templates directory exists
         if not fs_utils.exists(self.templates_dir):
@@ -64,6 +137,9 @@ class TemplateManager:
         """
         List available templates.
 
+        Listing the package's templates also refreshes the names offered by
+        shell completion (see template_names_cache).
+
         Returns:
             List of template names
         """
@@ -77,6 +153,8 @@ class TemplateManager:
             if fs_utils.is_directory(item) and fs_utils.exists(template_json):
                 templates.append(path_utils.get_name(item))
 
+        if self._completes_names:
+            refresh_template_names_cache(templates)
         return templates
 
     def get_template_info(self, template_name: str) -> Dict[str, Any]:
@@ -123,45 +201,414 @@ class TemplateManager:
             return {"valid": False, "error": f"Missing required files: {', '.join(missing)}"}
         return {"valid": True}
 
-    def apply_template(self, template_name: str, output_dir: str, context: Dict[str, Any]) -> None:
+    def _get_template_index(self, template_name: str) -> Dict[str, Any]:
+        """
+        Get the cached index entry for a template.
+
+        The entry holds the parsed ``template.json``, its compiled rules and the
+        compiled templates for file and directory names. It is rebuilt only when
+        ``template.json`` changes on disk.
+
+        Args:
+            template_name: Name of the template
+
+        Returns:
+            Dictionary with 'config', 'rules' and 'path_templates' keys
+
+        Raises:
+            ValueError: If template.json is not valid JSON or has malformed rules
+        """
+        config_path = os.path.join(self.templates_dir, template_name, "template.json")
+        try:
+            mtime = os.stat(config_path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        entry = self._index.get(template_name)
+        if entry is not None and entry["mtime"] == mtime:
+            return entry
+
+        config: Dict[str, Any] = {}
+        if mtime is not None:
+            try:
+                with open(config_path, "r", encoding="utf-8") as f:
+                    config = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid template.json in {template_name}: {e}")
+        entry = {
+            "mtime": mtime,
+            "config": config,
+            "rules": compile_rules(config.get("rules")),
+            "path_templates": {},
+        }
+        self._index[template_name] = entry
+        return entry
+
+    def get_template_config(self, template_name: str) -> Dict[str, Any]:
+        """
+        Get a template's parsed ``template.json``.
+
+        Args:
+            template_name: Name of the template
+
+        Returns:
+            Template configuration, or an empty dict if the template has no
+            template.json
+
+        Raises:
+            ValueError: If template.json is not valid JSON or has malformed rules
+        """
+        return self._get_template_index(template_name)["config"]
+
+    def get_template_digest(self, template_name: str, source_hashes: Optional[Dict[str, str]] = None) -> str:
+        """
+        Compute a digest of everything in a template directory.
+
+        Any change to a template file's path or content changes the digest,
+        so comparing it with the one recorded in a project's lockfile tells
+        whether the project is stale.
+
+        Args:
+            template_name: Name of the template
+            source_hashes: SHA-256 of template files already hashed, keyed by
+                           their path as reported by apply_template's
+                           ``on_write``; only the other files are read
+
+        Returns:
+            Hex SHA-256 over each file's relative path and content hash
+
+        Raises:
+            FileNotFoundError: If the template directory does not exist
+        """
+        src_dir = os.path.join(self.templates_dir, template_name)
+        if not os.path.isdir(src_dir):
+            raise FileNotFoundError(f"Template directory not found: {src_dir}")
+        source_hashes = source_hashes or {}
+        digest = hashlib.sha256()
+        for root, dirs, files in os.walk(src_dir):
+            dirs.sort()
+            rel_root = os.path.relpath(root, src_dir).replace(os.sep, "/")
+            for file in sorted(files):
+                path = os.path.join(root, file)
+                file_digest = source_hashes.get(path) or _hash_file(path)
+                digest.update(f"{rel_root}/{file}\0{file_digest}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def apply_template(
+        self,
+        template_name: str,
+        output_dir: str,
+        context: Dict[str, Any],
+        memory_budget: Optional[Any] = None,
+        journal: Optional[Any] = None,
+        on_write: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, str]:
         """
         Apply a template to generate a new project.
 
+        Paths excluded by the template's ``rules`` are skipped before they are
+        read; excluded directories are not walked at all. File and directory
+        names may contain Jinja2 markup, e.g. ``src/{{project_name}}``. Binary
+        and non-UTF-8 files are copied byte for byte; line endings and file
+        modes are preserved.
+
         Args:
             template_name: Name of the template
             output_dir: Directory to create the project in
             context: Dictionary of variables to use in template rendering
+            memory_budget: Optional ByteBudget shared with concurrent generations;
+                           each text file's size is reserved while it is rendered
+            journal: Optional GenerationJournal; files listed in its ``completed``
+                     map are skipped and every written file is recorded in it
+            on_write: Optional callback, called for each generated file with a
+                      dict of 'path' (relative to output_dir), 'source' (the
+                      template file), 'sha256' (of the output),
+                      'source_sha256' and 'content' (the written text, or None
+                      for binary and skipped files), so callers need not read
+                      the template or the output again; sources of skipped
+                      files are hashed for it
+
+        Returns:
+            SHA-256 of each generated file, keyed by its path relative to
+            output_dir (``/``-separated)
+
+        Raises:
+            FileNotFoundError: If the template directory does not exist
+            ValueError: If the template's rules are malformed
+            RuntimeError: If a file or path fails to render
+        """
+        context = _sanitize_context(context)
+        if not isinstance(context, dict):
+            raise TypeError("Template context must be a dict")
+        completed = journal.completed if journal is not None else {}
+        created_dirs = set()
+        manifest: Dict[str, str] = {}
+        for src_file, dest_rel in self._iter_outputs(template_name, context):
+            if dest_rel in completed:
+                manifest[dest_rel] = completed[dest_rel]
+                if on_write is not None:
+                    on_write(
+                        {
+                            "path": dest_rel,
+                            "source": src_file,
+                            "sha256": completed[dest_rel],
+                            "source_sha256": _hash_file(src_file),
+                            "content": None,
+                        }
+                    )
+                continue
+            dest_file = os.path.join(output_dir, *dest_rel.split("/"))
+            dest_root = os.path.dirname(dest_file)
+            if dest_root not in created_dirs:
+                os.makedirs(dest_root, exist_ok=True)
+                created_dirs.add(dest_root)
+            digest, source_digest, content = self._write_file(src_file, dest_file, context, memory_budget)
+            manifest[dest_rel] = digest
+            if journal is not None:
+                journal.record(dest_rel, digest)
+            if on_write is not None:
+                on_write(
+                    {
+                        "path": dest_rel,
+                        "source": src_file,
+                        "sha256": digest,
+                        "source_sha256": source_digest,
+                        "content": content,
+                    }
+                )
+            del content
+        return manifest
+
+    def plan_template(self, template_name: str, context: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Work out which files a template would generate, without rendering them.
+
+        Args:
+            template_name: Name of the template
+            context: Dictionary of variables to use in template rendering
+
+        Returns:
+            Template source file for each output path relative to the project
+            (``/``-separated)
 
         Raises:
             FileNotFoundError: If the template directory does not exist
+            ValueError: If the template's rules are malformed
+            RuntimeError: If a path fails to render
         """
         context = _sanitize_context(context)
         if not isinstance(context, dict):
             raise TypeError("Template context must be a dict")
+        return {dest_rel: src_file for src_file, dest_rel in self._iter_outputs(template_name, context)}
+
+    def _iter_outputs(self, template_name: str, context: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+        """
+        Walk a template, yielding each source file and its rendered output path.
+
+        Args:
+            template_name: Name of the template
+            context: Sanitized rendering context
+
+        Yields:
+            Tuples of (source file path, ``/``-separated output path)
+        """
         src_dir = os.path.join(self.templates_dir, template_name)
         if not os.path.isdir(src_dir):
             raise FileNotFoundError(f"Template directory not found: {src_dir}")
+        entry = self._get_template_index(template_name)
+        skip_patterns = resolve_skip_patterns(entry["rules"], context)
+        # Rendered names are memoized for this walk; each directory's output
+        # prefix is computed once from its parent's.
+        rendered_names: Dict[str, str] = {}
+        dest_prefixes = {src_dir: ""}
         for root, dirs, files in os.walk(src_dir):
+            dest_prefix = dest_prefixes.pop(root)
             rel_root = os.path.relpath(root, src_dir)
+            rel_prefix = "" if rel_root == "." else rel_root.replace(os.sep, "/") + "/"
+            if skip_patterns:
+                # Prune excluded subtrees in place so os.walk never descends into them
+                dirs[:] = [d for d in dirs if not is_dir_skipped(rel_prefix + d, skip_patterns)]
+            for d in dirs:
+                rendered_dir = self._render_path(entry, d, context, rendered_names, rel_prefix + d)
+                dest_prefixes[os.path.join(root, d)] = dest_prefix + rendered_dir + "/"
             for file in files:
-                src_file = os.path.join(root, file)
-                # Render filename as well as content, but only if context is a dict
-                rendered_filename = file
-                try:
-                    rendered_filename = self.env.from_string(file).render(**context)
-                except Exception:
-                    rendered_filename = file
-                dest_dir = os.path.join(output_dir, rel_root)
-                os.makedirs(dest_dir, exist_ok=True)
-                dest_file = os.path.join(dest_dir, rendered_filename)
-                with open(src_file, "r") as f:
-                    content = f.read()
-                try:
-                    rendered_content = self.env.from_string(content).render(**context)
-                except Exception as e:
-                    raise RuntimeError(f"Template rendering error in {src_file}: {e}")
-                with open(dest_file, "w") as f:
-                    f.write(rendered_content)
+                if skip_patterns and is_file_skipped(rel_prefix + file, skip_patterns):
+                    continue
+                rendered_filename = self._render_path(entry, file, context, rendered_names, rel_prefix + file)
+                yield os.path.join(root, file), dest_prefix + rendered_filename
+
+    def _write_file(
+        self,
+        src_file: str,
+        dest_file: str,
+        context: Dict[str, Any],
+        memory_budget: Optional[Any] = None,
+    ) -> Tuple[str, str, Optional[bytes]]:
+        """
+        Render or copy a single template file as bytes.
+
+        The first block is sniffed for NUL bytes; binary files are streamed through
+        unchanged. Text files are decoded only when they contain Jinja2 markup and
+        are valid UTF-8, and are re-encoded with their original BOM and newline
+        style. The source file's permission bits are applied to the output.
+
+        When a memory budget is given, a text file's size is reserved from it
+        before the file is read and released once the output is written, so
+        concurrent generations block instead of holding unbounded content.
+
+        Args:
+            src_file: Template file path
+            dest_file: Output file path
+            context: Rendering context
+            memory_budget: Optional ByteBudget to reserve from
+
+        Returns:
+            Hex SHA-256 of the written content and of the template file, and
+            the written content of a text file (None for a binary file)
+
+        Raises:
+            RuntimeError: If the file content fails to render
+        """
+        with open(src_file, "rb") as src:
+            src_stat = os.fstat(src.fileno())
+            mode = src_stat.st_mode
+            head = src.read(_SNIFF_SIZE)
+            if b"\0" in head:
+                digest = hashlib.sha256()
+                with open(dest_file, "wb") as dest:
+                    chunk = head
+                    while chunk:
+                        digest.update(chunk)
+                        dest.write(chunk)
+                        chunk = src.read(_COPY_CHUNK_SIZE)
+                os.chmod(dest_file, stat.S_IMODE(mode))
+                # Binary files are copied unchanged
+                return digest.hexdigest(), digest.hexdigest(), None
+            reserved = src_stat.st_size if memory_budget is not None else 0
+            if reserved:
+                memory_budget.acquire(reserved)
+            try:
+                data = head + src.read()
+                source_digest = hashlib.sha256(data)
+                output = self._render_bytes(data, context, src_file)
+                del data
+                with open(dest_file, "wb") as dest:
+                    dest.write(output)
+                digest = hashlib.sha256(output)
+            finally:
+                if reserved:
+                    memory_budget.release(reserved)
+        os.chmod(dest_file, stat.S_IMODE(mode))
+        return digest.hexdigest(), source_digest.hexdigest(), output
+
+    def render_file(self, src_file: str, context: Dict[str, Any]) -> bytes:
+        """
+        Render a single template file in memory.
+
+        Args:
+            src_file: Template file path, e.g. a value from plan_template
+            context: Rendering context
+
+        Returns:
+            Output content, exactly as apply_template would write it
+
+        Raises:
+            RuntimeError: If the file content fails to render
+        """
+        with open(src_file, "rb") as f:
+            data = f.read()
+        if b"\0" in data[:_SNIFF_SIZE]:
+            return data
+        return self._render_bytes(data, _sanitize_context(context), src_file)
+
+    def _render_bytes(self, data: bytes, context: Dict[str, Any], src_file: str) -> bytes:
+        """
+        Render text file content, passing through anything that is not a template.
+
+        Args:
+            data: Raw file content
+            context: Rendering context
+            src_file: Template file path, for error messages
+
+        Returns:
+            Output file content
+
+        Raises:
+            RuntimeError: If the content fails to render
+        """
+        if not any(marker in data for marker in _JINJA_MARKERS):
+            return data
+        bom = _UTF8_BOM if data.startswith(_UTF8_BOM) else b""
+        try:
+            text = data[len(bom) :].decode("utf-8")
+        except UnicodeDecodeError:
+            logger.debug(f"Copying non-UTF-8 file without rendering: {src_file}")
+            return data
+        env = self.env
+        if "\r\n" in text:
+            env = self._get_crlf_env()
+        try:
+            rendered = env.from_string(text).render(**context)
+        except Exception as e:
+            raise RuntimeError(f"Template rendering error in {src_file}: {e}")
+        return bom + rendered.encode("utf-8")
+
+    def _get_crlf_env(self) -> Environment:
+        """
+        Get an overlay of the Jinja2 environment that emits CRLF line endings.
+
+        Returns:
+            Environment sharing configuration with self.env
+        """
+        if self._crlf_env is None:
+            self._crlf_env = self.env.overlay(newline_sequence="\r\n")
+        return self._crlf_env
+
+    def _render_path(
+        self,
+        entry: Dict[str, Any],
+        name: str,
+        context: Dict[str, Any],
+        rendered_names: Dict[str, str],
+        rel_path: str,
+    ) -> str:
+        """
+        Render a single file or directory name.
+
+        Names without Jinja2 markup are returned unchanged. Otherwise the compiled
+        template is taken from (or added to) the template index, and the result is
+        memoized in ``rendered_names`` for the rest of the generation.
+
+        Args:
+            entry: Template index entry from _get_template_index
+            name: File or directory name as it appears in the template
+            context: Rendering context
+            rendered_names: Per-generation cache of rendered names
+            rel_path: Path relative to the template root, for error messages
+
+        Returns:
+            Rendered name
+
+        Raises:
+            RuntimeError: If the name fails to compile or render, or renders to an
+                          empty or multi-component path
+        """
+        if "{" not in name:
+            return name
+        rendered = rendered_names.get(name)
+        if rendered is not None:
+            return rendered
+        try:
+            template = entry["path_templates"].get(name)
+            if template is None:
+                template = self.env.from_string(name)
+                entry["path_templates"][name] = template
+            rendered = template.render(**context)
+        except Exception as e:
+            raise RuntimeError(f"Path rendering error in {rel_path}: {e}")
+        if not rendered or rendered in (".", "..") or "/" in rendered or os.sep in rendered:
+            raise RuntimeError(f"Path rendering error in {rel_path}: invalid name {rendered!r}")
+        rendered_names[name] = rendered
+        return rendered
 
     def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """
@@ -180,4 +627,4 @@ class TemplateManager:
 # Create a singleton instance
 template_manager = TemplateManager()
 
-__all__ = ["TemplateManager", "template_manager"]
+__all__ = ["TemplateManager", "template_manager", "template_names_cache", "refresh_template_names_cache"]
@@ -0,0 +1,196 @@
+"""
+Conditional inclusion rules for templates.
+
+This module compiles the declarative ``rules`` section of a template's
+``template.json`` into predicates that can be evaluated against a rendering
+context before any template file is opened.
+
+A rule names one or more glob patterns (relative to the template directory,
+using ``/`` separators) and an optional ``when`` condition::
+
+    "rules": [
+        {"when": "use_docker", "include": ["Dockerfile", "docker/**"]},
+        {"when": "not with_docs", "exclude": ["docs/**"]},
+        {"when": "database == 'sqlite'", "exclude": ["migrations/**"]},
+        {"exclude": ["*.pyc"]}
+    ]
+
+``include`` patterns are kept only while their condition holds; ``exclude``
+patterns are dropped while their condition holds (always, if there is no
+condition). Conditions are plain variable lookups, optionally negated with
+``not`` or compared with ``==``/``!=`` against a JSON literal, so they never
+go through Jinja2.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import json
+import re
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+_CONDITION_RE = re.compile(r"^\s*(not\s+)?([A-Za-z_][\w.]*)\s*(?:(==|!=)\s*(.+?))?\s*$")
+_MISSING = object()
+
+Condition = Callable[[Dict[str, Any]], bool]
+CompiledRule = Tuple[Condition, Tuple[str, ...]]
+
+
+def _lookup(context: Dict[str, Any], name: str) -> Any:
+    value: Any = context
+    for part in name.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _parse_literal(text: str) -> Any:
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] == "'":
+        return text[1:-1]
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def compile_condition(expression: Optional[str]) -> Condition:
+    """
+    Compile a ``when`` expression into a predicate over the context.
+
+    Args:
+        expression: Condition such as ``"use_docker"``, ``"not with_docs"`` or
+                    ``"database == 'sqlite'"``. None means "always".
+
+    Returns:
+        Callable taking the context and returning whether the condition holds
+
+    Raises:
+        ValueError: If the expression cannot be parsed
+    """
+    if expression is None:
+        return lambda context: True
+    match = _CONDITION_RE.match(expression)
+    if not match:
+        raise ValueError(f"Invalid rule condition: {expression!r}")
+    negate, name, operator, literal = match.groups()
+    if operator:
+        if negate:
+            raise ValueError(f"Cannot combine 'not' with a comparison: {expression!r}")
+        expected = _parse_literal(literal)
+        if operator == "==":
+            return lambda context: _lookup(context, name) == expected
+        return lambda context: _lookup(context, name) != expected
+
+    def truthy(context: Dict[str, Any]) -> bool:
+        value = _lookup(context, name)
+        return value is not _MISSING and bool(value)
+
+    if negate:
+        return lambda context: not truthy(context)
+    return truthy
+
+
+def _as_patterns(value: Any, key: str) -> Tuple[str, ...]:
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list) or not all(isinstance(p, str) for p in value):
+        raise ValueError(f"Rule '{key}' must be a glob pattern or a list of glob patterns")
+    return tuple(p.strip("/") for p in value)
+
+
+def compile_rules(rules: Optional[Sequence[Dict[str, Any]]]) -> List[CompiledRule]:
+    """
+    Compile the ``rules`` section of a template configuration.
+
+    Each compiled rule is a ``(condition, patterns)`` pair where the patterns
+    are skipped whenever the condition holds for the context.
+
+    Args:
+        rules: Rule dictionaries from ``template.json``
+
+    Returns:
+        List of compiled rules
+
+    Raises:
+        ValueError: If a rule is malformed
+    """
+    compiled: List[CompiledRule] = []
+    for rule in rules or []:
+        if not isinstance(rule, dict):
+            raise ValueError(f"Template rule must be an object, got: {rule!r}")
+        condition = compile_condition(rule.get("when"))
+        include = _as_patterns(rule.get("include"), "include")
+        exclude = _as_patterns(rule.get("exclude"), "exclude")
+        if not include and not exclude:
+            raise ValueError(f"Template rule needs 'include' or 'exclude' patterns: {rule!r}")
+        if include:
+            compiled.append((lambda context, c=condition: not c(context), include))
+        if exclude:
+            compiled.append((condition, exclude))
+    return compiled
+
+
+def resolve_skip_patterns(compiled: List[CompiledRule], context: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    Evaluate compiled rules once and return the patterns to skip.
+
+    Args:
+        compiled: Rules from compile_rules
+        context: Rendering context
+
+    Returns:
+        Glob patterns for paths that must not be generated
+    """
+    patterns: List[str] = []
+    for condition, rule_patterns in compiled:
+        if condition(context):
+            patterns.extend(rule_patterns)
+    return tuple(patterns)
+
+
+def is_dir_skipped(rel_dir: str, patterns: Sequence[str]) -> bool:
+    """
+    Check whether a whole directory is excluded, so it need not be walked.
+
+    Args:
+        rel_dir: Directory path relative to the template root, ``/``-separated
+        patterns: Active skip patterns
+
+    Returns:
+        True if nothing under the directory can be generated
+    """
+    for pattern in patterns:
+        if pattern.endswith("/**"):
+            pattern = pattern[:-3]
+        if fnmatchcase(rel_dir, pattern):
+            return True
+    return False
+
+
+def is_file_skipped(rel_file: str, patterns: Sequence[str]) -> bool:
+    """
+    Check whether a file is excluded.
+
+    Args:
+        rel_file: File path relative to the template root, ``/``-separated
+        patterns: Active skip patterns
+
+    Returns:
+        True if the file must not be generated
+    """
+    return any(fnmatchcase(rel_file, pattern) for pattern in patterns)
+
+
+__all__ = [
+    "compile_condition",
+    "compile_rules",
+    "resolve_skip_patterns",
+    "is_dir_skipped",
+    "is_file_skipped",
+]
@@ -0,0 +1,102 @@
+"""
+Line-based three-way merge for template upgrades.
+
+This module merges the user's version of a generated file with a newer
+template's version, given the original generated content they both derive
+from. Regions of the base that both sides kept unchanged are synchronization
+points; between them, a side that left the base alone takes the other side's
+change, identical changes are taken once, and differing changes become a
+conflict marked in the style of ``git merge-file``.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+from difflib import SequenceMatcher
+from typing import List, Sequence, Tuple
+
+CONFLICT_START = b"<<<<<<< ours\n"
+CONFLICT_SEPARATOR = b"=======\n"
+CONFLICT_END = b">>>>>>> template\n"
+
+
+def _sync_regions(base: Sequence[bytes], ours: Sequence[bytes], theirs: Sequence[bytes]) -> List[Tuple[int, ...]]:
+    """
+    Find regions of base matched, unchanged, in both other versions.
+
+    Returns:
+        Tuples of (base_start, base_end, ours_start, ours_end, theirs_start,
+        theirs_end), ending with an empty region at the end of each sequence
+    """
+    ours_blocks = SequenceMatcher(None, base, ours, autojunk=False).get_matching_blocks()
+    theirs_blocks = SequenceMatcher(None, base, theirs, autojunk=False).get_matching_blocks()
+    regions = []
+    i = j = 0
+    while i < len(ours_blocks) and j < len(theirs_blocks):
+        o_base, o_start, o_len = ours_blocks[i]
+        t_base, t_start, t_len = theirs_blocks[j]
+        start = max(o_base, t_base)
+        end = min(o_base + o_len, t_base + t_len)
+        if start < end:
+            o_sub = o_start + start - o_base
+            t_sub = t_start + start - t_base
+            regions.append((start, end, o_sub, o_sub + end - start, t_sub, t_sub + end - start))
+        if o_base + o_len < t_base + t_len:
+            i += 1
+        else:
+            j += 1
+    regions.append((len(base), len(base), len(ours), len(ours), len(theirs), len(theirs)))
+    return regions
+
+
+def _terminated(lines: Sequence[bytes]) -> List[bytes]:
+    lines = list(lines)
+    if lines and not lines[-1].endswith(b"\n"):
+        lines[-1] += b"\n"
+    return lines
+
+
+def merge3(base: bytes, ours: bytes, theirs: bytes) -> Tuple[bytes, int]:
+    """
+    Merge two versions of a file that both derive from base.
+
+    Args:
+        base: Content the template originally generated
+        ours: Current content in the project (the user's changes)
+        theirs: Content the new template generates
+
+    Returns:
+        Tuple of (merged content, number of conflicts). Conflicts are written
+        into the content between ``<<<<<<< ours`` and ``>>>>>>> template``
+        markers.
+    """
+    base_lines = base.splitlines(keepends=True)
+    ours_lines = ours.splitlines(keepends=True)
+    theirs_lines = theirs.splitlines(keepends=True)
+    merged: List[bytes] = []
+    conflicts = 0
+    b = o = t = 0
+    for b_start, b_end, o_start, o_end, t_start, t_end in _sync_regions(base_lines, ours_lines, theirs_lines):
+        base_chunk = base_lines[b:b_start]
+        ours_chunk = ours_lines[o:o_start]
+        theirs_chunk = theirs_lines[t:t_start]
+        if ours_chunk == theirs_chunk or theirs_chunk == base_chunk:
+            merged.extend(ours_chunk)
+        elif ours_chunk == base_chunk:
+            merged.extend(theirs_chunk)
+        else:
+            conflicts += 1
+            if merged and not merged[-1].endswith(b"\n"):
+                merged[-1] += b"\n"
+            merged.append(CONFLICT_START)
+            merged.extend(_terminated(ours_chunk))
+            merged.append(CONFLICT_SEPARATOR)
+            merged.extend(_terminated(theirs_chunk))
+            merged.append(CONFLICT_END)
+        merged.extend(base_lines[b_start:b_end])
+        b, o, t = b_end, o_end, t_end
+    return b"".join(merged), conflicts
+
+
+__all__ = ["merge3", "CONFLICT_START", "CONFLICT_SEPARATOR", "CONFLICT_END"]
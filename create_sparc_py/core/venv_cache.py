@@ -0,0 +1,357 @@
+"""
+Prebuilt virtual environment cache for generated projects.
+
+This module provides the VenvCache class, which keeps fully installed virtual
+environments keyed on the Python version and the SHA-256 of a rendered
+``requirements.txt``. A generated project receives a clone of the matching
+environment instead of creating a venv and installing from scratch.
+
+Environments are built offline from a local Wheelhouse, which installs with
+``pip --no-index --find-links <wheelhouse>``, so the network is never used.
+Clones never share files with the cache. With hardlinks, any in-place write
+in a project's ``.venv`` (patching an installed module, or a tool that
+rewrites a file without unlinking it first) would silently change the cached
+environment and every other project cloned from it. Files are copied
+instead: as copy-on-write reflinks where the filesystem supports them (Btrfs,
+XFS, APFS through the platform copy), through ``copy_file_range`` where it is
+available, and by a plain copy otherwise. The few files that embed the
+environment's absolute path (activation scripts, console-script shebangs and
+``pyvenv.cfg``) are rewritten for the new location. The cache is trimmed
+least-recently-used first once it exceeds its size limit.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from create_sparc_py.core.wheelhouse import Wheelhouse, has_requirements
+from create_sparc_py.utils import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+DEFAULT_MAX_CACHE_BYTES = 2 * 1024 * 1024 * 1024
+METADATA_FILE = ".sparc-venv.json"
+# Files larger than this are never scanned for embedded paths
+_FIXUP_MAX_SIZE = 1024 * 1024
+# Linux ioctl that makes a file share the extents of another (reflink)
+_FICLONE = 0x40049409
+# Errors of a filesystem or platform without reflinks or copy_file_range
+_UNSUPPORTED = (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EBADF)
+
+
+def requirements_digest(requirements: bytes) -> str:
+    """
+    Compute the SHA-256 of rendered requirements content.
+
+    Args:
+        requirements: Raw ``requirements.txt`` content
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(requirements).hexdigest()
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _copy_file_range(src_fd: int, dst_fd: int) -> None:
+    """Copy a whole file in the kernel, which may share extents on filesystems that support it."""
+    while os.copy_file_range(src_fd, dst_fd, 1 << 30):
+        pass
+
+
+class VenvCache:
+    """
+    Cache of prebuilt virtual environments.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        wheelhouse: Optional[Union[str, Path]] = None,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        python: Optional[str] = None,
+        with_pip: bool = True,
+    ):
+        """
+        Initialize the VenvCache.
+
+        Args:
+            cache_dir: Directory holding cached environments
+            wheelhouse: Local directory of wheels to install from
+            max_bytes: Total cache size above which old entries are evicted
+            python: Interpreter used to create environments (default: current)
+            with_pip: Whether created environments include pip
+        """
+        self.cache_dir = Path(cache_dir)
+        self.wheelhouse = Wheelhouse(wheelhouse) if wheelhouse else None
+        self.max_bytes = max_bytes
+        self.python = python or sys.executable
+        self.with_pip = with_pip
+
+    def _python_tag(self) -> str:
+        if self.python == sys.executable:
+            return f"{sys.implementation.name}-{platform.python_version()}"
+        result = subprocess.run(
+            [self.python, "-c", "import sys, platform; print(sys.implementation.name, platform.python_version())"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return "-".join(result.stdout.split())
+
+    def cache_key(self, requirements: bytes) -> str:
+        """
+        Compute the cache key for requirements on this interpreter.
+
+        Args:
+            requirements: Raw ``requirements.txt`` content
+
+        Returns:
+            Cache key, also used as the entry's directory name
+        """
+        return f"{self._python_tag()}-{requirements_digest(requirements)[:32]}"
+
+    def _read_metadata(self, entry: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(entry / METADATA_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _build(self, entry: Path, requirements: bytes) -> None:
+        """
+        Build a new environment and move it into place as ``entry``.
+
+        Args:
+            entry: Final cache entry directory
+            requirements: Raw ``requirements.txt`` content
+
+        Raises:
+            RuntimeError: If venv creation or the offline install fails
+        """
+        install = has_requirements(requirements)
+        if install and (self.wheelhouse is None or not self.wheelhouse.exists()):
+            location = self.wheelhouse.path if self.wheelhouse else None
+            raise RuntimeError(f"Wheelhouse not found: {location}; run 'create-sparc wheelhouse sync' first")
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=".build-", dir=self.cache_dir))
+        try:
+            venv_dir = staging / "venv"
+            command = [self.python, "-m", "venv", str(venv_dir)]
+            if not self.with_pip:
+                command.append("--without-pip")
+            result = subprocess.run(command, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(f"Failed to create virtual environment: {result.stderr.strip()}")
+
+            if install:
+                self.wheelhouse.install(requirements, str(self._bin_dir(venv_dir) / "python"))
+
+            metadata = {
+                "key": entry.name,
+                "python": self._python_tag(),
+                "requirements_sha256": requirements_digest(requirements),
+                "prefix": str(venv_dir),
+                "size": _tree_size(venv_dir),
+                "created": time.time(),
+            }
+            with open(venv_dir / METADATA_FILE, "w", encoding="utf-8") as f:
+                json.dump(metadata, f, indent=2)
+            try:
+                os.rename(venv_dir, entry)
+            except OSError as e:
+                # Another process finished the same entry first; keep theirs
+                if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    @staticmethod
+    def _bin_dir(venv_dir: Path) -> Path:
+        scripts = venv_dir / "Scripts"
+        return scripts if scripts.is_dir() else venv_dir / "bin"
+
+    def get(self, requirements: bytes) -> Path:
+        """
+        Get the cached environment for requirements, building it if needed.
+
+        Args:
+            requirements: Raw ``requirements.txt`` content
+
+        Returns:
+            Path of the cache entry
+
+        Raises:
+            RuntimeError: If the environment has to be built and the build fails
+        """
+        entry = self.cache_dir / self.cache_key(requirements)
+        if self._read_metadata(entry) is None:
+            if entry.exists():
+                shutil.rmtree(entry, ignore_errors=True)
+            logger.info(f"Building cached virtual environment {entry.name}")
+            self._build(entry, requirements)
+        else:
+            logger.verbose(f"Using cached virtual environment {entry.name}")
+        # The metadata file's mtime records when the entry was last used
+        os.utime(entry / METADATA_FILE)
+        self.evict(keep=entry.name)
+        return entry
+
+    def clone(self, entry: Path, dest: Union[str, Path]) -> None:
+        """
+        Materialize a cache entry at ``dest``.
+
+        Regular files are copied, as reflinks where the filesystem supports
+        them, and symlinks are recreated; the clone shares no file with the
+        cache entry. Small files in the scripts directory and ``pyvenv.cfg``
+        that embed the build location are copied with that path rewritten to
+        ``dest``.
+
+        Args:
+            entry: Cache entry from get()
+            dest: Destination directory; must not exist
+
+        Raises:
+            FileExistsError: If dest already exists
+        """
+        dest = Path(dest).absolute()
+        if dest.exists():
+            raise FileExistsError(f"Virtual environment destination already exists: {dest}")
+        metadata = self._read_metadata(entry) or {}
+        old_prefix = os.fsencode(metadata.get("prefix", str(entry)))
+        new_prefix = os.fsencode(str(dest))
+        bin_dir = self._bin_dir(entry)
+        # Fast copy methods still worth trying; dropped after the first failure
+        methods = {"reflink": fcntl is not None, "copy_file_range": hasattr(os, "copy_file_range")}
+
+        for root, dirs, files in os.walk(entry):
+            rel_root = os.path.relpath(root, entry)
+            target_root = dest / rel_root if rel_root != "." else dest
+            target_root.mkdir(parents=True, exist_ok=True)
+            for name in dirs + files:
+                src = os.path.join(root, name)
+                if os.path.islink(src):
+                    os.symlink(os.readlink(src), target_root / name)
+                    if name in dirs:
+                        dirs.remove(name)
+            for name in files:
+                src = os.path.join(root, name)
+                target = target_root / name
+                if os.path.islink(src) or name == METADATA_FILE:
+                    continue
+                needs_fixup = (Path(root) == bin_dir or (rel_root == "." and name == "pyvenv.cfg")) and (
+                    os.path.getsize(src) <= _FIXUP_MAX_SIZE
+                )
+                if needs_fixup:
+                    with open(src, "rb") as f:
+                        data = f.read()
+                    if old_prefix in data:
+                        target.write_bytes(data.replace(old_prefix, new_prefix))
+                        shutil.copymode(src, target)
+                        continue
+                self._copy(src, target, methods)
+
+    @staticmethod
+    def _copy(src: str, target: Path, methods: Dict[str, bool]) -> None:
+        """
+        Copy a file with its mode and timestamps, using the fastest method that works.
+
+        Timestamps are kept because bytecode caches are validated against the
+        modification time of their sources.
+
+        Args:
+            src: File to copy
+            target: New file
+            methods: Fast methods to try ('reflink', 'copy_file_range'); a
+                     method is switched off here when the filesystem rejects it
+        """
+        if methods["reflink"] or methods["copy_file_range"]:
+            with open(src, "rb") as fsrc, open(target, "wb") as fdst:
+                for method in ("reflink", "copy_file_range"):
+                    if not methods[method]:
+                        continue
+                    try:
+                        if method == "reflink":
+                            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                        else:
+                            _copy_file_range(fsrc.fileno(), fdst.fileno())
+                        break
+                    except OSError as e:
+                        if e.errno not in _UNSUPPORTED:
+                            raise
+                        methods[method] = False
+                        fsrc.seek(0)
+                        fdst.seek(0)
+                        fdst.truncate()
+                else:
+                    shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+            shutil.copystat(src, target)
+        else:
+            shutil.copy2(src, target)
+
+    def evict(self, keep: Optional[str] = None) -> List[str]:
+        """
+        Remove least-recently-used entries until the cache fits its limit.
+
+        Args:
+            keep: Entry name that must not be evicted (the one in use)
+
+        Returns:
+            Names of the evicted entries
+        """
+        if not self.cache_dir.is_dir():
+            return []
+        entries = []
+        total = 0
+        for item in os.scandir(self.cache_dir):
+            if not item.is_dir(follow_symlinks=False) or item.name.startswith("."):
+                continue
+            metadata = self._read_metadata(Path(item.path))
+            if metadata is None:
+                continue
+            last_used = os.stat(os.path.join(item.path, METADATA_FILE)).st_mtime
+            entries.append((last_used, item.name, metadata.get("size", 0)))
+            total += metadata.get("size", 0)
+
+        evicted = []
+        for _, name, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            shutil.rmtree(self.cache_dir / name, ignore_errors=True)
+            total -= size
+            evicted.append(name)
+        if evicted:
+            logger.verbose(f"Evicted cached virtual environments: {', '.join(evicted)}")
+        return evicted
+
+
+__all__ = ["VenvCache", "requirements_digest", "DEFAULT_MAX_CACHE_BYTES", "METADATA_FILE"]
@@ -0,0 +1,246 @@
+"""
+Local wheelhouse for offline dependency installation.
+
+This module provides the Wheelhouse class, which manages a local directory of
+wheels. ``sync`` populates it from a set of requirements files on a machine
+with network access; everything else works offline and always installs with
+``--no-index --find-links <wheelhouse>``.
+
+Dependency resolution is cached per interpreter and requirements hash under
+``<wheelhouse>/.resolved``. The first install of a requirements set asks pip
+for a dry-run resolution report and records the exact wheel files chosen;
+later installs pass those files to pip with ``--no-deps``, skipping the
+resolver entirely. Syncing the wheelhouse clears the resolution cache.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+from urllib.parse import unquote, urlparse
+
+from create_sparc_py.utils import logger
+
+RESOLVED_DIR = ".resolved"
+_PIP_FLAGS = ["--disable-pip-version-check", "--no-input"]
+
+
+def has_requirements(requirements: bytes) -> bool:
+    """
+    Check whether requirements content names any package.
+
+    Args:
+        requirements: Raw ``requirements.txt`` content
+
+    Returns:
+        True if there is at least one line that is not blank or a comment
+    """
+    for line in requirements.decode("utf-8", errors="replace").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def _python_tag(python: str) -> str:
+    result = subprocess.run(
+        [python, "-c", "import sys, sysconfig; print(sys.implementation.cache_tag, sysconfig.get_platform())"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return "-".join(result.stdout.split())
+
+
+class Wheelhouse:
+    """
+    Local directory of wheels used for offline installs.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the Wheelhouse.
+
+        Args:
+            path: Wheelhouse directory
+        """
+        self.path = Path(path)
+
+    def exists(self) -> bool:
+        """
+        Check whether the wheelhouse directory exists.
+
+        Returns:
+            True if the directory exists
+        """
+        return self.path.is_dir()
+
+    def list_wheels(self) -> List[str]:
+        """
+        List the wheel files in the wheelhouse.
+
+        Returns:
+            Sorted wheel file names
+        """
+        if not self.exists():
+            return []
+        return sorted(entry.name for entry in os.scandir(self.path) if entry.name.endswith(".whl"))
+
+    def sync(self, requirements_files: Sequence[Union[str, Path]], python: Optional[str] = None) -> List[str]:
+        """
+        Download or build wheels for requirements into the wheelhouse.
+
+        This is the only operation that uses the network.
+
+        Args:
+            requirements_files: Requirements files to populate from
+            python: Interpreter whose pip builds the wheels (default: current)
+
+        Returns:
+            Names of wheels added to the wheelhouse
+
+        Raises:
+            RuntimeError: If pip fails
+        """
+        before = set(self.list_wheels())
+        self.path.mkdir(parents=True, exist_ok=True)
+        command = [python or sys.executable, "-m", "pip", "wheel", *_PIP_FLAGS, "--wheel-dir", str(self.path)]
+        for requirements_file in requirements_files:
+            command.extend(["-r", str(requirements_file)])
+        logger.info(f"Syncing wheelhouse {self.path}")
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"Wheelhouse sync failed: {result.stderr.strip()}")
+        # New wheels can change what a requirements set resolves to
+        shutil.rmtree(self.path / RESOLVED_DIR, ignore_errors=True)
+        return sorted(set(self.list_wheels()) - before)
+
+    def _resolution_file(self, requirements: bytes, python: str) -> Path:
+        digest = hashlib.sha256(_python_tag(python).encode("utf-8") + b"\0" + requirements).hexdigest()
+        return self.path / RESOLVED_DIR / f"{digest}.json"
+
+    def resolve(self, requirements: bytes, python: str) -> Optional[List[str]]:
+        """
+        Resolve requirements to exact wheel files, using the resolution cache.
+
+        Args:
+            requirements: Raw ``requirements.txt`` content
+            python: Interpreter of the target environment
+
+        Returns:
+            Wheel file names to install, or None if pip cannot produce a
+            resolution report (in which case a normal offline install is needed)
+
+        Raises:
+            RuntimeError: If the requirements cannot be satisfied from the wheelhouse
+        """
+        cache_file = self._resolution_file(requirements, python)
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                wheels = json.load(f)["wheels"]
+            if all((self.path / wheel).exists() for wheel in wheels):
+                logger.verbose(f"Using cached resolution {cache_file.stem[:12]}")
+                return wheels
+        except (OSError, ValueError, KeyError):
+            pass
+
+        with tempfile.TemporaryDirectory() as tmp:
+            requirements_file = Path(tmp) / "requirements.txt"
+            requirements_file.write_bytes(requirements)
+            report_file = Path(tmp) / "report.json"
+            result = subprocess.run(
+                [
+                    python,
+                    "-m",
+                    "pip",
+                    "install",
+                    *_PIP_FLAGS,
+                    "--dry-run",
+                    "--ignore-installed",
+                    "--quiet",
+                    "--no-index",
+                    "--find-links",
+                    str(self.path),
+                    "--report",
+                    str(report_file),
+                    "-r",
+                    str(requirements_file),
+                ],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                if "--report" in result.stderr or "--dry-run" in result.stderr:
+                    logger.debug("pip does not support resolution reports; resolver cache disabled")
+                    return None
+                raise RuntimeError(f"Cannot resolve requirements from wheelhouse: {result.stderr.strip()}")
+            with open(report_file, "r", encoding="utf-8") as f:
+                report = json.load(f)
+
+        wheels = []
+        for item in report.get("install", []):
+            url = item.get("download_info", {}).get("url", "")
+            wheels.append(Path(unquote(urlparse(url).path)).name)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"wheels": wheels}, f, indent=2)
+        os.replace(tmp_file, cache_file)
+        return wheels
+
+    def install(self, requirements: bytes, python: str) -> None:
+        """
+        Install requirements into an environment without touching the network.
+
+        Args:
+            requirements: Raw ``requirements.txt`` content
+            python: Interpreter of the target environment
+
+        Raises:
+            RuntimeError: If the wheelhouse is missing or installation fails
+        """
+        if not has_requirements(requirements):
+            return
+        if not self.exists():
+            raise RuntimeError(f"Wheelhouse not found: {self.path}; run 'create-sparc wheelhouse sync' first")
+
+        wheels = self.resolve(requirements, python)
+        with tempfile.TemporaryDirectory() as tmp:
+            command = [python, "-m", "pip", "install", *_PIP_FLAGS, "--no-index", "--find-links", str(self.path)]
+            if wheels is not None:
+                command.append("--no-deps")
+                command.extend(str(self.path / wheel) for wheel in wheels)
+            else:
+                requirements_file = Path(tmp) / "requirements.txt"
+                requirements_file.write_bytes(requirements)
+                command.extend(["-r", str(requirements_file)])
+            result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"Offline install failed: {result.stderr.strip()}")
+
+    def status(self) -> Dict[str, int]:
+        """
+        Summarize the wheelhouse contents.
+
+        Returns:
+            Dictionary with 'wheels' and 'resolutions' counts
+        """
+        resolved = self.path / RESOLVED_DIR
+        return {
+            "wheels": len(self.list_wheels()),
+            "resolutions": len(list(resolved.glob("*.json"))) if resolved.is_dir() else 0,
+        }
+
+
+__all__ = ["Wheelhouse", "has_requirements", "RESOLVED_DIR"]
@@ -0,0 +1,51 @@
+"""
+{{ name }} API handlers for {{ project_name }}.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+class {{ class_name }}Api:
+    """
+    Handlers for the {{ name }} resource, backed by an in-memory store.
+    """
+
+    def __init__(self):
+        """Initialize the {{ class_name }}Api."""
+        self._items: Dict[str, Dict[str, Any]] = {}
+
+    def list(self) -> List[Dict[str, Any]]:
+        """
+        List all items.
+
+        Returns:
+            All stored items
+        """
+        return list(self._items.values())
+
+    def get(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an item by ID.
+
+        Args:
+            item_id: Item ID
+
+        Returns:
+            The item, or None if it does not exist
+        """
+        return self._items.get(item_id)
+
+    def create(self, item_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create or replace an item.
+
+        Args:
+            item_id: Item ID
+            data: Item fields
+
+        Returns:
+            The stored item
+        """
+        item = {"id": item_id, **data}
+        self._items[item_id] = item
+        return item
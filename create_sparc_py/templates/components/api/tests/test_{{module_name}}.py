@@ -0,0 +1,13 @@
+"""
+Tests for the {{ name }} API handlers.
+"""
+
+from {{ import_path }} import {{ class_name }}Api
+
+
+def test_create_and_get():
+    """Test that created items can be fetched and listed."""
+    api = {{ class_name }}Api()
+    api.create("1", {"name": "example"})
+    assert api.get("1") == {"id": "1", "name": "example"}
+    assert len(api.list()) == 1
@@ -0,0 +1,8 @@
+"""
+{{ name }} module for {{ project_name }}.
+"""
+
+
+def run() -> None:
+    """Run the {{ name }} module."""
+    pass
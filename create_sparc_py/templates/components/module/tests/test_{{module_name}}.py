@@ -0,0 +1,10 @@
+"""
+Tests for the {{ name }} module.
+"""
+
+from {{ import_path }} import run
+
+
+def test_run():
+    """Test that the module runs."""
+    assert run() is None
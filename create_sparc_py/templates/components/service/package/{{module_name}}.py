@@ -0,0 +1,28 @@
+"""
+{{ name }} service for {{ project_name }}.
+"""
+
+from typing import Any, Dict, Optional
+
+
+class {{ class_name }}Service:
+    """
+    {{ name }} service.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the {{ class_name }}Service.
+
+        Args:
+            config: Service configuration
+        """
+        self.config = config or {}
+
+    def start(self) -> None:
+        """Start the service."""
+        pass
+
+    def stop(self) -> None:
+        """Stop the service."""
+        pass
@@ -0,0 +1,11 @@
+"""
+Tests for the {{ name }} service.
+"""
+
+from {{ import_path }} import {{ class_name }}Service
+
+
+def test_service_config():
+    """Test that the service keeps its configuration."""
+    service = {{ class_name }}Service({"enabled": True})
+    assert service.config == {"enabled": True}
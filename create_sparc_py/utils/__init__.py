@@ -2,25 +2,148 @@
 Shared utilities for create-sparc-py.
 
 This module provides utility functions and classes that are used throughout
-the create-sparc-py package, including logging, error handling, and file system
-operations.
+the create-sparc-py package, including logging, structured (JSON) output,
+error handling, and file system operations.
 
 This project is a Python port of the original create-sparc Node.js tool created by
 Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
 https://github.com/ruvnet/rUv-dev.
 """
 
+import atexit
 import os
 import shutil
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any, Iterator
 
-import colorama
-from colorama import Fore, Style
+_colorama = None
 
 
-# Initialize colorama for cross-platform colored terminal output
-colorama.init(autoreset=True)
+def _get_colorama() -> Any:
+    """Import colorama and initialize it for cross-platform colored output, on first use."""
+    global _colorama
+    if _colorama is None:
+        import colorama
+
+        colorama.init(autoreset=True)
+        _colorama = colorama
+    return _colorama
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the values JSON has no type for: paths as strings, sets as sorted lists."""
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class Output:
+    """
+    Structured output of the CLI.
+
+    In the default text format commands print for people, and emit() does
+    nothing. In the json format every result, and every log message, is
+    written to standard output as one JSON record per line (NDJSON), each
+    with a "type" field, encoded by create_sparc_py.core.json_codec (with
+    orjson, when installed). Records are buffered and written in large blocks to
+    the stream underneath sys.stdout, bypassing colorama; the buffer is
+    flushed when it fills, when a command finishes and at exit.
+    """
+
+    FORMATS = ("text", "json")
+
+    # Buffered bytes that trigger a write
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self) -> None:
+        """Initialize the output in the text format."""
+        self._format = "text"
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+
+    def set_format(self, output_format: str) -> None:
+        """
+        Set the output format.
+
+        Args:
+            output_format: One of FORMATS
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Invalid output format: {output_format}. Valid formats are: {', '.join(self.FORMATS)}")
+        if output_format != self._format:
+            self.flush()
+        self._format = output_format
+
+    def get_format(self) -> str:
+        """
+        Get the output format.
+
+        Returns:
+            Current output format
+        """
+        return self._format
+
+    def is_json(self) -> bool:
+        """
+        Check whether results are written as JSON records.
+
+        Returns:
+            True in the json format, False in the text format
+        """
+        return self._format == "json"
+
+    def emit(self, record_type: str, **fields: Any) -> bool:
+        """
+        Write a structured record, in the json format.
+
+        Commands call this with each result and print their text output only
+        if it returns False:
+
+            if not output.emit("status", path=path, clean=3):
+                print(f"{path}: 3 files clean")
+
+        Args:
+            record_type: Kind of record, written as its "type" field
+            **fields: Fields of the record; paths and sets are converted
+
+        Returns:
+            True if the record was written, False in the text format
+        """
+        if self._format != "json":
+            return False
+        # Imported here: create_sparc_py.core imports this module
+        from create_sparc_py.core import json_codec
+
+        line = json_codec.dumps_line({"type": record_type, **fields}, default=_json_default)
+        self._buffer.append(line)
+        self._buffered += len(line)
+        if self._buffered >= self.BUFFER_SIZE:
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        """Write the buffered records to standard output."""
+        if not self._buffer:
+            return
+        data = b"".join(self._buffer)
+        self._buffer.clear()
+        self._buffered = 0
+        stream = sys.stdout
+        # Text already printed goes first; colorama's wrapper forwards .buffer to the real stream
+        stream.flush()
+        raw = getattr(stream, "buffer", None)
+        if raw is not None:
+            raw.write(data)
+            raw.flush()
+        else:
+            stream.write(data.decode("utf-8"))
+            stream.flush()
 
 
 class Logger:
@@ -80,6 +203,12 @@ class Logger:
         """
         return self.LEVELS[level] >= self.LEVELS[self._level]
 
+    def _write(self, level: str, message: str, color: str, prefix: str = "") -> None:
+        """Print a message in a colorama Fore color, or emit it as a log record in the json output format."""
+        if not output.emit("log", level=level, message=message):
+            colorama = _get_colorama()
+            print(f"{getattr(colorama.Fore, color)}{prefix}{message}{colorama.Style.RESET_ALL}")
+
     def debug(self, message: str) -> None:
         """
         Log a debug message (gray, only in debug mode).
@@ -88,7 +217,7 @@ class Logger:
             message: Message to log
         """
         if self._should_log("debug"):
-            print(f"{Fore.LIGHTBLACK_EX}[debug] {message}{Style.RESET_ALL}")
+            self._write("debug", message, "LIGHTBLACK_EX", "[debug] ")
 
     def verbose(self, message: str) -> None:
         """
@@ -98,7 +227,7 @@ class Logger:
             message: Message to log
         """
         if self._should_log("verbose"):
-            print(f"{Fore.BLUE}[verbose] {message}{Style.RESET_ALL}")
+            self._write("verbose", message, "BLUE", "[verbose] ")
 
     def info(self, message: str) -> None:
         """
@@ -108,7 +237,7 @@ class Logger:
             message: Message to log
         """
         if self._should_log("info"):
-            print(f"{Fore.WHITE}{message}{Style.RESET_ALL}")
+            self._write("info", message, "WHITE")
 
     def success(self, message: str) -> None:
         """
@@ -118,7 +247,7 @@ class Logger:
             message: Message to log
         """
         if self._should_log("info"):
-            print(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
+            self._write("success", message, "GREEN", "✓ ")
 
     def warning(self, message: str) -> None:
         """
@@ -128,7 +257,7 @@ class Logger:
             message: Message to log
         """
         if self._should_log("warning"):
-            print(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}")
+            self._write("warning", message, "YELLOW", "⚠ ")
 
     def error(self, message: str) -> None:
         """
@@ -138,7 +267,7 @@ class Logger:
             message: Message to log
         """
         if self._should_log("error"):
-            print(f"{Fore.RED}✖ {message}{Style.RESET_ALL}")
+            self._write("error", message, "RED", "✖ ")
 
 
 class ErrorHandler:
@@ -556,6 +685,8 @@ class PathUtils:
 
 
 # Create singleton instances
+output = Output()
+atexit.register(output.flush)
 logger = Logger()
 error_handler = ErrorHandler()
 fs_utils = FSUtils()
@@ -563,7 +694,7 @@ path_utils = PathUtils()
 
 
 # Re-export for easier imports
-__all__ = ["logger", "error_handler", "fs_utils", "path_utils"]
+__all__ = ["logger", "output", "error_handler", "fs_utils", "path_utils"]
 
 
 # File system utilities will be implemented next in a separate edit to keep this file manageable.
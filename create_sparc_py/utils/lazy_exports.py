@@ -0,0 +1,69 @@
+"""
+Lazily imported package exports.
+
+A package that re-exports names from its submodules imports every submodule
+as soon as anything inside it is imported. lazy_exports lets a package
+declare those names instead; each is imported from its submodule the first
+time it is accessed, so importing the package itself costs nothing.
+
+Importing a submodule binds the submodule to its name in the package,
+replacing an export of the same name (e.g. the ``init_command`` handler by
+the ``init_command`` module). Packages using lazy_exports keep the export in
+that case, as an eager ``from .init_command import run as init_command``
+would.
+
+This project is a Python port of the original create-sparc Node.js tool created by
+Reuven Cohen (https://github.com/ruvnet). The original project can be found at:
+https://github.com/ruvnet/rUv-dev.
+"""
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Dict, List, Tuple
+
+# Exported name -> (module to import it from, attribute of that module)
+Exports = Dict[str, Tuple[str, str]]
+
+
+class LazyExportsModule(ModuleType):
+    """Module type that imports its declared exports on first access."""
+
+    _lazy_exports: Exports
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names not yet in the module's namespace
+        try:
+            module_name, attribute = self._lazy_exports[name]
+        except KeyError:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module_name), attribute)
+        super().__setattr__(name, value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        export = self._lazy_exports.get(name)
+        if export is not None and isinstance(value, ModuleType) and value.__name__ == export[0]:
+            value = getattr(value, export[1])
+        super().__setattr__(name, value)
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | set(self._lazy_exports))
+
+
+def lazy_exports(module_name: str, exports: Exports) -> None:
+    """
+    Declare the lazily imported exports of a module.
+
+    Call this from the module itself, with ``__name__``.
+
+    Args:
+        module_name: Name of the module
+        exports: Mapping of exported names to (absolute module name, attribute)
+    """
+    module = sys.modules[module_name]
+    module.__dict__["_lazy_exports"] = exports
+    module.__class__ = LazyExportsModule
+
+
+__all__ = ["LazyExportsModule", "lazy_exports"]
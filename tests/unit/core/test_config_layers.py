@@ -0,0 +1,55 @@
+import unittest
+
+from create_sparc_py.core.config_layers import (
+    deep_merge,
+    diff_config,
+    env_overrides,
+    merge_layers,
+    parse_assignments,
+)
+
+
+class TestConfigLayers(unittest.TestCase):
+    """Test suite for the layered configuration helpers."""
+
+    def test_deep_merge(self):
+        """Test that nested dictionaries are merged key by key."""
+        base = {"ai_settings": {"model": "gpt-4", "temperature": 0.7}, "ai_provider": "openai"}
+        merged = deep_merge(base, {"ai_settings": {"model": "gpt-4o"}})
+        self.assertEqual({"model": "gpt-4o", "temperature": 0.7}, merged["ai_settings"])
+        self.assertEqual("gpt-4", base["ai_settings"]["model"])
+
+    def test_diff_config(self):
+        """Test that only values differing from the base are kept."""
+        base = {"a": 1, "nested": {"x": 1, "y": 2}}
+        self.assertEqual({"nested": {"y": 3}, "b": 2}, diff_config({"a": 1, "nested": {"x": 1, "y": 3}, "b": 2}, base))
+
+    def test_parse_assignments(self):
+        """Test parsing KEY=VALUE options with dotted keys and JSON values."""
+        parsed = parse_assignments(["ai_settings.temperature=0.2", "default_template=minimal", "flag=true"])
+        self.assertEqual({"ai_settings": {"temperature": 0.2}, "default_template": "minimal", "flag": True}, parsed)
+        with self.assertRaises(ValueError):
+            parse_assignments(["missing_value"])
+
+    def test_env_overrides(self):
+        """Test converting prefixed environment variables to nested settings."""
+        overrides = env_overrides([("CREATE_SPARC_PY_AI_SETTINGS__MAX_TOKENS", "500"), ("CREATE_SPARC_PY_", "x")])
+        self.assertEqual({"ai_settings": {"max_tokens": 500}}, overrides)
+
+    def test_merge_layers_provenance(self):
+        """Test that each leaf records the layer that set it last."""
+        merged, provenance = merge_layers(
+            [
+                ("default", {"ai_settings": {"model": "gpt-4", "temperature": 0.7}, "hooks": {"a": 1}}),
+                ("project", {"ai_settings": {"model": "local"}, "hooks": None}),
+                ("cli", {"ai_settings": {"temperature": 0.1}}),
+            ]
+        )
+        self.assertEqual({"model": "local", "temperature": 0.1}, merged["ai_settings"])
+        self.assertEqual(
+            {"ai_settings.model": "project", "ai_settings.temperature": "cli", "hooks": "project"}, provenance
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,8 +4,10 @@ import shutil
 import json
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 from create_sparc_py.core.config_manager import ConfigManager
+from create_sparc_py.core.json_document import JsonDocument
 from create_sparc_py.utils import fs_utils
 
 
@@ -180,3 +182,130 @@ class TestConfigManager(unittest.TestCase):
         # Verify that default configuration was used
         self.assertEqual("default", config_manager.get_default_template())
         self.assertIn("templates_dir", config_manager.config)
+
+    def test_find_project_config(self):
+        """Test finding the enclosing project from a nested directory."""
+        project_dir = Path(self.temp_dir) / "project"
+        nested = project_dir / "src" / "pkg"
+        fs_utils.create_dir(nested)
+        self.assertIsNone(self.config_manager.find_project_config(nested))
+
+        fs_utils.create_dir(project_dir / ".sparc")
+        lock = {"template": {"name": "sparc"}, "context": {"project_name": "demo"}}
+        fs_utils.write_file(project_dir / ".sparc" / "lock.json", json.dumps(lock))
+        fs_utils.write_file(project_dir / ".sparc" / "config.json", json.dumps({"owner": "team"}))
+        # Roots are memoized for the process lifetime, as the generator does after creating a project
+        self.config_manager.project_root_resolver.invalidate()
+
+        project_config = self.config_manager.find_project_config(nested)
+        self.assertEqual(str(project_dir.resolve()), project_config["project_root"])
+        self.assertEqual("demo", project_config["project_name"])
+        self.assertEqual("sparc", project_config["template"])
+        self.assertEqual("team", project_config["owner"])
+
+    def test_layered_config(self):
+        """Test the precedence and provenance of the configuration layers."""
+        fs_utils.write_file(
+            self.config_dir / "config.json", json.dumps({"ai_settings": {"model": "user-model"}, "extra": 1})
+        )
+        config_manager = ConfigManager(self.config_dir)
+        self.assertEqual(0.7, config_manager.get_ai_settings()["temperature"])
+        self.assertEqual("user-model", config_manager.get_ai_settings()["model"])
+
+        project_dir = Path(self.temp_dir) / "project"
+        fs_utils.create_dir(project_dir / ".sparc")
+        fs_utils.write_file(project_dir / ".sparc" / "config.json", json.dumps({"default_template": "minimal"}))
+        cwd = os.getcwd()
+        os.chdir(project_dir)
+        try:
+            with patch.dict(os.environ, {"CREATE_SPARC_PY_AI_SETTINGS__TEMPERATURE": "0.1"}):
+                config_manager.set_cli_overrides({"ai_settings": {"max_tokens": 10}})
+                self.assertEqual("minimal", config_manager.get_default_template())
+                self.assertEqual(
+                    {"model": "user-model", "temperature": 0.1, "max_tokens": 10}, config_manager.get_ai_settings()
+                )
+                provenance = config_manager.get_provenance()
+                self.assertEqual("user", provenance["ai_settings.model"])
+                self.assertEqual("env", provenance["ai_settings.temperature"])
+                self.assertEqual("cli", provenance["ai_settings.max_tokens"])
+                self.assertEqual("project", config_manager.get_source("default_template"))
+                self.assertEqual("default", config_manager.get_source("ai_provider"))
+                self.assertEqual("cli", config_manager.get_source("ai_settings"))
+        finally:
+            os.chdir(cwd)
+        self.assertEqual("default", config_manager.get_default_template())
+        self.assertEqual(0.7, config_manager.get_ai_settings()["temperature"])
+
+    def test_merged_config_is_cached(self):
+        """Test that the merged view is reused until a layer changes."""
+        first = self.config_manager._merged_config()
+        self.assertIs(first, self.config_manager._merged_config())
+
+        # Another process rewrites the user's config file
+        other = ConfigManager(self.config_dir)
+        other.set("default_template", "minimal")
+        os.utime(self.config_dir / "config.json", ns=(0, 0))
+        self.assertEqual("minimal", self.config_manager.get_default_template())
+
+    def test_transaction_writes_once(self):
+        """Test that changes inside a transaction are written once on commit."""
+        with patch.object(JsonDocument, "write", autospec=True, side_effect=JsonDocument.write) as write_file:
+            with self.config_manager.transaction():
+                self.config_manager.set("default_template", "minimal")
+                self.config_manager.merge({"ai_settings": {"model": "local"}})
+                with self.config_manager.transaction():
+                    self.config_manager.set("extra", 1)
+                self.assertEqual("local", self.config_manager.get_ai_settings()["model"])
+                write_file.assert_not_called()
+            self.assertEqual(1, write_file.call_count)
+
+        config_content = json.loads(fs_utils.read_file(self.config_dir / "config.json"))
+        self.assertEqual("minimal", config_content["default_template"])
+        self.assertEqual({"model": "local", "temperature": 0.7, "max_tokens": 2000}, config_content["ai_settings"])
+        self.assertEqual(1, config_content["extra"])
+        self.assertEqual([], list(self.config_dir.glob("*.tmp")))
+
+    def test_transaction_rolls_back(self):
+        """Test that a failing transaction discards its changes."""
+        with self.assertRaises(KeyError):
+            with self.config_manager.transaction():
+                self.config_manager.set("default_template", "minimal")
+                raise KeyError("boom")
+        self.assertEqual("default", self.config_manager.get_default_template())
+        config_content = json.loads(fs_utils.read_file(self.config_dir / "config.json"))
+        self.assertEqual("default", config_content["default_template"])
+
+    def test_concurrent_saves_are_merged(self):
+        """Test that a save keeps changes another process saved since loading."""
+        other = ConfigManager(self.config_dir)
+        other.set("default_template", "minimal")
+        other.merge({"ai_settings": {"model": "other-model"}})
+
+        # This manager still holds the configuration it loaded before those saves
+        self.config_manager.config["ai_settings"]["temperature"] = 0.1
+        self.assertTrue(self.config_manager._save_config(self.config_manager.config))
+
+        config_content = json.loads(fs_utils.read_file(self.config_dir / "config.json"))
+        self.assertEqual("minimal", config_content["default_template"])
+        self.assertEqual("other-model", config_content["ai_settings"]["model"])
+        self.assertEqual(0.1, config_content["ai_settings"]["temperature"])
+        self.assertEqual("minimal", self.config_manager.config["default_template"])
+
+    def test_warm_start_uses_snapshot(self):
+        """Test that an unchanged configuration is loaded from the snapshot without parsing."""
+        self.config_manager.set("default_template", "minimal")
+        ConfigManager(self.config_dir).get_all()  # writes the snapshot
+        self.assertTrue((self.config_dir / "config.snapshot").exists())
+
+        with patch.object(JsonDocument, "read", side_effect=AssertionError("parsed")):
+            with patch("create_sparc_py.core.config_manager.merge_layers", side_effect=AssertionError("merged")):
+                warm = ConfigManager(self.config_dir)
+                self.assertEqual("minimal", warm.get_default_template())
+                self.assertEqual("user", warm.get_source("default_template"))
+
+        # Rewriting the file changes its version, so the snapshot is not used
+        config_file = self.config_dir / "config.json"
+        config_content = json.loads(fs_utils.read_file(config_file))
+        config_content["default_template"] = "other"
+        fs_utils.write_file(config_file, json.dumps(config_content))
+        self.assertEqual("other", ConfigManager(self.config_dir).get_default_template())
@@ -0,0 +1,69 @@
+"""
+Unit tests for the config_snapshot module.
+"""
+
+import marshal
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from create_sparc_py.core.config_snapshot import MAX_ENTRIES, ConfigSnapshot
+
+
+class TestConfigSnapshot(unittest.TestCase):
+    """Test cases for the ConfigSnapshot class."""
+
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "config.snapshot"
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        """Test that values are shared between instances and only returned for their key."""
+        key = ((1, 2, 3), {"model": "gpt-4"})
+        ConfigSnapshot(self.path).put("user", "config", key, {"a": [1, 2]})
+
+        snapshot = ConfigSnapshot(self.path)
+        value = snapshot.get("user", "config", key)
+        self.assertEqual({"a": [1, 2]}, value)
+        value["a"].append(3)
+        self.assertEqual({"a": [1, 2]}, snapshot.get("user", "config", key))
+        self.assertIsNone(snapshot.get("user", "config", ((1, 2, 4), {"model": "gpt-4"})))
+        self.assertIsNone(snapshot.get("merged", "config", key))
+
+    def test_unreadable_snapshots_are_ignored(self):
+        """Test that corrupt snapshots and snapshots of another format are treated as empty."""
+        self.path.write_bytes(b"not marshal data")
+        self.assertIsNone(ConfigSnapshot(self.path).get("user", "config", 1))
+
+        self.path.write_bytes(marshal.dumps({"format": (0,), "sections": {"user": {"config": marshal.dumps((1, 2))}}}))
+        snapshot = ConfigSnapshot(self.path)
+        self.assertIsNone(snapshot.get("user", "config", 1))
+        snapshot.put("user", "config", 1, 2)
+        self.assertEqual(2, ConfigSnapshot(self.path).get("user", "config", 1))
+
+    def test_entries_are_pruned(self):
+        """Test that only the most recently stored entries are kept."""
+        snapshot = ConfigSnapshot(self.path)
+        for i in range(MAX_ENTRIES + 1):
+            snapshot.put("merged", f"/project{i}", i, i)
+        reloaded = ConfigSnapshot(self.path)
+        self.assertIsNone(reloaded.get("merged", "/project0", 0))
+        self.assertEqual(MAX_ENTRIES, reloaded.get("merged", f"/project{MAX_ENTRIES}", MAX_ENTRIES))
+
+    def test_invalidate(self):
+        """Test that invalidate removes the snapshot file."""
+        snapshot = ConfigSnapshot(self.path)
+        snapshot.put("user", "config", 1, 2)
+        snapshot.invalidate()
+        self.assertFalse(self.path.exists())
+        self.assertIsNone(snapshot.get("user", "config", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
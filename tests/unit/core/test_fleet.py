@@ -0,0 +1,88 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from create_sparc_py.core.fleet import discover_projects, refresh_fleet
+from create_sparc_py.core.generation_journal import hash_file
+from create_sparc_py.core.project_lock import read_lock, write_lock
+from create_sparc_py.core.template_manager import TemplateManager
+
+
+class TestFleet(unittest.TestCase):
+    """Test suite for fleet discovery and refresh."""
+
+    def setUp(self):
+        """Set up a template and a checkout of generated projects."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir) / "checkout"
+        templates_dir = Path(self.temp_dir) / "templates"
+        self.template_dir = templates_dir / "svc"
+        self.template_dir.mkdir(parents=True)
+        (self.template_dir / "template.json").write_text(json.dumps({"name": "svc", "version": "1.0.0"}))
+        (self.template_dir / "README.md").write_text("# {{ project_name }}\n")
+        self.manager = TemplateManager(str(templates_dir))
+        for module in ("fleet", "project_upgrade"):
+            patcher = patch(f"create_sparc_py.core.{module}.template_manager", self.manager)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up temporary directories."""
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self, rel_dir, template_name="svc"):
+        """Generate a project from the test template and lock it."""
+        project_dir = self.root / rel_dir
+        context = {"project_name": project_dir.name}
+        manifest = self.manager.apply_template("svc", str(project_dir), context)
+        plan = self.manager.plan_template("svc", context)
+        sources = {rel_path: hash_file(plan[rel_path]) for rel_path in manifest}
+        digest = self.manager.get_template_digest("svc")
+        write_lock(project_dir, template_name, "1.0.0", context, manifest, sources, digest)
+        return project_dir
+
+    def test_discover_projects(self):
+        """Test that discovery finds lockfiles without entering projects or skipped directories."""
+        first = self.generate("services/a")
+        second = self.generate("b")
+        self.generate("services/a/vendor/nested")
+        self.generate("b/.git/modules/c")
+        (self.root / "not-a-project" / "src").mkdir(parents=True)
+        self.assertEqual([second, first], discover_projects(self.root))
+
+    def test_refresh_only_stale_projects(self):
+        """Test that only projects behind their template are upgraded."""
+        for name in ("a", "b"):
+            self.generate(name)
+        self.assertEqual({"current": 2}, refresh_fleet(self.root, max_workers=1)["summary"])
+
+        (self.template_dir / "README.md").write_text("# {{ project_name }}\n\nUpdated.\n")
+        report = refresh_fleet(self.root, max_workers=1)
+        self.assertEqual({"refreshed": 2}, report["summary"])
+        self.assertEqual("# a\n\nUpdated.\n", (self.root / "a" / "README.md").read_text())
+        self.assertEqual(self.manager.get_template_digest("svc"), read_lock(self.root / "a")["template"]["sha256"])
+        self.assertEqual({"current": 2}, refresh_fleet(self.root, max_workers=1)["summary"])
+
+    def test_refresh_dry_run(self):
+        """Test that a dry run reports stale projects without changing them."""
+        self.generate("a")
+        (self.template_dir / "README.md").write_text("changed\n")
+        report = refresh_fleet(self.root, max_workers=1, dry_run=True)
+        self.assertEqual({"would_refresh": 1}, report["summary"])
+        self.assertEqual("would_refresh", report["projects"][0]["status"])
+        self.assertEqual({"updated": 1, "unchanged": 1}, report["projects"][0]["actions"])
+        self.assertEqual("# a\n", (self.root / "a" / "README.md").read_text())
+
+    def test_refresh_missing_template(self):
+        """Test that projects whose template is gone are reported as failed."""
+        self.generate("a", template_name="gone")
+        report = refresh_fleet(self.root, max_workers=1)
+        self.assertEqual({"failed": 1}, report["summary"])
+        self.assertIn("gone", report["projects"][0]["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
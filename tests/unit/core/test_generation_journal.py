@@ -0,0 +1,104 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from create_sparc_py.core.generation_journal import (
+    GenerationJournal,
+    JOURNAL_PATH,
+    context_fingerprint,
+    hash_file,
+)
+from create_sparc_py.utils import fs_utils
+
+
+class TestGenerationJournal(unittest.TestCase):
+    """Test suite for the GenerationJournal class."""
+
+    def setUp(self):
+        """Set up a temporary output directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir)
+        self.fingerprint = context_fingerprint("default", {"project_name": "demo"})
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, rel_path, content):
+        fs_utils.write_file(self.output_dir / rel_path, content)
+        return hash_file(self.output_dir / rel_path)
+
+    def test_fingerprint_is_stable(self):
+        """Test that the fingerprint depends on template and context only."""
+        self.assertEqual(self.fingerprint, context_fingerprint("default", {"project_name": "demo"}))
+        self.assertNotEqual(self.fingerprint, context_fingerprint("sparc", {"project_name": "demo"}))
+
+    def test_resume_verifies_entries(self):
+        """Test that resume keeps intact files and drops missing or modified ones."""
+        journal = GenerationJournal(self.output_dir, self.fingerprint)
+        journal.start()
+        journal.record("a.txt", self._write("a.txt", "a"))
+        journal.record("b.txt", self._write("b.txt", "b"))
+        journal.record("c.txt", self._write("c.txt", "c"))
+        journal.close()
+        # Simulate a torn write at the moment of interruption
+        with open(self.output_dir / JOURNAL_PATH, "a") as f:
+            f.write('{"path": "d.t')
+        fs_utils.write_file(self.output_dir / "b.txt", "changed")
+        fs_utils.remove_file(self.output_dir / "c.txt")
+
+        resumed = GenerationJournal(self.output_dir, self.fingerprint)
+        resumed.start(resume=True)
+        self.assertEqual(["a.txt"], list(resumed.completed))
+        resumed.finish()
+        self.assertFalse(fs_utils.exists(self.output_dir / JOURNAL_PATH))
+
+    def test_resume_ignores_malformed_records(self):
+        """Test that valid JSON lines of the wrong shape are ignored like torn lines."""
+        journal = GenerationJournal(self.output_dir, self.fingerprint)
+        journal.start()
+        journal.record("a.txt", self._write("a.txt", "a"))
+        journal.close()
+        with open(self.output_dir / JOURNAL_PATH, "a") as f:
+            f.write('{"path": "b.txt"}\n[1, 2]\n"text"\n{"path": 3, "sha256": null}\n')
+            f.write('{"path": "c.t')
+        c_hash = self._write("c.txt", "c")
+
+        resumed = GenerationJournal(self.output_dir, self.fingerprint)
+        resumed.start(resume=True)
+        self.assertEqual(["a.txt"], list(resumed.completed))
+        # Records appended after the torn line survive the next resume
+        resumed.record("c.txt", c_hash)
+        resumed.close()
+
+        again = GenerationJournal(self.output_dir, self.fingerprint)
+        again.start(resume=True)
+        self.assertEqual(["a.txt", "c.txt"], sorted(again.completed))
+
+        (self.output_dir / JOURNAL_PATH).write_text("[]\n")
+        other = GenerationJournal(self.output_dir, self.fingerprint)
+        other.start(resume=True)
+        self.assertEqual({}, other.completed)
+
+    def test_resume_with_other_fingerprint_starts_over(self):
+        """Test that a journal for a different context is discarded."""
+        journal = GenerationJournal(self.output_dir, self.fingerprint)
+        journal.start()
+        journal.record("a.txt", self._write("a.txt", "a"))
+        journal.close()
+
+        other = GenerationJournal(self.output_dir, context_fingerprint("default", {"project_name": "x"}))
+        other.start(resume=True)
+        other.record("a.txt", hash_file(self.output_dir / "a.txt"))
+        other.close()
+        self.assertEqual({}, other.completed)
+        lines = fs_utils.read_file(self.output_dir / JOURNAL_PATH).splitlines()
+        self.assertEqual(2, len(lines))
+        self.assertEqual(other.fingerprint, json.loads(lines[0])["fingerprint"])
+
+    def test_record_requires_start(self):
+        """Test that recording before start raises."""
+        with self.assertRaises(RuntimeError):
+            GenerationJournal(self.output_dir, self.fingerprint).record("a.txt", "0")
@@ -0,0 +1,73 @@
+import threading
+import time
+import unittest
+
+from create_sparc_py.core.generation_scheduler import ByteBudget, GenerationScheduler
+
+
+class TestByteBudget(unittest.TestCase):
+    """Test suite for the ByteBudget class."""
+
+    def test_reserve_blocks_until_released(self):
+        """Test that a reservation over the limit waits for a release."""
+        budget = ByteBudget(100)
+        budget.acquire(80)
+        acquired = threading.Event()
+
+        def reserve():
+            with budget.reserve(50):
+                acquired.set()
+
+        worker = threading.Thread(target=reserve)
+        worker.start()
+        time.sleep(0.05)
+        self.assertFalse(acquired.is_set())
+        self.assertEqual(1, budget.gauges()["render_waiters"])
+        budget.release(80)
+        worker.join(timeout=2)
+        self.assertTrue(acquired.is_set())
+        self.assertEqual(0, budget.gauges()["inflight_bytes"])
+        self.assertEqual(80, budget.gauges()["peak_inflight_bytes"])
+
+    def test_oversized_reservation_when_idle(self):
+        """Test that a reservation larger than the budget passes when nothing is in flight."""
+        budget = ByteBudget(10)
+        with budget.reserve(1000):
+            self.assertEqual(1000, budget.gauges()["inflight_bytes"])
+
+    def test_invalid_limit(self):
+        """Test that a non-positive budget is rejected."""
+        with self.assertRaises(ValueError):
+            ByteBudget(0)
+
+
+class TestGenerationScheduler(unittest.TestCase):
+    """Test suite for the GenerationScheduler class."""
+
+    def test_submit_and_gauges(self):
+        """Test that jobs run with the shared budget and gauges are updated."""
+        seen = []
+        running = []
+        lock = threading.Lock()
+
+        def generate(memory_budget, name):
+            with lock:
+                running.append(name)
+                seen.append((name, memory_budget))
+            time.sleep(0.01)
+            with lock:
+                running.remove(name)
+            return name != "bad"
+
+        with GenerationScheduler(generate, max_workers=2, max_inflight_bytes=1024, max_pending=2) as scheduler:
+            futures = [scheduler.submit(name=name) for name in ["a", "b", "bad", "c"]]
+            results = [f.result() for f in futures]
+            gauges = scheduler.gauges()
+
+        self.assertEqual([True, True, False, True], results)
+        self.assertTrue(all(budget is scheduler.budget for _, budget in seen))
+        self.assertEqual(0, gauges["queue_depth"])
+        self.assertEqual(0, gauges["running"])
+        self.assertEqual(4, gauges["completed"])
+        self.assertEqual(1, gauges["failed"])
+        self.assertEqual(1024, gauges["max_inflight_bytes"])
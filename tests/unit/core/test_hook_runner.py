@@ -0,0 +1,118 @@
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from create_sparc_py.core.hook_runner import HookRunner, compile_hooks
+
+
+def _python(code):
+    return [sys.executable, "-c", code]
+
+
+class TestHookRunner(unittest.TestCase):
+    """Test suite for post-processing hooks."""
+
+    def setUp(self):
+        """Set up a temporary project directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project_dir = Path(self.temp_dir)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_compile_hooks_validation(self):
+        """Test that malformed hook graphs are rejected."""
+        self.assertEqual([], compile_hooks(None, {}))
+        with self.assertRaises(ValueError):
+            compile_hooks({"name": "a"}, {})
+        with self.assertRaises(ValueError):
+            compile_hooks([{"name": "a"}], {})
+        with self.assertRaises(ValueError):
+            compile_hooks([{"name": "a", "command": "true"}, {"name": "a", "command": "true"}], {})
+        with self.assertRaises(ValueError):
+            compile_hooks([{"name": "a", "command": "true", "needs": ["missing"]}], {})
+        with self.assertRaises(ValueError):
+            compile_hooks(
+                [{"name": "a", "command": "true", "needs": "b"}, {"name": "b", "command": "true", "needs": "a"}], {}
+            )
+        hooks = compile_hooks([{"name": "a", "command": "echo 'hello world'", "when": "not skip"}], {"skip": True})
+        self.assertEqual(["echo", "hello world"], hooks[0]["command"])
+        self.assertFalse(hooks[0]["enabled"])
+
+    def test_independent_hooks_run_concurrently(self):
+        """Test that independent hooks overlap and dependents wait for them."""
+        sleep = "import time; time.sleep(0.5)"
+        hooks = compile_hooks(
+            [
+                {"name": "a", "command": _python(sleep)},
+                {"name": "b", "command": _python(sleep)},
+                {"name": "c", "command": _python("import os; print(os.getcwd())"), "needs": ["a", "b"]},
+            ],
+            {},
+        )
+        start = time.perf_counter()
+        results = HookRunner(max_workers=4).run(hooks, self.project_dir)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(["success"] * 3, [r["status"] for r in results])
+        self.assertLess(elapsed, 1.5)
+        self.assertEqual(self.project_dir.resolve(), Path(results[2]["stdout"].strip()).resolve())
+        self.assertGreater(results[0]["duration"], 0.4)
+
+    def test_failures_timeouts_and_skips(self):
+        """Test failed, timed-out, skipped and disabled hooks."""
+        hooks = compile_hooks(
+            [
+                {"name": "fail", "command": _python("import sys; sys.stderr.write('boom'); sys.exit(3)")},
+                {"name": "after-fail", "command": _python("pass"), "needs": "fail"},
+                {"name": "slow", "command": _python("import time; time.sleep(5)"), "timeout": 0.2},
+                {"name": "off", "command": _python("pass"), "when": "enabled"},
+                {"name": "missing", "command": ["definitely-not-a-real-command-xyz"], "optional": True},
+            ],
+            {},
+        )
+        results = {r["name"]: r for r in HookRunner().run(hooks, self.project_dir)}
+        self.assertEqual("failed", results["fail"]["status"])
+        self.assertEqual(3, results["fail"]["returncode"])
+        self.assertEqual("boom", results["fail"]["stderr"])
+        self.assertEqual("skipped", results["after-fail"]["status"])
+        self.assertEqual("timeout", results["slow"]["status"])
+        self.assertEqual("skipped", results["off"]["status"])
+        self.assertEqual("failed", results["missing"]["status"])
+        self.assertTrue(results["missing"]["optional"])
+
+    def test_disabled_dependency_is_passed_over(self):
+        """Test that dependents of a hook disabled by its condition still run, after its own dependencies."""
+        hooks = compile_hooks(
+            [
+                {"name": "git", "command": _python("import time; time.sleep(0.3); open('git', 'w').close()")},
+                {"name": "precommit", "command": _python("pass"), "needs": "git", "when": "use_pre_commit"},
+                {
+                    "name": "install",
+                    "command": _python("import os; print(os.path.exists('git'))"),
+                    "needs": "precommit",
+                },
+            ],
+            {"use_pre_commit": False},
+        )
+        results = {r["name"]: r for r in HookRunner().run(hooks, self.project_dir)}
+        self.assertEqual("success", results["git"]["status"])
+        self.assertEqual("skipped", results["precommit"]["status"])
+        self.assertEqual("Condition not met", results["precommit"]["stderr"])
+        self.assertEqual("success", results["install"]["status"])
+        self.assertEqual("True", results["install"]["stdout"].strip())
+
+        hooks = compile_hooks(
+            [
+                {"name": "git", "command": _python("import sys; sys.exit(1)")},
+                {"name": "precommit", "command": _python("pass"), "needs": "git", "when": "use_pre_commit"},
+                {"name": "install", "command": _python("pass"), "needs": "precommit"},
+            ],
+            {"use_pre_commit": False},
+        )
+        results = {r["name"]: r for r in HookRunner().run(hooks, self.project_dir)}
+        self.assertEqual("skipped", results["install"]["status"])
+        self.assertIn("git", results["install"]["stderr"])
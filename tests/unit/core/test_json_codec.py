@@ -0,0 +1,99 @@
+"""
+Unit tests for the json_codec module.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from create_sparc_py.core import json_codec
+
+SAMPLES = [
+    {"mcpServers": {"srv": {"command": "npx", "args": ["-y", "server"], "env": {}, "alwaysAllow": []}}},
+    {"floats": [0.1, 1.0, -0.0, 1e16, 1e-05, 0.0001, 2.5e-07, 1.2345678901234568e16, 1e300], "int": 2**70},
+    {"text": 'café   \x7f \x00 "quoted" \\', "café": None, "nested": [[], {}, [{}]]},
+    {2: "int key", 1: True},
+    [],
+    "plain",
+]
+
+
+class TestJsonCodec(unittest.TestCase):
+    """Test cases for the JSON codec."""
+
+    def setUp(self):
+        """Remember the backend in use."""
+        self.backend = json_codec.backend()
+
+    def tearDown(self):
+        """Restore the backend in use."""
+        json_codec.use_backend(self.backend)
+
+    def test_output_matches_json_module(self):
+        """Test that every backend formats documents exactly like json.dumps."""
+        for backend in json_codec.available_backends():
+            json_codec.use_backend(backend)
+            for sample in SAMPLES:
+                for indent in (None, 2):
+                    for sort_keys in (False, True):
+                        with self.subTest(backend=backend, sample=sample, indent=indent, sort_keys=sort_keys):
+                            self.assertEqual(
+                                json.dumps(sample, indent=indent, sort_keys=sort_keys),
+                                json_codec.dumps(sample, indent=indent, sort_keys=sort_keys),
+                            )
+
+    def test_decoding_matches_json_module(self):
+        """Test that every backend decodes documents exactly like json.loads."""
+        documents = [json.dumps(sample) for sample in SAMPLES]
+        documents += ['{"big": 123456789012345678901234567890, "nan": NaN}', "[1.0, 1, -0.0]"]
+        for backend in json_codec.available_backends():
+            json_codec.use_backend(backend)
+            for document in documents:
+                with self.subTest(backend=backend, document=document):
+                    expected = repr(json.loads(document))
+                    self.assertEqual(expected, repr(json_codec.loads(document)))
+                    self.assertEqual(expected, repr(json_codec.loads(document.encode("utf-8"))))
+
+    def test_dumps_line(self):
+        """Test that every backend encodes records as single lines of JSON."""
+        for backend in json_codec.available_backends():
+            json_codec.use_backend(backend)
+            for sample in SAMPLES[:3] + SAMPLES[4:]:
+                with self.subTest(backend=backend, sample=sample):
+                    line = json_codec.dumps_line(sample)
+                    self.assertTrue(line.endswith(b"\n"))
+                    self.assertNotIn(b"\n", line[:-1])
+                    self.assertEqual(sample, json.loads(line))
+            self.assertEqual(b'{"path":"caf\xc3\xa9"}\n', json_codec.dumps_line({"path": Path("café")}, default=str))
+            self.assertEqual({"2": "int key", "1": True}, json.loads(json_codec.dumps_line(SAMPLES[3])))
+            with self.assertRaises(TypeError):
+                json_codec.dumps_line({"path": Path("café")})
+
+    def test_invalid_json(self):
+        """Test that invalid documents raise json.JSONDecodeError."""
+        for backend in json_codec.available_backends():
+            json_codec.use_backend(backend)
+            with self.assertRaises(json.JSONDecodeError):
+                json_codec.loads('{"a": ')
+
+    def test_load_file(self):
+        """Test decoding a file."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = Path(temp_dir) / "data.json"
+            path.write_text(json.dumps(SAMPLES[0], indent=2), encoding="utf-8")
+            self.assertEqual(SAMPLES[0], json_codec.load_file(path))
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_unknown_backend(self):
+        """Test that selecting an unavailable backend fails."""
+        with self.assertRaises(ValueError):
+            json_codec.use_backend("simdjson")
+        self.assertIn("json", json_codec.available_backends())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import multiprocessing
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from create_sparc_py.core.json_document import JsonDocument, StaleDocumentError, lock_dir, merge_changes
+
+
+def _add_servers(path, worker, count):
+    """Add servers one save at a time, the way separate wizard runs would."""
+    for i in range(count):
+        document = JsonDocument(path)
+        config, version = document.read({"mcpServers": {}})
+        base = json.loads(json.dumps(config))
+        config.setdefault("mcpServers", {})[f"w{worker}-{i}"] = {"command": "npx"}
+        document.write(config, version, base)
+
+
+class TestJsonDocument(unittest.TestCase):
+    """Test suite for the JsonDocument class."""
+
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "project" / ".roo" / "mcp.json"
+        self.home = patch.dict("os.environ", {"HOME": str(Path(self.temp_dir) / "home")})
+        self.home.start()
+
+    def tearDown(self):
+        """Clean up temporary directories."""
+        self.home.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_read_and_write(self):
+        """Test reading a missing document, writing it and reading it back."""
+        document = JsonDocument(self.path)
+        self.assertEqual(({}, None), document.read({}))
+        data, version = document.write({"mcpServers": {}}, None)
+        self.assertEqual('{\n  "mcpServers": {}\n}', self.path.read_text())
+        self.assertEqual(({"mcpServers": {}}, version), document.read())
+        self.assertEqual(version, document.version())
+        # The lock is kept out of the project
+        self.assertEqual(["mcp.json"], [p.name for p in self.path.parent.iterdir()])
+        self.assertEqual([document.lock_path], list(lock_dir().iterdir()))
+        self.assertEqual(document.lock_path, JsonDocument(self.path.parent / ".." / ".roo" / "mcp.json").lock_path)
+
+    def test_stale_write(self):
+        """Test that a changed document is merged, or rejected without a base."""
+        document = JsonDocument(self.path)
+        base = {"mcpServers": {"a": {"command": "npx"}, "b": {"command": "uvx"}}}
+        _, version = document.write(base)
+        document.write({"mcpServers": {"a": {"command": "npx"}, "b": {"command": "uvx"}, "c": {"command": "node"}}})
+
+        with self.assertRaises(StaleDocumentError):
+            document.write({"mcpServers": {}}, version)
+        ours = {"mcpServers": {"a": {"command": "npx", "args": ["-y"]}}}
+        merged, _ = document.write(ours, version, base)
+        self.assertEqual({"a": {"command": "npx", "args": ["-y"]}, "c": {"command": "node"}}, merged["mcpServers"])
+        self.assertEqual(merged, document.read()[0])
+
+    def test_merge_changes(self):
+        """Test merging changes relative to a base into the current document."""
+        base = {"x": 1, "y": {"a": 1}, "z": 1}
+        current = {"x": 2, "y": {"a": 1, "b": 2}, "z": 1}
+        ours = {"x": 1, "y": {"a": 3}, "w": 4}
+        self.assertEqual({"x": 2, "y": {"a": 3, "b": 2}, "w": 4}, merge_changes(current, base, ours))
+        self.assertEqual(current, merge_changes(current, base, dict(base)))
+
+    def test_concurrent_writers(self):
+        """Test that writers in parallel processes do not lose each other's changes."""
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=_add_servers, args=(self.path, worker, 20)) for worker in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        servers = json.loads(self.path.read_text())["mcpServers"]
+        self.assertEqual(80, len(servers))
+
+
+if __name__ == "__main__":
+    unittest.main()
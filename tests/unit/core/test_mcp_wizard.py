@@ -113,6 +113,17 @@ def test_workflow_validate_configuration_invalid(tmp_path):
     assert any("missing required field" in e for e in result["errors"])
 
 
+def test_workflow_validate_roomodes(tmp_path):
+    workflow = MCPWizardWorkflow(project_path=tmp_path)
+    assert workflow.initialize()["success"] is True
+    # An empty .roomodes file is valid
+    assert workflow.validate_roomodes() == {"success": True, "errors": []}
+    (tmp_path / ".roomodes").write_text(json.dumps({"customModes": [{"slug": "x", "name": "X"}]}))
+    result = workflow.validate_roomodes()
+    assert result["success"] is False
+    assert "$.customModes[0]: missing required field 'roleDefinition'" in result["errors"]
+
+
 def test_workflow_backup_and_restore(tmp_path):
     # Setup: create config files
     roo_dir = tmp_path / ".roo"
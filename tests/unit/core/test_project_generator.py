@@ -6,6 +6,7 @@ import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from create_sparc_py.core.generation_journal import hash_file
 from create_sparc_py.core.project_generator import ProjectGenerator
 from create_sparc_py.utils import fs_utils
 
@@ -75,7 +76,8 @@ if __name__ == "__main__":
         # Configure mocks
         mock_config_manager.get_default_template.return_value = "default"
         mock_template_manager.list_templates.return_value = ["default", "test_template"]
-        mock_template_manager.apply_template.return_value = True
+        mock_template_manager.apply_template.return_value = {}
+        mock_template_manager.get_template_config.return_value = {}
 
         # Generate project
         project_name = "test_project"
@@ -96,7 +98,8 @@ if __name__ == "__main__":
         # Configure mocks
         mock_config_manager.get_default_template.return_value = "default"
         mock_template_manager.list_templates.return_value = ["default"]
-        mock_template_manager.apply_template.return_value = True
+        mock_template_manager.apply_template.return_value = {}
+        mock_template_manager.get_template_config.return_value = {}
 
         # Generate project without specifying template
         project_name = "test_project"
@@ -114,7 +117,8 @@ if __name__ == "__main__":
         # Configure mocks
         mock_config_manager.get_default_template.return_value = "default"
         mock_template_manager.list_templates.return_value = ["default"]
-        mock_template_manager.apply_template.return_value = True
+        mock_template_manager.apply_template.return_value = {}
+        mock_template_manager.get_template_config.return_value = {}
 
         # Generate project without specifying output directory
         project_name = "test_project"
@@ -160,6 +164,7 @@ if __name__ == "__main__":
         mock_config_manager.get_default_template.return_value = "default"
         mock_template_manager.list_templates.return_value = ["default"]
         mock_template_manager.apply_template.return_value = False
+        mock_template_manager.get_template_config.return_value = {}
 
         # Attempt to generate project
         result = self.project_generator.generate_project(project_name="test_project")
@@ -180,7 +185,8 @@ if __name__ == "__main__":
         # Configure mocks for generate_project call
         mock_config_manager.get_default_template.return_value = "default"
         mock_template_manager.list_templates.return_value = ["default"]
-        mock_template_manager.apply_template.return_value = True
+        mock_template_manager.apply_template.return_value = {}
+        mock_template_manager.get_template_config.return_value = {}
 
         # Call generate_project which should call _setup_additional_components
         result = self.project_generator.generate_project(project_name=project_name, output_dir=output_dir)
@@ -200,3 +206,198 @@ if __name__ == "__main__":
             generator.post_process(project_name, output_dir)
         except Exception as e:
             self.fail(f"post_process raised an exception: {e}")
+
+    def test_generate_projects_concurrently(self):
+        """Test batch generation through the bounded scheduler."""
+        from create_sparc_py.core.template_manager import TemplateManager
+
+        manager = TemplateManager(self.templates_dir)
+        jobs = [
+            {
+                "project_name": f"proj{i}",
+                "template_name": self.test_template_name,
+                "output_dir": self.output_dir / f"proj{i}",
+                "variables": {"author": "A", "project_description": "", "template_version": "1"},
+            }
+            for i in range(5)
+        ]
+        with patch("create_sparc_py.core.project_generator.template_manager", manager):
+            results = self.project_generator.generate_projects(jobs, max_workers=2, max_inflight_bytes=64)
+        self.assertEqual([True] * 5, results)
+        for i in range(5):
+            readme = fs_utils.read_file(self.output_dir / f"proj{i}" / "files" / "README.md")
+            self.assertIn(f"proj{i}", readme)
+
+    def test_generate_project_resume(self):
+        """Test that resume renders only files missing from an interrupted generation."""
+        from create_sparc_py.core.template_manager import TemplateManager
+        from create_sparc_py.core.generation_journal import JOURNAL_PATH
+
+        manager = TemplateManager(self.templates_dir)
+        project_dir = self.output_dir / "resumed"
+        kwargs = {
+            "project_name": "resumed",
+            "template_name": self.test_template_name,
+            "output_dir": project_dir,
+            "variables": {"author": "A", "project_description": "", "template_version": "1"},
+        }
+        calls = []
+        original = manager._write_file
+
+        def interrupt_after_first(src_file, dest_file, *args):
+            if calls:
+                raise KeyboardInterrupt
+            calls.append(dest_file)
+            return original(src_file, dest_file, *args)
+
+        with patch("create_sparc_py.core.project_generator.template_manager", manager):
+            with patch.object(manager, "_write_file", side_effect=interrupt_after_first):
+                with self.assertRaises(KeyboardInterrupt):
+                    self.project_generator.generate_project(**kwargs)
+            self.assertTrue(fs_utils.exists(project_dir / JOURNAL_PATH))
+
+            with patch.object(manager, "_write_file", wraps=original) as write_file:
+                self.assertTrue(self.project_generator.generate_project(resume=True, **kwargs))
+        written = [c.args[1] for c in write_file.call_args_list]
+        self.assertNotIn(calls[0], written)
+        self.assertTrue(fs_utils.exists(project_dir / "files" / "README.md"))
+        self.assertTrue(fs_utils.exists(project_dir / "files" / "index.py"))
+        self.assertFalse(fs_utils.exists(project_dir / JOURNAL_PATH))
+
+        # The lockfile covers files from both the interrupted and the resumed run
+        from create_sparc_py.core.project_lock import read_lock
+
+        lock = read_lock(project_dir)
+        self.assertEqual(self.test_template_name, lock["template"]["name"])
+        self.assertIn("files/README.md", lock["files"])
+        self.assertIn("files/index.py", lock["files"])
+        self.assertEqual(manager.get_template_digest(self.test_template_name), lock["template"]["sha256"])
+        plan = manager.plan_template(self.test_template_name, {"project_name": "resumed", **kwargs["variables"]})
+        for rel_path, entry in lock["files"].items():
+            self.assertEqual(hash_file(plan[rel_path]), entry["source_sha256"])
+
+    def test_generate_project_reads_template_once(self):
+        """Test that the lockfile is written from the hashes taken while rendering, without rereading the template."""
+        from create_sparc_py.core.template_manager import TemplateManager
+        from create_sparc_py.core.project_lock import load_base, read_lock
+
+        manager = TemplateManager(self.templates_dir)
+        project_dir = self.output_dir / "once"
+        with patch("create_sparc_py.core.project_generator.template_manager", manager), patch(
+            "create_sparc_py.core.project_lock.open", create=True, wraps=open
+        ) as lock_opened:
+            with patch("create_sparc_py.core.template_manager._hash_file", wraps=hash_file) as hashed:
+                self.assertTrue(
+                    self.project_generator.generate_project(
+                        project_name="once",
+                        template_name=self.test_template_name,
+                        output_dir=project_dir,
+                        variables={"author": "A", "project_description": "", "template_version": "1"},
+                    )
+                )
+        # Every file of this template is generated, so none is hashed separately
+        hashed.assert_not_called()
+        lock = read_lock(project_dir)
+        self.assertEqual(manager.get_template_digest(self.test_template_name), lock["template"]["sha256"])
+        self.assertEqual(
+            hash_file(self.test_template_dir / "files" / "README.md"),
+            lock["files"]["files/README.md"]["source_sha256"],
+        )
+        # Merge bases are stored from the rendered text, so write_lock reads no generated file back
+        self.assertIsNotNone(load_base(project_dir, lock["files"]["files/README.md"]["sha256"]))
+        self.assertEqual(
+            [], [call.args[0] for call in lock_opened.call_args_list if ".sparc" not in str(call.args[0])]
+        )
+
+    def test_post_process_runs_template_hooks(self):
+        """Test that hooks declared in template.json run in the generated project."""
+        import sys
+        from create_sparc_py.core.template_manager import TemplateManager
+
+        self.template_json["hooks"] = [
+            {"name": "marker", "command": [sys.executable, "-c", "open('hooked.txt', 'w').write('ok')"]},
+            {"name": "broken", "command": [sys.executable, "-c", "raise SystemExit(1)"], "optional": True},
+        ]
+        fs_utils.write_file(self.test_template_dir / "template.json", json.dumps(self.template_json))
+        manager = TemplateManager(self.templates_dir)
+        project_dir = self.output_dir / "hooked"
+        with patch("create_sparc_py.core.project_generator.template_manager", manager):
+            result = self.project_generator.generate_project(
+                project_name="hooked",
+                template_name=self.test_template_name,
+                output_dir=project_dir,
+                variables={"author": "A", "project_description": "", "template_version": "1"},
+            )
+        self.assertTrue(result)
+        self.assertEqual("ok", fs_utils.read_file(project_dir / "hooked.txt"))
+        statuses = [r["status"] for r in self.project_generator.last_hook_results]
+        self.assertEqual(["success", "failed"], statuses)
+
+    def test_post_process_disabled_dependency(self):
+        """Test that a hook needing a hook disabled by its condition does not fail the generation."""
+        import sys
+
+        hooks = [
+            {"name": "precommit", "command": [sys.executable, "-c", "pass"], "when": "use_pre_commit"},
+            {"name": "install", "command": [sys.executable, "-c", "pass"], "needs": "precommit"},
+        ]
+        project_dir = self.output_dir / "conditional"
+        fs_utils.create_dir(project_dir)
+        self.assertTrue(
+            self.project_generator.post_process("conditional", project_dir, {"use_pre_commit": False}, hooks=hooks)
+        )
+        statuses = [r["status"] for r in self.project_generator.last_hook_results]
+        self.assertEqual(["skipped", "success"], statuses)
+
+    def test_add_component(self):
+        """Test that a component is rendered into the package and tests directories and indexed."""
+        from create_sparc_py.core.project_index import ProjectIndex
+
+        project_dir = self.output_dir / "demo"
+        fs_utils.create_dir(project_dir / "src" / "demo")
+        project_config = {"project_root": str(project_dir), "project_name": "demo"}
+        self.assertIn("api", self.project_generator.list_component_types())
+
+        result = self.project_generator.add_component(
+            {"name": "user-accounts", "type": "api", "path": None, "project_config": project_config}
+        )
+        self.assertEqual(["src/demo/user_accounts.py", "tests/test_user_accounts.py"], result["files"])
+        test_module = fs_utils.read_file(project_dir / "tests" / "test_user_accounts.py")
+        self.assertIn("from demo.user_accounts import UserAccountsApi", test_module)
+
+        index = ProjectIndex(project_dir)
+        self.assertEqual(0, index.refresh())
+        self.assertEqual("api", index.components["user-accounts"]["type"])
+        listing = self.project_generator.list_components(project_dir)
+        self.assertEqual(["src/demo/user_accounts.py"], listing["modules"])
+
+        with self.assertRaises(ValueError):
+            self.project_generator.add_component(
+                {"name": "user-accounts", "type": "api", "path": None, "project_config": project_config}
+            )
+        with self.assertRaises(ValueError):
+            self.project_generator.add_component(
+                {"name": "x", "type": "unknown", "path": None, "project_config": project_config}
+            )
+        with self.assertRaises(FileExistsError):
+            self.project_generator.add_component(
+                {"name": "user_accounts", "type": "module", "path": None, "project_config": project_config}
+            )
+
+    def test_add_component_directory_is_relative_to_project_root(self):
+        """Test that a component's directory is resolved against the project root, not the current directory."""
+        project_dir = self.output_dir / "demo"
+        fs_utils.create_dir(project_dir / "src" / "demo" / "jobs")
+        project_config = {"project_root": str(project_dir), "project_name": "demo"}
+
+        with patch("os.getcwd", return_value=str(self.temp_dir)):
+            result = self.project_generator.add_component(
+                {"name": "nightly", "type": "module", "path": "src/demo/jobs", "project_config": project_config}
+            )
+        self.assertEqual("src/demo/jobs/nightly.py", result["files"][0])
+        self.assertTrue((project_dir / "src" / "demo" / "jobs" / "nightly.py").is_file())
+
+        with self.assertRaises(ValueError):
+            self.project_generator.add_component(
+                {"name": "stray", "type": "module", "path": "../elsewhere", "project_config": project_config}
+            )
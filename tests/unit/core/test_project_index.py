@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from create_sparc_py.core.project_index import ProjectIndex
+
+
+class TestProjectIndex(unittest.TestCase):
+    """Test suite for the ProjectIndex class."""
+
+    def setUp(self):
+        """Set up a temporary project tree."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = Path(self.temp_dir)
+        for rel_path in ["main.py", "src/pkg/core.py", "tests/test_core.py", ".venv/lib/site.py", "README.md"]:
+            path = self.root / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+
+    def tearDown(self):
+        """Clean up temporary directories."""
+        shutil.rmtree(self.temp_dir)
+
+    def make_index(self):
+        """Build, save and reload an index of the project."""
+        index = ProjectIndex(self.root)
+        index.refresh()
+        index.save()
+        reloaded = ProjectIndex(self.root)
+        self.assertTrue(reloaded.load())
+        return reloaded
+
+    def test_initial_scan(self):
+        """Test that the first refresh indexes modules and tests, skipping hidden directories."""
+        index = self.make_index()
+        self.assertEqual(["main.py", "src/pkg/core.py"], index.modules())
+        self.assertEqual(["tests/test_core.py"], index.tests())
+
+    def test_refresh_rescans_only_changed_directories(self):
+        """Test that unchanged directories are not rescanned."""
+        index = self.make_index()
+        self.assertEqual(0, index.refresh())
+        self.assertFalse(index.save())
+
+        (self.root / "src" / "pkg" / "extra.py").write_text("")
+        os.remove(self.root / "tests" / "test_core.py")
+        (self.root / "src" / "new").mkdir()
+        (self.root / "src" / "new" / "mod.py").write_text("")
+        # src/pkg, tests and src changed; src/new is scanned as a new directory
+        self.assertEqual(4, index.refresh())
+        self.assertEqual(["main.py", "src/new/mod.py", "src/pkg/core.py", "src/pkg/extra.py"], index.modules())
+        self.assertEqual([], index.tests())
+
+        shutil.rmtree(self.root / "src" / "pkg")
+        index.refresh()
+        self.assertEqual(["main.py", "src/new/mod.py"], index.modules())
+        self.assertNotIn("src/pkg", index.dirs)
+
+    def test_add_files_and_components(self):
+        """Test that recorded files and components survive a refresh without rescanning."""
+        index = self.make_index()
+        (self.root / "src" / "pkg" / "users.py").write_text("")
+        (self.root / "tests" / "test_users.py").write_text("")
+        files = ["src/pkg/users.py", "tests/test_users.py"]
+        index.add_files(files)
+        index.register_component("users", "api", files)
+        index.save()
+
+        reloaded = ProjectIndex(self.root)
+        self.assertEqual(0, reloaded.refresh())
+        self.assertEqual("api", reloaded.components["users"]["type"])
+        self.assertIn("src/pkg/users.py", reloaded.modules())
+        self.assertIn("tests/test_users.py", reloaded.tests())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from create_sparc_py.core.generation_journal import hash_file
+from create_sparc_py.core.project_lock import (
+    LOCK_PATH,
+    load_base,
+    project_status,
+    read_lock,
+    save_lock,
+    store_base,
+    write_lock,
+)
+
+
+class TestProjectLock(unittest.TestCase):
+    """Test suite for the project lockfile."""
+
+    def setUp(self):
+        """Set up a temporary generated project."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project_dir = Path(self.temp_dir)
+        (self.project_dir / "src").mkdir()
+        self.files = {"README.md": "# Demo\n", "src/main.py": "print('hi')\n"}
+        manifest = {}
+        for rel_path, content in self.files.items():
+            (self.project_dir / rel_path).write_text(content)
+            manifest[rel_path] = hash_file(self.project_dir / rel_path)
+        # Make the generated files older than the lockfile
+        for rel_path in self.files:
+            os.utime(self.project_dir / rel_path, ns=(1_000_000_000, 1_000_000_000))
+        write_lock(self.project_dir, "demo", "1.0.0", {"project_name": "demo"}, manifest)
+
+    def tearDown(self):
+        """Clean up temporary directories."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_write_and_read_lock(self):
+        """Test that the lockfile records template, context and per-file hashes."""
+        lock = read_lock(self.project_dir)
+        self.assertEqual({"name": "demo", "version": "1.0.0", "sha256": None}, lock["template"])
+        self.assertEqual({"project_name": "demo"}, lock["context"])
+        self.assertEqual(sorted(self.files), sorted(lock["files"]))
+        self.assertEqual(len(self.files["README.md"]), lock["files"]["README.md"]["size"])
+        self.assertIsNone(read_lock(self.project_dir / "src"))
+
+    def test_base_content_stored(self):
+        """Test that generated text is kept as a merge base and pruned once unreferenced."""
+        lock = read_lock(self.project_dir)
+        digest = lock["files"]["README.md"]["sha256"]
+        self.assertEqual(b"# Demo\n", load_base(self.project_dir, digest))
+        del lock["files"]["README.md"]
+        save_lock(self.project_dir, lock)
+        self.assertIsNone(load_base(self.project_dir, digest))
+
+    def test_write_lock_reads_only_unstored_text(self):
+        """Test that write_lock reads no file whose base is stored and stores no binary content."""
+        (self.project_dir / "logo.png").write_bytes(b"\0PNG" + b"x" * 20000)
+        (self.project_dir / "notes.txt").write_text("notes\n")
+        manifest = {name: hash_file(self.project_dir / name) for name in ["README.md", "logo.png", "notes.txt"]}
+        with patch("create_sparc_py.core.project_lock.open", create=True, wraps=open) as opened:
+            with patch("create_sparc_py.core.project_lock.store_base", wraps=store_base) as stored:
+                write_lock(self.project_dir, "demo", "1.0.0", {}, manifest, stored_bases={"notes.txt"})
+        opened_names = {Path(call.args[0]).name for call in opened.call_args_list}
+        # README.md's base was stored by the first write_lock, notes.txt's by the caller
+        self.assertNotIn("README.md", opened_names)
+        self.assertNotIn("notes.txt", opened_names)
+        self.assertIn("logo.png", opened_names)
+        stored.assert_not_called()
+        self.assertIsNone(load_base(self.project_dir, manifest["logo.png"]))
+
+    def test_read_lock_invalid(self):
+        """Test that a corrupt lockfile raises ValueError."""
+        (self.project_dir / LOCK_PATH).write_text("{")
+        with self.assertRaises(ValueError):
+            read_lock(self.project_dir)
+
+    def test_status_clean_uses_stat_only(self):
+        """Test that unchanged files are reported clean without being hashed."""
+        with patch("create_sparc_py.core.project_lock.hash_file") as mock_hash:
+            status = project_status(self.project_dir)
+        mock_hash.assert_not_called()
+        self.assertEqual([], status["modified"])
+        self.assertEqual(2, status["clean"])
+        self.assertEqual(0, status["hashed"])
+
+    def test_status_reports_drift(self):
+        """Test detection of modified and deleted files."""
+        (self.project_dir / "README.md").write_text("# Changed\n")
+        os.remove(self.project_dir / "src" / "main.py")
+        status = project_status(self.project_dir)
+        self.assertEqual(["README.md"], status["modified"])
+        self.assertEqual(["src/main.py"], status["deleted"])
+        self.assertEqual(0, status["clean"])
+
+    def test_status_refreshes_touched_files(self):
+        """Test that a touched but unchanged file is hashed once and then trusted by stat."""
+        os.utime(self.project_dir / "README.md", ns=(2_000_000_000, 2_000_000_000))
+        status = project_status(self.project_dir)
+        self.assertEqual(1, status["hashed"])
+        self.assertEqual([], status["modified"])
+        lock = json.loads((self.project_dir / LOCK_PATH).read_text())
+        self.assertEqual(2_000_000_000, lock["files"]["README.md"]["mtime_ns"])
+        self.assertEqual(0, project_status(self.project_dir)["hashed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from create_sparc_py.core import project_root
+from create_sparc_py.core.project_root import ProjectRootResolver, is_project_root
+
+
+class TestProjectRootResolver(unittest.TestCase):
+    """Test suite for the ProjectRootResolver class."""
+
+    def setUp(self):
+        """Set up a repository containing a project."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.repo = Path(self.temp_dir).resolve() / "repo"
+        self.project = self.repo / "services" / "api"
+        self.nested = self.project / "src" / "api" / "handlers"
+        self.nested.mkdir(parents=True)
+        (self.repo / ".git").mkdir()
+        (self.project / ".sparc").mkdir()
+        (self.project / ".sparc" / "lock.json").write_text("{}")
+
+    def tearDown(self):
+        """Clean up temporary directories."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_is_project_root(self):
+        """Test the .sparc and legacy .roomodes markers."""
+        self.assertTrue(is_project_root(self.project))
+        self.assertFalse(is_project_root(self.repo))
+        (self.repo / ".roomodes").write_text("{}")
+        self.assertTrue(is_project_root(self.repo))
+
+    def test_resolve_memoizes_each_directory(self):
+        """Test that directories walked through are answered from the memo."""
+        resolver = ProjectRootResolver()
+        self.assertEqual(self.project, resolver.resolve(self.nested))
+        with patch.object(project_root, "is_project_root") as check:
+            self.assertEqual(self.project, resolver.resolve(self.nested.parent))
+            self.assertEqual(self.project, resolver.resolve(self.nested / ".." / ".."))
+            check.assert_not_called()
+
+    def test_resolve_stops_at_repo_root(self):
+        """Test that a project above the repository root is not found."""
+        (self.repo.parent / ".sparc").mkdir()
+        (self.repo.parent / ".sparc" / "config.json").write_text("{}")
+        resolver = ProjectRootResolver()
+        self.assertIsNone(resolver.resolve(self.repo / "services"))
+        self.assertEqual(self.repo.parent, resolver.resolve(self.repo.parent))
+
+    def test_resolve_stops_at_mount_point(self):
+        """Test that the walk does not cross onto another device."""
+        real_stat = os.stat
+        mount_parent = str(self.project / "src")
+
+        def fake_stat(path, *args, **kwargs):
+            result = real_stat(path, *args, **kwargs)
+            if str(path) == mount_parent:
+                return os.stat_result((result.st_mode, result.st_ino, result.st_dev + 1) + tuple(result)[3:])
+            return result
+
+        resolver = ProjectRootResolver()
+        with patch.object(project_root.os, "stat", side_effect=fake_stat):
+            self.assertIsNone(resolver.resolve(self.nested))
+
+    def test_hint_file(self):
+        """Test that roots are remembered across resolvers and invalidated."""
+        hint_file = Path(self.temp_dir) / "hints.json"
+        self.assertEqual(self.project, ProjectRootResolver(hint_file).resolve(self.nested))
+        self.assertTrue(hint_file.is_file())
+
+        with patch.object(ProjectRootResolver, "_walk") as walk:
+            self.assertEqual(self.project, ProjectRootResolver(hint_file).resolve(self.nested))
+            walk.assert_not_called()
+
+        # A hint whose root lost its markers is ignored
+        shutil.rmtree(self.project / ".sparc")
+        resolver = ProjectRootResolver(hint_file)
+        self.assertIsNone(resolver.resolve(self.nested))
+        resolver.invalidate()
+        self.assertFalse(hint_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
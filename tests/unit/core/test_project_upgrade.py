@@ -0,0 +1,118 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from create_sparc_py.core.generation_journal import hash_file
+from create_sparc_py.core.project_lock import project_status, read_lock, write_lock
+from create_sparc_py.core.project_upgrade import upgrade_project, CONFLICT_SUFFIX
+from create_sparc_py.core.template_manager import TemplateManager
+
+BODY = "line 1\nline 2\nline 3\nline 4\nline 5\n"
+
+
+class TestProjectUpgrade(unittest.TestCase):
+    """Test suite for upgrade_project."""
+
+    def setUp(self):
+        """Set up a template and a project generated from it."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.templates_dir = Path(self.temp_dir) / "templates"
+        self.template_dir = self.templates_dir / "svc"
+        self.template_dir.mkdir(parents=True)
+        self.write_template("1.0.0", {"README.md": "# {{ project_name }}\n", "app.py": BODY, "old.txt": "old\n"})
+        self.manager = TemplateManager(str(self.templates_dir))
+        self.project_dir = Path(self.temp_dir) / "project"
+        context = {"project_name": "demo"}
+        manifest = self.manager.apply_template("svc", str(self.project_dir), context)
+        plan = self.manager.plan_template("svc", context)
+        sources = {rel_path: hash_file(plan[rel_path]) for rel_path in manifest}
+        write_lock(self.project_dir, "svc", "1.0.0", context, manifest, sources)
+        patcher = patch("create_sparc_py.core.project_upgrade.template_manager", self.manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up temporary directories."""
+        shutil.rmtree(self.temp_dir)
+
+    def write_template(self, version, files):
+        """Write template.json and template files."""
+        (self.template_dir / "template.json").write_text(json.dumps({"name": "svc", "version": version}))
+        for rel_path, content in files.items():
+            (self.template_dir / rel_path).write_text(content)
+
+    def test_nothing_to_upgrade(self):
+        """Test that an unchanged template renders nothing."""
+        with patch.object(self.manager, "render_file") as render_file:
+            result = upgrade_project(self.project_dir)
+        render_file.assert_not_called()
+        self.assertEqual(0, result["rendered"])
+        self.assertEqual({"unchanged"}, set(result["files"].values()) - {"up-to-date"})
+
+    def test_upgrade_classifies_files(self):
+        """Test fast-forward, merge, removal and addition in one upgrade."""
+        (self.project_dir / "app.py").write_text(BODY.replace("line 1", "user line 1"))
+        (self.template_dir / "old.txt").unlink()
+        self.write_template(
+            "1.1.0",
+            {"README.md": "# {{ project_name }}\n\nNew docs.\n", "app.py": BODY + "line 6\n", "new.txt": "new\n"},
+        )
+        with patch.object(self.manager, "render_file", wraps=self.manager.render_file) as render_file:
+            result = upgrade_project(self.project_dir)
+
+        # template.json is part of the template tree and its version changed
+        rendered = sorted(Path(call.args[0]).name for call in render_file.call_args_list)
+        self.assertEqual(["README.md", "app.py", "new.txt", "template.json"], rendered)
+        self.assertEqual(
+            {"README.md": "updated", "app.py": "merged", "new.txt": "added", "old.txt": "removed"},
+            {k: v for k, v in result["files"].items() if k != "template.json"},
+        )
+        self.assertEqual(("1.0.0", "1.1.0"), (result["from_version"], result["to_version"]))
+        self.assertEqual("# demo\n\nNew docs.\n", (self.project_dir / "README.md").read_text())
+        self.assertEqual(BODY.replace("line 1", "user line 1") + "line 6\n", (self.project_dir / "app.py").read_text())
+        self.assertFalse((self.project_dir / "old.txt").exists())
+
+        lock = read_lock(self.project_dir)
+        self.assertEqual("1.1.0", lock["template"]["version"])
+        status = project_status(self.project_dir)
+        self.assertEqual(["app.py"], status["modified"])
+        self.assertEqual([], status["deleted"])
+
+    def test_upgrade_conflict(self):
+        """Test that overlapping changes leave conflict markers."""
+        (self.project_dir / "app.py").write_text(BODY.replace("line 3", "mine"))
+        self.write_template("1.1.0", {"app.py": BODY.replace("line 3", "theirs")})
+        result = upgrade_project(self.project_dir)
+        self.assertEqual("conflict", result["files"]["app.py"])
+        content = (self.project_dir / "app.py").read_text()
+        self.assertIn("<<<<<<< ours\nmine\n=======\ntheirs\n>>>>>>> template\n", content)
+
+    def test_new_file_collision(self):
+        """Test that a new template file never overwrites a user's file."""
+        (self.project_dir / "new.txt").write_text("user\n")
+        self.write_template("1.1.0", {"new.txt": "template\n"})
+        result = upgrade_project(self.project_dir)
+        self.assertEqual("conflict", result["files"]["new.txt"])
+        self.assertEqual("user\n", (self.project_dir / "new.txt").read_text())
+        self.assertEqual("template\n", (self.project_dir / ("new.txt" + CONFLICT_SUFFIX)).read_text())
+
+    def test_dry_run_writes_nothing(self):
+        """Test that a dry run classifies without touching the project."""
+        self.write_template("1.1.0", {"app.py": BODY + "line 6\n"})
+        lock_before = (self.project_dir / ".sparc" / "lock.json").read_text()
+        result = upgrade_project(self.project_dir, dry_run=True)
+        self.assertEqual("updated", result["files"]["app.py"])
+        self.assertEqual(BODY, (self.project_dir / "app.py").read_text())
+        self.assertEqual(lock_before, (self.project_dir / ".sparc" / "lock.json").read_text())
+
+    def test_requires_lockfile(self):
+        """Test that projects without a lockfile are rejected."""
+        with self.assertRaises(ValueError):
+            upgrade_project(self.templates_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
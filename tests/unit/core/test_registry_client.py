@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from create_sparc_py.core.registry_client import RegistryClient
 
@@ -7,6 +9,10 @@ class DummyResponse:
         self._json = json_data
         self.status_code = status_code
 
+    @property
+    def content(self):
+        return json.dumps(self._json).encode()
+
     def json(self):
         return self._json
 
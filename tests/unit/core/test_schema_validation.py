@@ -0,0 +1,104 @@
+"""
+Unit tests for the schema_validation module.
+"""
+
+import json
+import unittest
+from pathlib import Path
+
+from create_sparc_py.core.schema_validation import compile_schema, get_validator, validate
+
+TEMPLATE_DIR = Path(__file__).resolve().parents[3] / "create_sparc_py" / "templates" / "minimal_roo"
+
+
+class TestSchemaValidation(unittest.TestCase):
+    """Test cases for the compiled schema validators."""
+
+    def test_valid_config(self):
+        """Test that a complete configuration passes."""
+        config = {"ai_settings": {"model": "gpt-4", "temperature": 0.7, "max_tokens": 2000}, "custom": 1}
+        self.assertEqual(validate("config", config), [])
+
+    def test_config_errors(self):
+        """Test that type and range errors are reported with their paths."""
+        errors = validate("config", {"ai_settings": {"temperature": -1, "max_tokens": True}, "default_template": ""})
+        self.assertEqual(
+            errors,
+            [
+                "$.ai_settings.temperature: must be at least 0",
+                "$.ai_settings.max_tokens: expected integer",
+                "$.default_template: must be at least 1 characters",
+            ],
+        )
+        self.assertEqual(validate("config", []), ["$: expected object"])
+
+    def test_mcp_errors(self):
+        """Test that MCP server errors name the server and the problem."""
+        config = {
+            "mcpServers": {
+                "ok": {"command": "npx", "args": ["server"]},
+                "remote": {"url": "https://example.com/mcp"},
+                "srvC": {"args": ["foo"]},
+                "bad id": {"url": "x"},
+                "srvD": {"command": "npx", "args": ["a"], "extra": 1},
+            }
+        }
+        errors = validate("mcp", config)
+        self.assertEqual(
+            errors,
+            [
+                "$.mcpServers.srvC: missing required field 'command'",
+                "$.mcpServers: unexpected field 'bad id'",
+                "$.mcpServers.srvD: unexpected field 'extra'",
+            ],
+        )
+        self.assertEqual(validate("mcp", {}), ["$: missing required field 'mcpServers'"])
+
+    def test_roomodes_errors(self):
+        """Test that mode group errors point at the offending group."""
+        roomodes = {
+            "customModes": [
+                {
+                    "slug": "code",
+                    "name": "Code",
+                    "roleDefinition": "Writes code",
+                    "groups": ["read", ["edit", {}], "fly", ["edit", {"fileRegex": 1}]],
+                },
+                {"slug": "bad slug", "name": "Bad"},
+            ]
+        }
+        errors = validate("roomodes", roomodes)
+        self.assertEqual(
+            errors,
+            [
+                "$.customModes[0].groups[1][1]: missing required field 'fileRegex'",
+                "$.customModes[0].groups[2]: must be one of read, edit, browser, command, mcp, database, ai, cloud",
+                "$.customModes[0].groups[3][1].fileRegex: expected string",
+                "$.customModes[1]: missing required field 'roleDefinition'",
+                "$.customModes[1]: missing required field 'groups'",
+                "$.customModes[1].slug: must match ^[a-zA-Z0-9-_]+$",
+            ],
+        )
+
+    def test_template_files_are_valid(self):
+        """Test that the files generated from the bundled template validate."""
+        mcp = json.loads((TEMPLATE_DIR / ".roo" / "mcp.json").read_text(encoding="utf-8"))
+        self.assertEqual(validate("mcp", mcp), [])
+        roomodes = (TEMPLATE_DIR / ".roomodes").read_text(encoding="utf-8")
+        self.assertEqual(validate("roomodes", json.loads(roomodes[roomodes.index("{") :])), [])
+
+    def test_validators_are_compiled_once(self):
+        """Test that built-in validators are cached."""
+        self.assertIs(get_validator("mcp"), get_validator("mcp"))
+        self.assertIn("def validate(", get_validator("mcp").source)
+        with self.assertRaises(ValueError):
+            get_validator("unknown")
+
+    def test_unsupported_keyword(self):
+        """Test that schemas using unsupported keywords are rejected."""
+        with self.assertRaises(ValueError):
+            compile_schema({"type": "string", "format": "email"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import shutil
 import json
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 from create_sparc_py.core.template_manager import TemplateManager
 from create_sparc_py.utils import fs_utils
@@ -317,3 +318,103 @@ if __name__ == "__main__":
         self.assertTrue(result)
         empty_out = fs_utils.read_file(project_dir / "empty.txt")
         self.assertEqual(empty_out, "")
+
+    def test_apply_template_with_conditional_rules(self):
+        """Test that rules in template.json skip files and whole subtrees."""
+        fs_utils.write_file(self.test_template_dir / "Dockerfile", "FROM python")
+        fs_utils.write_file(self.test_template_dir / "docker" / "compose.yml", "{{ undefined_var }}")
+        fs_utils.write_file(self.test_template_dir / "docs" / "guide.md", "Guide")
+        self.template_json["rules"] = [
+            {"when": "use_docker", "include": ["Dockerfile", "docker/**"]},
+            {"when": "not with_docs", "exclude": "docs/**"},
+        ]
+        fs_utils.write_file(self.test_template_dir / "template.json", json.dumps(self.template_json))
+        context = {"project_name": "rules", "author": "A", "project_description": "", "template_version": "1"}
+
+        project_dir = self.output_dir / "without"
+        self.template_manager.apply_template(self.test_template_name, str(project_dir), context)
+        self.assertTrue(fs_utils.exists(project_dir / "README.md"))
+        self.assertFalse(fs_utils.exists(project_dir / "Dockerfile"))
+        self.assertFalse(fs_utils.exists(project_dir / "docker"))
+        self.assertFalse(fs_utils.exists(project_dir / "docs"))
+
+        project_dir = self.output_dir / "with"
+        self.template_manager.apply_template(
+            self.test_template_name,
+            str(project_dir),
+            {**context, "with_docs": True, "use_docker": True, "undefined_var": "x"},
+        )
+        self.assertTrue(fs_utils.exists(project_dir / "Dockerfile"))
+        self.assertTrue(fs_utils.exists(project_dir / "docker" / "compose.yml"))
+        self.assertTrue(fs_utils.exists(project_dir / "docs" / "guide.md"))
+
+    def test_apply_template_renders_directory_names(self):
+        """Test that directory names are rendered and each directory is created once."""
+        package_dir = self.test_template_dir / "src" / "{{project_name}}"
+        fs_utils.write_file(package_dir / "__init__.py", "")
+        fs_utils.write_file(package_dir / "{{project_name}}_cli.py", "# {{project_name}}")
+        context = {"project_name": "pkg", "author": "A", "project_description": "", "template_version": "1"}
+        project_dir = self.output_dir / "dirs"
+        with patch("create_sparc_py.core.template_manager.os.makedirs", wraps=os.makedirs) as makedirs:
+            self.template_manager.apply_template(self.test_template_name, str(project_dir), context)
+        self.assertTrue(fs_utils.exists(project_dir / "src" / "pkg" / "__init__.py"))
+        self.assertEqual("# pkg", fs_utils.read_file(project_dir / "src" / "pkg" / "pkg_cli.py"))
+        created = [c.args[0] for c in makedirs.call_args_list]
+        self.assertEqual(len(created), len(set(created)))
+
+    def test_apply_template_path_render_error(self):
+        """Test that a filename that fails to render raises instead of being copied verbatim."""
+        fs_utils.write_file(self.test_template_dir / "{{ missing }}.txt", "")
+        context = {"project_name": "p", "author": "A", "project_description": "", "template_version": "1"}
+        with self.assertRaises(RuntimeError):
+            self.template_manager.apply_template(self.test_template_name, str(self.output_dir / "err"), context)
+
+    def test_apply_template_byte_pipeline(self):
+        """Test that binary files, line endings and file modes survive generation."""
+        binary = b"\x89PNG\r\n\x1a\n\x00\x00{{ not_a_template }}\xff\xfe"
+        (self.test_template_dir / "logo.png").write_bytes(binary)
+        latin1 = "caf\xe9 {{ project_name }}".encode("latin-1")
+        (self.test_template_dir / "legacy.txt").write_bytes(latin1)
+        (self.test_template_dir / "win.bat").write_bytes(b"@echo off\r\necho {{ project_name }}\r\n")
+        script = self.test_template_dir / "run.sh"
+        script.write_bytes(b"#!/bin/sh\necho {{ project_name }}\n")
+        os.chmod(script, 0o755)
+        context = {"project_name": "bytes", "author": "A", "project_description": "", "template_version": "1"}
+        project_dir = self.output_dir / "bytes"
+        self.template_manager.apply_template(self.test_template_name, str(project_dir), context)
+        self.assertEqual(binary, (project_dir / "logo.png").read_bytes())
+        self.assertEqual(latin1, (project_dir / "legacy.txt").read_bytes())
+        self.assertEqual(b"@echo off\r\necho bytes\r\n", (project_dir / "win.bat").read_bytes())
+        self.assertEqual(b"#!/bin/sh\necho bytes\n", (project_dir / "run.sh").read_bytes())
+        self.assertTrue(os.stat(project_dir / "run.sh").st_mode & 0o100)
+
+    def test_list_templates_refreshes_completion_cache(self):
+        """Test that listing the package's templates writes the names shell completion offers."""
+        cache = Path(self.temp_dir) / "completion" / "templates"
+        with patch("create_sparc_py.core.template_manager.template_names_cache", return_value=cache):
+            # Managers of other template directories leave the cache alone
+            self.template_manager.list_templates()
+            self.assertFalse(cache.exists())
+
+            names = TemplateManager().list_templates()
+            self.assertEqual("".join(f"{name}\n" for name in sorted(names)), cache.read_text())
+            self.assertIn("default", names)
+
+            os.utime(cache, ns=(1, 1))
+            TemplateManager().list_templates()
+            self.assertEqual(1, cache.stat().st_mtime_ns, "unchanged names are not rewritten")
+
+    def test_refresh_template_names_cache_from_threads(self):
+        """Test that threads refreshing the completion cache at once do not share temporary files."""
+        from concurrent.futures import ThreadPoolExecutor
+        from create_sparc_py.core.template_manager import refresh_template_names_cache
+
+        cache = Path(self.temp_dir) / "completion" / "templates"
+        name_lists = [[f"template-{i}"] for i in range(32)]
+        with patch("create_sparc_py.core.template_manager.template_names_cache", return_value=cache):
+            with patch("create_sparc_py.core.template_manager.logger") as mock_logger:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    list(executor.map(refresh_template_names_cache, name_lists))
+        mock_logger.debug.assert_not_called()
+        self.assertIn(cache.read_text().splitlines(), name_lists)
+        self.assertEqual(["templates"], os.listdir(cache.parent))
@@ -0,0 +1,59 @@
+import unittest
+
+from create_sparc_py.core.template_rules import (
+    compile_condition,
+    compile_rules,
+    resolve_skip_patterns,
+    is_dir_skipped,
+    is_file_skipped,
+)
+
+
+class TestTemplateRules(unittest.TestCase):
+    """Test suite for template inclusion rules."""
+
+    def test_compile_condition(self):
+        """Test condition expressions against a context."""
+        context = {"use_docker": True, "database": "sqlite", "features": {"api": False}}
+        self.assertTrue(compile_condition(None)(context))
+        self.assertTrue(compile_condition("use_docker")(context))
+        self.assertFalse(compile_condition("not use_docker")(context))
+        self.assertFalse(compile_condition("missing")(context))
+        self.assertTrue(compile_condition("not missing")(context))
+        self.assertTrue(compile_condition("database == 'sqlite'")(context))
+        self.assertTrue(compile_condition('database != "postgres"')(context))
+        self.assertFalse(compile_condition("features.api")(context))
+        with self.assertRaises(ValueError):
+            compile_condition("use_docker and database")
+        with self.assertRaises(ValueError):
+            compile_condition("not database == 'sqlite'")
+
+    def test_compile_rules_invalid(self):
+        """Test that malformed rules are rejected."""
+        with self.assertRaises(ValueError):
+            compile_rules([{"when": "x"}])
+        with self.assertRaises(ValueError):
+            compile_rules([{"include": 3}])
+        with self.assertRaises(ValueError):
+            compile_rules(["docs/**"])
+
+    def test_resolve_skip_patterns(self):
+        """Test that include and exclude rules resolve to skip patterns."""
+        rules = compile_rules(
+            [
+                {"when": "use_docker", "include": ["Dockerfile", "docker/**"]},
+                {"when": "not with_docs", "exclude": "docs/**"},
+                {"exclude": ["*.pyc"]},
+            ]
+        )
+        self.assertEqual(("Dockerfile", "docker/**", "docs/**", "*.pyc"), resolve_skip_patterns(rules, {}))
+        self.assertEqual(("*.pyc",), resolve_skip_patterns(rules, {"use_docker": True, "with_docs": True}))
+
+    def test_is_skipped(self):
+        """Test directory pruning and file matching."""
+        patterns = ("docker/**", "Dockerfile", "*.pyc")
+        self.assertTrue(is_dir_skipped("docker", patterns))
+        self.assertFalse(is_dir_skipped("src", patterns))
+        self.assertTrue(is_file_skipped("Dockerfile", patterns))
+        self.assertTrue(is_file_skipped("src/module.pyc", patterns))
+        self.assertFalse(is_file_skipped("src/module.py", patterns))
@@ -0,0 +1,45 @@
+import unittest
+
+from create_sparc_py.core.three_way_merge import merge3
+
+BASE = b"one\ntwo\nthree\nfour\nfive\n"
+
+
+class TestThreeWayMerge(unittest.TestCase):
+    """Test suite for merge3."""
+
+    def test_takes_changes_from_each_side(self):
+        """Test that non-overlapping changes from both sides are combined."""
+        ours = b"one\nTWO\nthree\nfour\nfive\n"
+        theirs = b"one\ntwo\nthree\nfour\nFIVE\nsix\n"
+        self.assertEqual((b"one\nTWO\nthree\nfour\nFIVE\nsix\n", 0), merge3(BASE, ours, theirs))
+
+    def test_identical_changes(self):
+        """Test that the same change on both sides is taken once."""
+        changed = b"one\ntwo\n3\nfour\nfive\n"
+        self.assertEqual((changed, 0), merge3(BASE, changed, changed))
+
+    def test_one_side_unchanged(self):
+        """Test that an unchanged side yields the other side's content."""
+        theirs = b"zero\none\nfive\n"
+        self.assertEqual((theirs, 0), merge3(BASE, BASE, theirs))
+        self.assertEqual((theirs, 0), merge3(BASE, theirs, BASE))
+
+    def test_conflict_markers(self):
+        """Test that overlapping changes are marked as a conflict."""
+        merged, conflicts = merge3(BASE, b"one\nmine\nthree\nfour\nfive\n", b"one\nyours\nthree\nfour\nfive\n")
+        self.assertEqual(1, conflicts)
+        self.assertEqual(
+            b"one\n<<<<<<< ours\nmine\n=======\nyours\n>>>>>>> template\nthree\nfour\nfive\n",
+            merged,
+        )
+
+    def test_missing_final_newline(self):
+        """Test that conflict markers start on their own line."""
+        merged, conflicts = merge3(b"a\nb", b"a\nc", b"a\nd")
+        self.assertEqual(1, conflicts)
+        self.assertEqual(b"a\n<<<<<<< ours\nc\n=======\nd\n>>>>>>> template\n", merged)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from create_sparc_py.core.venv_cache import VenvCache, METADATA_FILE
+
+
+class TestVenvCache(unittest.TestCase):
+    """Test suite for the VenvCache class."""
+
+    def setUp(self):
+        """Set up temporary cache and project directories."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = Path(self.temp_dir) / "cache"
+        self.cache = VenvCache(self.cache_dir, wheelhouse=None, with_pip=False)
+
+    def tearDown(self):
+        """Clean up temporary directories."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_get_builds_once(self):
+        """Test that an entry is built on a miss and reused on a hit."""
+        entry = self.cache.get(b"# no dependencies\n")
+        self.assertTrue((entry / "pyvenv.cfg").exists())
+        self.assertTrue((entry / METADATA_FILE).exists())
+        marker = entry / "marker"
+        marker.write_text("kept")
+        self.assertEqual(entry, self.cache.get(b"# no dependencies\n"))
+        self.assertTrue(marker.exists())
+        self.assertNotEqual(entry.name, self.cache.cache_key(b"# other\n"))
+
+    def test_requirements_need_wheelhouse(self):
+        """Test that installing requirements never falls back to the network."""
+        with self.assertRaises(RuntimeError):
+            self.cache.get(b"requests==2.31.0\n")
+
+    def test_clone_rewrites_embedded_paths(self):
+        """Test that clones copy files and rewrite the build location."""
+        entry = self.cache.get(b"")
+        shared = entry / "lib" / "shared.txt"
+        shared.write_text("shared")
+        dest = Path(self.temp_dir) / "project" / ".venv"
+        self.cache.clone(entry, dest)
+
+        metadata_prefix = str(self.cache._read_metadata(entry)["prefix"])
+        for name in ["pyvenv.cfg", os.path.join("bin", "activate")]:
+            if (dest / name).exists():
+                content = (dest / name).read_text()
+                self.assertNotIn(metadata_prefix, content)
+        self.assertIn(str(dest), (dest / "bin" / "activate").read_text())
+        self.assertEqual("shared", (dest / "lib" / "shared.txt").read_text())
+        self.assertNotEqual(os.stat(shared).st_ino, os.stat(dest / "lib" / "shared.txt").st_ino)
+        self.assertEqual(os.stat(shared).st_mtime_ns, os.stat(dest / "lib" / "shared.txt").st_mtime_ns)
+        self.assertTrue(os.path.islink(dest / "bin" / "python"))
+        self.assertFalse((dest / METADATA_FILE).exists())
+        with self.assertRaises(FileExistsError):
+            self.cache.clone(entry, dest)
+
+    def test_clone_writes_do_not_reach_the_cache(self):
+        """Test that writing a file in place in a clone leaves the entry and other clones unchanged."""
+        entry = self.cache.get(b"")
+        (entry / "lib" / "module.py").write_text("VALUE = 1\n")
+        first = Path(self.temp_dir) / "first" / ".venv"
+        second = Path(self.temp_dir) / "second" / ".venv"
+        self.cache.clone(entry, first)
+        self.cache.clone(entry, second)
+
+        with open(first / "lib" / "module.py", "r+") as f:
+            f.write("VALUE = 2\n")
+        self.assertEqual("VALUE = 1\n", (entry / "lib" / "module.py").read_text())
+        self.assertEqual("VALUE = 1\n", (second / "lib" / "module.py").read_text())
+
+    def test_clone_without_fast_copies(self):
+        """Test that clones fall back to plain copies when the fast copy methods are unsupported."""
+        import errno
+        from unittest.mock import patch
+
+        entry = self.cache.get(b"")
+        (entry / "lib" / "data.bin").write_bytes(bytes(range(256)) * 64)
+        dest = Path(self.temp_dir) / "project" / ".venv"
+        unsupported = OSError(errno.EOPNOTSUPP, "not supported")
+        with patch("fcntl.ioctl", side_effect=unsupported), patch("os.copy_file_range", side_effect=unsupported):
+            self.cache.clone(entry, dest)
+        self.assertEqual((entry / "lib" / "data.bin").read_bytes(), (dest / "lib" / "data.bin").read_bytes())
+
+    def test_evict_least_recently_used(self):
+        """Test that the oldest entry is evicted once the cache is over its limit."""
+        first = self.cache.get(b"# first\n")
+        os.utime(first / METADATA_FILE, (1, 1))
+        self.cache.max_bytes = 1
+        second = self.cache.get(b"# second\n")
+        self.assertFalse(first.exists())
+        self.assertTrue(second.exists())
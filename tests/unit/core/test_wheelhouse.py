@@ -0,0 +1,98 @@
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from create_sparc_py.core.wheelhouse import Wheelhouse, has_requirements, RESOLVED_DIR
+
+
+def _make_wheel(directory: Path, name: str, version: str) -> str:
+    """Write a minimal pure-Python wheel and return its file name."""
+    filename = f"{name}-{version}-py3-none-any.whl"
+    dist_info = f"{name}-{version}.dist-info"
+    with zipfile.ZipFile(directory / filename, "w") as whl:
+        whl.writestr(f"{name}.py", "")
+        whl.writestr(f"{dist_info}/METADATA", f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n")
+        whl.writestr(
+            f"{dist_info}/WHEEL", "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\nTag: py3-none-any\n"
+        )
+        whl.writestr(f"{dist_info}/RECORD", "")
+    return filename
+
+
+class TestWheelhouse(unittest.TestCase):
+    """Test suite for the Wheelhouse class."""
+
+    def setUp(self):
+        """Set up a temporary wheelhouse with one wheel."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.wheelhouse = Wheelhouse(Path(self.temp_dir) / "wheels")
+        self.wheelhouse.path.mkdir()
+        self.wheel = _make_wheel(self.wheelhouse.path, "sparcdemo", "1.0")
+
+    def tearDown(self):
+        """Clean up temporary directories."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_has_requirements(self):
+        """Test detection of requirements that name packages."""
+        self.assertFalse(has_requirements(b"# comment\n\n"))
+        self.assertTrue(has_requirements(b"# comment\nsparcdemo\n"))
+
+    def test_resolve_is_cached(self):
+        """Test that a resolution is computed once and then read from the cache."""
+        wheels = self.wheelhouse.resolve(b"sparcdemo==1.0\n", sys.executable)
+        self.assertEqual([self.wheel], wheels)
+        self.assertEqual(1, self.wheelhouse.status()["resolutions"])
+
+        with patch("create_sparc_py.core.wheelhouse.subprocess.run") as mock_run:
+            self.assertEqual([self.wheel], self.wheelhouse.resolve(b"sparcdemo==1.0\n", sys.executable))
+            mock_run.assert_not_called()
+
+    def test_resolve_missing_package(self):
+        """Test that requirements absent from the wheelhouse are an error, not a download."""
+        with self.assertRaises(RuntimeError):
+            self.wheelhouse.resolve(b"not-in-wheelhouse\n", sys.executable)
+
+    def test_install_skips_resolver(self):
+        """Test that installs pass the cached wheel files with --no-index and --no-deps."""
+        self.wheelhouse.resolve(b"sparcdemo\n", sys.executable)
+        with patch("create_sparc_py.core.wheelhouse.subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+            self.wheelhouse.install(b"sparcdemo\n", sys.executable)
+        command = mock_run.call_args[0][0]
+        self.assertEqual(1, mock_run.call_count)
+        self.assertIn("--no-index", command)
+        self.assertIn("--no-deps", command)
+        self.assertIn(str(self.wheelhouse.path / self.wheel), command)
+
+    def test_install_without_wheelhouse(self):
+        """Test that a missing wheelhouse is reported rather than falling back to the network."""
+        with self.assertRaises(RuntimeError):
+            Wheelhouse(Path(self.temp_dir) / "missing").install(b"sparcdemo\n", sys.executable)
+
+    def test_sync_clears_resolutions(self):
+        """Test that syncing runs pip wheel into the wheelhouse and drops cached resolutions."""
+        self.wheelhouse.resolve(b"sparcdemo\n", sys.executable)
+        requirements = Path(self.temp_dir) / "requirements.txt"
+        requirements.write_text("sparcdemo\n")
+
+        def fake_pip(command, **kwargs):
+            _make_wheel(self.wheelhouse.path, "sparcextra", "2.0")
+            return subprocess.CompletedProcess(command, 0, "", "")
+
+        with patch("create_sparc_py.core.wheelhouse.subprocess.run", side_effect=fake_pip) as mock_run:
+            added = self.wheelhouse.sync([requirements])
+        command = mock_run.call_args[0][0]
+        self.assertEqual(["-m", "pip", "wheel"], command[1:4])
+        self.assertIn(str(self.wheelhouse.path), command)
+        self.assertEqual(["sparcextra-2.0-py3-none-any.whl"], added)
+        self.assertFalse((self.wheelhouse.path / RESOLVED_DIR).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
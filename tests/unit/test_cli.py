@@ -273,3 +273,355 @@ def test_wizard_command_functional(tmp_path, capsys):
         config = {}
     print("DEBUG CONFIG AFTER WIZARD:", config)
     assert config == {} or config == {"mcpServers": {}}
+
+
+def test_parser_is_built_once():
+    """
+    Test that the CLI and the help command share one parser.
+    """
+    from create_sparc_py.cli.parser_factory import create_parser
+
+    assert create_parser() is create_parser()
+
+
+def test_building_parser_imports_no_command_module():
+    """
+    Test that building the parser imports no command module and not rich.
+    """
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from create_sparc_py.cli import create_parser\n"
+        "create_parser().parse_args(['init', 'demo'])\n"
+        "loaded = [m for m in sys.modules if m.startswith('rich') or m.endswith('_command')]\n"
+        "print(','.join(loaded))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+def test_command_exports_survive_submodule_import():
+    """
+    Test that importing a command module keeps its handler exported under the module's name.
+    """
+    import importlib
+
+    from create_sparc_py.cli import commands
+
+    module = importlib.import_module("create_sparc_py.cli.commands.status_command")
+    assert commands.status_command is module.run
+
+
+def _help_stream():
+    import io
+
+    return io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+
+
+def _stream_text(stream):
+    stream.flush()
+    return stream.buffer.getvalue().decode("utf-8")
+
+
+def test_help_page_is_cached(tmp_path, monkeypatch):
+    """
+    Test that a rendered help page is printed from the cache until the page changes.
+    """
+    import os
+
+    from create_sparc_py.cli.commands import help_markdown
+
+    help_dir = tmp_path / "help"
+    help_dir.mkdir()
+    page = help_dir / "demo.md"
+    page.write_text("# Demo\n\nFirst version\n")
+    monkeypatch.setattr(help_markdown, "HELP_DIR", help_dir)
+    monkeypatch.setenv("COLUMNS", "60")
+    monkeypatch.delenv("FORCE_COLOR", raising=False)
+    monkeypatch.delenv("TTY_COMPATIBLE", raising=False)
+    cache_dir = tmp_path / "cache"
+
+    first = _help_stream()
+    assert help_markdown.print_help_markdown("demo", first, cache_dir)
+    assert "First version" in _stream_text(first)
+    assert [p.name for p in cache_dir.iterdir()] == ["demo.60.none.ansi"]
+
+    with patch.object(help_markdown, "render_markdown", side_effect=AssertionError("rendered")):
+        cached = _help_stream()
+        assert help_markdown.print_help_markdown("demo", cached, cache_dir)
+    assert _stream_text(cached) == _stream_text(first)
+
+    page.write_text("# Demo\n\nSecond version\n")
+    os.utime(page, ns=(1, 1))
+    changed = _help_stream()
+    assert help_markdown.print_help_markdown("demo", changed, cache_dir)
+    assert "Second version" in _stream_text(changed)
+
+
+def test_help_page_missing():
+    """
+    Test that commands without a help page, or with a path as their name, print nothing.
+    """
+    from create_sparc_py.cli.commands import help_markdown
+
+    assert help_markdown.print_help_markdown("unknown", _help_stream()) is False
+    assert help_markdown.help_file("../help/init") is None
+    assert help_markdown.help_file("init") is not None
+
+
+def test_help_search(tmp_path):
+    """
+    Test that help search matches every query term by prefix and reuses its index until a page changes.
+    """
+    from create_sparc_py.cli.commands import help_search
+
+    help_dir = tmp_path / "help"
+    help_dir.mkdir()
+    (help_dir / "deploy.md").write_text("# Deploy\n\nShip a project.\n\nUse --dry-run to preview servers.\n")
+    (help_dir / "server.md").write_text("# Server\n\nRun a development server.\n")
+    cache_dir = tmp_path / "cache"
+
+    results = help_search.search_help("server", help_dir, cache_dir)
+    assert [result["command"] for result in results] == ["server", "deploy"]
+    assert results[0]["summary"] == "Run a development server."
+    assert [r["command"] for r in help_search.search_help("dry-run serv", help_dir, cache_dir)] == ["deploy"]
+    assert help_search.search_help("run preview", help_dir, cache_dir)[0]["command"] == "deploy"
+    assert help_search.search_help("missing", help_dir, cache_dir) == []
+    assert (cache_dir / help_search.INDEX_NAME).is_file()
+
+    with patch.object(help_search, "build_index", side_effect=AssertionError("rebuilt")):
+        assert help_search.search_help("ship", help_dir, cache_dir)[0]["command"] == "deploy"
+
+    (help_dir / "logs.md").write_text("# Logs\n\nShip logs to a server.\n")
+    assert [r["command"] for r in help_search.search_help("ship", help_dir, cache_dir)] == ["deploy", "logs"]
+
+
+def test_help_command_search(capsys):
+    """
+    Test that 'help --search' lists the matching commands.
+    """
+    from create_sparc_py.cli.commands import help_command
+
+    class Args:
+        command = None
+        search = ["template", "version"]
+
+    assert help_command(Args()) == 0
+    assert "upgrade" in capsys.readouterr().out
+
+    Args.search = ["no-such-term-anywhere"]
+    assert help_command(Args()) == 1
+    assert "No help pages match" in capsys.readouterr().out
+
+
+@pytest.mark.skipif(not __import__("shutil").which("bash"), reason="bash is not installed")
+def test_bash_completion(tmp_path):
+    """
+    Test that the bash completion script completes commands, options and cached template names.
+    """
+    import subprocess
+
+    from create_sparc_py.cli.completion import completion_script
+
+    names = tmp_path / "templates"
+    names.write_text("default\nsparc\n")
+    (tmp_path / "project").mkdir()
+    script = tmp_path / "completion.bash"
+    script.write_text(completion_script("bash", names))
+    driver = (
+        f"source {script}\n"
+        'complete_words() { COMP_WORDS=("$@"); COMP_CWORD=$((${#COMP_WORDS[@]} - 1)); COMPREPLY=();'
+        ' _create_sparc_py; echo "${COMPREPLY[*]}"; }\n'
+        "complete_words create-sparc-py sta\n"
+        "complete_words create-sparc-py -c key=value init demo --template ''\n"
+        "complete_words create-sparc-py init --res\n"
+        "complete_words create-sparc-py completion f\n"
+        "complete_words create-sparc-py status pro\n"
+    )
+    result = subprocess.run(["bash", "-c", driver], cwd=tmp_path, capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines() == ["status", "default sparc", "--resume", "fish", "project"]
+
+
+def test_completion_covers_alias(tmp_path):
+    """
+    Test that every completion script registers both create-sparc-py and its create-sparc alias.
+    """
+    import shutil
+    import subprocess
+
+    from create_sparc_py.cli.completion import completion_script
+
+    names = tmp_path / "templates"
+    assert "complete -F _create_sparc_py create-sparc-py create-sparc\n" in completion_script("bash", names)
+    zsh = completion_script("zsh", names)
+    assert zsh.startswith("#compdef create-sparc-py create-sparc\n")
+    assert "compdef _create_sparc_py create-sparc-py create-sparc\n" in zsh
+    fish = completion_script("fish", names).splitlines()
+    assert all(" -c create-sparc-py -c create-sparc " in line for line in fish if line.startswith("complete "))
+    if shutil.which("bash"):
+        script = tmp_path / "completion.bash"
+        script.write_text(completion_script("bash", names))
+        result = subprocess.run(
+            ["bash", "-c", f"source {script}; complete -p create-sparc"], capture_output=True, text=True, check=True
+        )
+        assert result.stdout == "complete -F _create_sparc_py create-sparc\n"
+
+
+def test_completion_command(capsys):
+    """
+    Test that the completion command prints a script naming every command, and rejects unknown shells.
+    """
+    from create_sparc_py.cli.command_table import COMMANDS
+    from create_sparc_py.cli.commands import completion_command
+    from create_sparc_py.cli.completion import completion_script
+
+    class Args:
+        shell = "zsh"
+
+    with patch("create_sparc_py.core.template_manager.refresh_template_names_cache"):
+        assert completion_command(Args()) == 0
+    script = capsys.readouterr().out
+    assert script.startswith("#compdef create-sparc-py")
+    for command in COMMANDS:
+        assert f"'{command.name}:" in script
+    assert "complete -c create-sparc-py" in completion_script("fish", "/tmp/templates")
+    with pytest.raises(ValueError):
+        completion_script("tcsh", "/tmp/templates")
+
+
+def test_parse_script():
+    """
+    Test that scripts skip comments and blank lines, drop the program name and reject nested scripts.
+    """
+    from create_sparc_py.cli.commands.run_script_command import parse_script
+
+    script = [
+        "# provision",
+        "",
+        "create-sparc-py init 'my project' -t sparc  # first",
+        "create-sparc -c a=b status",
+        "upgrade --dry-run",
+    ]
+    assert parse_script(script) == [
+        (3, ["init", "my project", "-t", "sparc"]),
+        (4, ["-c", "a=b", "status"]),
+        (5, ["upgrade", "--dry-run"]),
+    ]
+    assert parse_script(["init run-script"]) == [(1, ["init", "run-script"])]
+    with pytest.raises(ValueError, match="Line 2"):
+        parse_script(["status", "-c a=b run-script other.txt"])
+    with pytest.raises(ValueError, match="Line 1"):
+        parse_script(["--output json run-script self.txt"])
+    with pytest.raises(ValueError, match="Line 1"):
+        parse_script(["--debug --output=json -c a=b run-script self.txt"])
+    with pytest.raises(ValueError, match="Line 1"):
+        parse_script(["init 'unterminated"])
+
+
+def test_run_script_dispatches_each_command(tmp_path, capsys):
+    """
+    Test that run-script runs each command through the CLI and reports its exit code.
+    """
+    from create_sparc_py.cli.commands import run_script_command
+
+    script = tmp_path / "provision.txt"
+    script.write_text("status one\nstatus two\nupgrade\nstatus three\n")
+
+    class Args:
+        file = str(script)
+        keep_going = False
+
+    with patch("create_sparc_py.cli.commands.status_command", return_value=0) as mock_status, patch(
+        "create_sparc_py.cli.commands.upgrade_command", return_value=3
+    ) as mock_upgrade:
+        assert run_script_command(Args()) == 3
+        assert [call.args[0].paths for call in mock_status.call_args_list] == [["one"], ["two"]]
+        assert mock_upgrade.call_count == 1
+        err = capsys.readouterr().err
+        assert "[line 3] exit 3" in err
+        assert "3 commands run, 1 failed, 1 skipped" in err
+
+        Args.keep_going = True
+        assert run_script_command(Args()) == 3
+        assert mock_status.call_count == 5
+        assert "4 commands run, 1 failed, 0 skipped" in capsys.readouterr().err
+
+
+def test_run_resets_config_overrides():
+    """
+    Test that configuration overrides given to one command do not apply to the next.
+    """
+    from create_sparc_py.core.config_manager import config_manager
+
+    seen = []
+    with patch(
+        "create_sparc_py.cli.commands.status_command",
+        side_effect=lambda args: seen.append(config_manager.get("default_template")) or 0,
+    ):
+        run(["create-sparc-py", "-c", "default_template=override", "status"])
+        run(["create-sparc-py", "status"])
+    assert seen[0] == "override"
+    assert seen[1] != "override"
+
+
+def test_run_output_json(capsys):
+    """
+    Test that '--output json' writes results and log messages as NDJSON records.
+    """
+    import json
+
+    from create_sparc_py.utils import output
+
+    assert run(["create-sparc-py", "--output", "json", "help", "--search", "template"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records
+    assert {record["type"] for record in records} == {"help_match"}
+    assert "upgrade" in [record["command"] for record in records]
+    assert output.get_format() == "text"
+
+    assert run(["create-sparc-py", "--output", "json", "config", "get", "version"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["type"] for record in records] == ["setting"]
+    assert records[0]["key"] == "version"
+
+
+def test_run_output_json_loads_no_terminal_libraries(tmp_path):
+    """
+    Test that '--output json' never imports colorama or rich, which only text output uses.
+    """
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from create_sparc_py.cli import run\n"
+        "code = run(['create-sparc-py', '--output', sys.argv[1], 'status', sys.argv[2]])\n"
+        "print(sorted({name.split('.')[0] for name in sys.modules} & {'colorama', 'rich'}), file=sys.stderr)\n"
+    )
+    env = {**os.environ, "HOME": str(tmp_path)}
+    # The directory is not a project, so both runs log an error
+    for output_format, loaded in (("json", "[]"), ("text", "['colorama']")):
+        result = subprocess.run(
+            [sys.executable, "-c", code, output_format, str(tmp_path)], env=env, capture_output=True, text=True
+        )
+        assert "no lockfile" in result.stdout
+        assert result.stderr.splitlines()[-1] == loaded
+
+
+def test_add_command_project_option(tmp_path, monkeypatch):
+    """
+    Test that 'add --project' finds the project and '--directory' is taken relative to its root.
+    """
+    project_dir = tmp_path / "shop"
+    (project_dir / ".sparc").mkdir(parents=True)
+    (project_dir / ".sparc" / "config.json").write_text('{"project_name": "shop"}')
+    (project_dir / "src" / "shop" / "reports").mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+
+    argv = ["create-sparc-py", "add", "module", "daily", "-p", str(project_dir), "-d", "src/shop/reports"]
+    assert run(argv) == 0
+    assert (project_dir / "src" / "shop" / "reports" / "daily.py").is_file()
+    assert not (tmp_path / "src").exists()
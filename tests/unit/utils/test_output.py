@@ -0,0 +1,88 @@
+import json
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from create_sparc_py.utils import Logger, Output, output
+
+
+class TestOutput(unittest.TestCase):
+    """Test suite for the Output class."""
+
+    def setUp(self):
+        """Set up tests by creating a fresh Output instance."""
+        self.output = Output()
+
+    def records(self, stdout):
+        """Parse the NDJSON records written to a stream."""
+        return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_text_format_emits_nothing(self, mock_stdout):
+        """Test that emit() writes nothing and returns False in the text format."""
+        self.assertEqual(self.output.get_format(), "text")
+        self.assertFalse(self.output.emit("status", clean=1))
+        self.output.flush()
+        self.assertEqual(mock_stdout.getvalue(), "")
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_json_format_writes_records(self, mock_stdout):
+        """Test that records are written as one JSON object per line."""
+        self.output.set_format("json")
+        self.assertTrue(self.output.is_json())
+        self.assertTrue(self.output.emit("status", path=Path("project"), tags={"b", "a"}))
+        self.assertTrue(self.output.emit("setting", key="version", value="0.1.0"))
+        self.output.flush()
+        self.assertEqual(
+            self.records(mock_stdout),
+            [
+                {"type": "status", "path": "project", "tags": ["a", "b"]},
+                {"type": "setting", "key": "version", "value": "0.1.0"},
+            ],
+        )
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_records_are_buffered(self, mock_stdout):
+        """Test that records are held until flushed or the buffer fills."""
+        self.output.set_format("json")
+        self.output.emit("status", clean=1)
+        self.assertEqual(mock_stdout.getvalue(), "")
+        self.output.flush()
+        self.assertEqual(len(self.records(mock_stdout)), 1)
+
+        self.output.emit("blob", data="x" * Output.BUFFER_SIZE)
+        self.assertEqual(len(self.records(mock_stdout)), 2)
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_changing_format_flushes(self, mock_stdout):
+        """Test that switching back to text writes the pending records first."""
+        self.output.set_format("json")
+        self.output.emit("status", clean=1)
+        self.output.set_format("text")
+        self.assertEqual(self.records(mock_stdout), [{"type": "status", "clean": 1}])
+
+    def test_invalid_format(self):
+        """Test that an unsupported format raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.output.set_format("yaml")
+        self.assertEqual(self.output.get_format(), "text")
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_logger_emits_log_records(self, mock_stdout):
+        """Test that log messages become log records in the json format."""
+        logger = Logger()
+        output.set_format("json")
+        try:
+            logger.warning("Test warning message")
+            logger.debug("Hidden debug message")
+        finally:
+            output.set_format("text")
+        self.assertEqual(
+            self.records(mock_stdout),
+            [{"type": "log", "level": "warning", "message": "Test warning message"}],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()